@@ -0,0 +1,92 @@
+"""
+Measures the cost of dispatching an operator on quaternions. The
+time of each operator is compared with calling its handler directly
+and with the previous dispatch, which imported the mediator and
+looked the handler up on every call. Run from the root of the
+repository with: python -m benchmarks.DispatchBenchmark
+"""
+
+from math import nan
+from timeit import repeat
+from calc.Quaternion import Quaternion
+from calc.Dispatch import addition, multiplication, equality
+
+
+def _legacyAddition(left, right):
+    """
+    Dispatches the addition the way the operators did before
+    the dispatch tables
+    """
+
+    from calc._AdditionMediator import addDict
+
+    operation = addDict.get((type(left), type(right)))
+
+    return operation(left, right) if operation is not None else nan
+
+
+def _legacyMultiplication(left, right):
+    """
+    Dispatches the multiplication the way the operators did before
+    the dispatch tables
+    """
+
+    from calc._MultiplicationMediator import multDict
+
+    operation = multDict.get((type(left), type(right)))
+
+    return operation(left, right) if operation is not None else nan
+
+
+def _legacyEquality(left, right):
+    """
+    Dispatches the equality the way the operators did before
+    the dispatch tables
+    """
+
+    from calc._EqualityMediator import eqDict
+
+    operation = eqDict.get((type(left), type(right)))
+
+    return operation(left, right) if operation is not None else False
+
+
+def _nanoseconds(statement: str, number: int=200000) -> float:
+    """
+    Returns the fastest observed time of the given statement
+
+    :param statement: The statement to be timed
+    :param number: The number of runs per timing
+    :return: The number of nanoseconds taken per run
+    """
+
+    return 1e9 * min(repeat(statement, number=number, repeat=5, globals=globals())) / number
+
+
+left = Quaternion(1.5, -2.5, 3.5, -4.5)
+right = Quaternion(0.5, 1.5, -2.5, 3.5)
+scalar = 2.0
+
+
+def main() -> None:
+    print("{:<16} {:>10} {:>10} {:>10} {:>16} {:>16}".format("operation", "operator", "legacy", "handler",
+                                                               "overhead (now)", "overhead (legacy)"))
+
+    for (name, leftName, symbol, rightName, table, legacy) in (
+            ("add", "left", "+", "right", addition, "_legacyAddition"),
+            ("multiply", "left", "*", "right", multiplication, "_legacyMultiplication"),
+            ("multiply float", "left", "*", "scalar", multiplication, "_legacyMultiplication"),
+            ("equals", "left", "==", "right", equality, "_legacyEquality")):
+        globals()["handler"] = table.resolve(type(globals()[leftName]), type(globals()[rightName]))
+        arguments = "(" + leftName + ", " + rightName + ")"
+
+        operatorTime = _nanoseconds(leftName + " " + symbol + " " + rightName)
+        legacyTime = _nanoseconds(legacy + arguments)
+        handlerTime = _nanoseconds("handler" + arguments)
+
+        print("{:<16} {:>8.0f}ns {:>8.0f}ns {:>8.0f}ns {:>14.0f}ns {:>14.0f}ns".format(
+            name, operatorTime, legacyTime, handlerTime, operatorTime - handlerTime, legacyTime - handlerTime))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measures the time and peak memory of evaluating a * 2 + b - c / 3
+on large matrices and lists of numbers, eagerly and as a lazily
+evaluated expression. Run from the root of the repository with:
+python -m benchmarks.ExpressionBenchmark [size]
+"""
+
+import sys
+import tracemalloc
+from random import random
+from time import perf_counter
+import numpy
+from calc.Matrix import Matrix
+from calc.NumberList import NumberList
+
+
+def _eager(a, b, c):
+    """
+    Evaluates the expression with the operators, creating a
+    temporary entity for each operation
+    """
+
+    return a * 2 + b - c / 3
+
+
+def _lazy(a, b, c):
+    """
+    Evaluates the expression in a single pass over the elements
+    """
+
+    return (a.lazy() * 2 + b - c / 3).evaluate()
+
+
+def _measure(function, *operands) -> tuple:
+    """
+    Evaluates the expression with the given function
+
+    :param function: The function evaluating the expression
+    :param operands: The operands of the expression
+    :return: The number of seconds taken and the peak number of
+        bytes allocated
+    """
+
+    # Memory is traced in a separate run because tracing slows
+    # down every allocation
+    start = perf_counter()
+    function(*operands)
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    function(*operands)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (elapsed, peak)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cases = (("array matrix", [Matrix.createMatrixFromArray(numpy.random.rand(size, size)) for _ in range(3)]),
+             ("list matrix", [Matrix([[random() for _ in range(size)] for _ in range(size)]) for _ in range(3)]),
+             ("number list", [NumberList([random() for _ in range(size * size)]) for _ in range(3)]))
+
+    for (name, operands) in cases:
+        for (mode, function) in (("eager", _eager), ("lazy", _lazy)):
+            (elapsed, peak) = _measure(function, *operands)
+            print("{:<13} {:<6} {:>8.3f}s {:>10,.1f} MB peak".format(name, mode, elapsed, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measures the time of multiplying list-backed matrices serially
+and across worker processes.
+Run from the root of the repository with:
+python -m benchmarks.ParallelBenchmark [size] [workers]
+"""
+
+import sys
+from random import random
+from time import perf_counter
+from calc.Matrix import Matrix
+from calc.ParallelMultiplier import ParallelMultiplier
+
+
+def _randomMatrix(size: int) -> Matrix:
+    """
+    Creates a list-backed square matrix of random floats
+
+    :param size: The number of rows and columns of the matrix
+    :return: The random matrix
+    """
+
+    return Matrix([[random() for _ in range(size)] for _ in range(size)])
+
+
+def _seconds(function) -> float:
+    """
+    Returns the time taken by the given function
+
+    :param function: The function to be timed
+    :return: The number of seconds taken
+    """
+
+    start = perf_counter()
+    function()
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    workerCount = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    (left, right) = (_randomMatrix(size), _randomMatrix(size))
+
+    print("{}x{} matrices".format(size, size))
+    print("serial   {:>9.4f}s".format(_seconds(lambda: left * right)))
+
+    with ParallelMultiplier(workerCount, threshold=0) as multiplier:
+        # The first product also starts the worker processes
+        print("startup  {:>9.4f}s".format(_seconds(lambda: left * right)))
+        print("parallel {:>9.4f}s with {} workers".format(_seconds(lambda: left * right), multiplier.workerCount))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Measures the throughput, in MB/s, and the peak memory of reading
+a large Matrix literal from a file with parseMatrix and with the
+streaming parseMatrixStream. Run from the root of the repository
+with: python -m benchmarks.ParsingBenchmark [rows] [columns]
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+from calc.ValueParsing import parseMatrix, parseMatrixStream
+
+
+def _writeMatrix(path: str, rowLength: int, columnLength: int) -> None:
+    """
+    Writes a Matrix literal of floats to the given file, one
+    row at a time
+
+    :param path: The path of the file to be written
+    :param rowLength: The number of rows of the Matrix
+    :param columnLength: The number of columns of the Matrix
+    :return: None
+    """
+
+    with open(path, "w") as file:
+        file.write("[")
+
+        for rowIndex in range(rowLength):
+            if rowIndex > 0:
+                file.write(",\n ")
+
+            file.write("[" + ", ".join(str(rowIndex + columnIndex / 8) for columnIndex in range(columnLength)) + "]")
+
+        file.write("]")
+
+
+def _readWholeFile(path: str):
+    """
+    Reads the Matrix in the given file by loading the whole
+    file into a string
+
+    :param path: The path of the file
+    :return: The Matrix in the file
+    """
+
+    with open(path) as file:
+        return parseMatrix(file.read())
+
+
+def _readStreamed(path: str):
+    """
+    Reads the Matrix in the given file incrementally
+
+    :param path: The path of the file
+    :return: The Matrix in the file
+    """
+
+    with open(path) as file:
+        return parseMatrixStream(file)
+
+
+def _measure(reader, path: str) -> tuple:
+    """
+    Reads the Matrix in the given file with the given reader
+
+    :param reader: The function reading the file
+    :param path: The path of the file
+    :return: The number of seconds taken and the peak number of
+        bytes allocated
+    """
+
+    # Memory is traced in a separate run because tracing slows
+    # down every allocation
+    start = perf_counter()
+    reader(path)
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    reader(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (elapsed, peak)
+
+
+def main() -> None:
+    rowLength = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    columnLength = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    (handle, path) = tempfile.mkstemp(suffix=".txt")
+    os.close(handle)
+
+    try:
+        _writeMatrix(path, rowLength, columnLength)
+        megabytes = os.path.getsize(path) / 1e6
+        print("input:             {:>10,.1f} MB".format(megabytes))
+
+        for (name, reader) in (("parseMatrix", _readWholeFile), ("parseMatrixStream", _readStreamed)):
+            (elapsed, peak) = _measure(reader, path)
+            print("{:<18} {:>10,.1f} MB/s {:>10,.1f} MB peak".format(name + ":", megabytes / elapsed, peak / 1e6))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measures the throughput of constructing quaternions, multiplying
+them together and computing their absolute values, along with the
+memory used by each quaternion. Run from the root of the repository
+with: python -m benchmarks.QuaternionBenchmark
+"""
+
+import sys
+import tracemalloc
+from timeit import repeat
+from calc.Quaternion import Quaternion
+
+
+def _throughput(statement, setup: str, number: int) -> float:
+    """
+    Runs the given statement repeatedly and returns the best
+    observed number of runs per second
+
+    :param statement: The statement to be timed
+    :param setup: Code that is run once before each timing
+    :param number: The number of runs per timing
+    :return: The number of runs per second of the fastest timing
+    """
+
+    return number / min(repeat(statement, setup, number=number, repeat=5, globals=globals()))
+
+
+def _bytesPerQuaternion(count: int) -> float:
+    """
+    Measures the memory allocated per quaternion when many
+    quaternions are created
+
+    :param count: The number of quaternions to create
+    :return: The average number of bytes allocated per quaternion
+    """
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    quaternions = [Quaternion(1.5, 2.5, 3.5, float(index)) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before - sys.getsizeof(quaternions)) / count
+
+
+def main() -> None:
+    setup = "left = Quaternion(1.5, -2.5, 3.5, -4.5); right = Quaternion(0.5, 1.5, -2.5, 3.5)"
+
+    print("construction: {:>12,.0f} ops/s".format(_throughput("Quaternion(1.5, -2.5, 3.5, -4.5)", setup, 200000)))
+    print("multiply:     {:>12,.0f} ops/s".format(_throughput("left * right", setup, 200000)))
+    print("abs (fresh):  {:>12,.0f} ops/s".format(_throughput("abs(Quaternion(1.5, -2.5, 3.5, -4.5))", setup, 200000)))
+    print("abs (reused): {:>12,.0f} ops/s".format(_throughput("abs(left)", setup, 200000)))
+    print("hash:         {:>12,.0f} ops/s".format(_throughput("hash(left)", setup, 200000)))
+    print("memory:       {:>12,.1f} bytes/quaternion".format(_bytesPerQuaternion(100000)))
+
+
+if __name__ == "__main__":
+    main()
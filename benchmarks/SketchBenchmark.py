@@ -0,0 +1,54 @@
+"""
+Compares the quantiles estimated by a quantile sketch, built from
+several merged shards, with the exact quantiles of a NumberList.
+Run from the root of the repository with:
+python -m benchmarks.SketchBenchmark [count] [capacity]
+"""
+
+import sys
+from bisect import bisect_left, bisect_right
+from random import gauss
+from time import perf_counter
+from calc.NumberList import NumberList
+from calc.QuantileSketch import QuantileSketch
+from calc.Serialization import serialize, deserialize
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    values = [gauss(0, 1) for _ in range(count)]
+
+    start = perf_counter()
+    shards = [serialize(QuantileSketch(values[index::8], capacity)) for index in range(8)]
+    sketch = deserialize(shards[0])
+
+    for shard in shards[1:]:
+        sketch = sketch.merge(deserialize(shard))
+
+    sketchSeconds = perf_counter() - start
+    numberList = NumberList(list(values))
+    start = perf_counter()
+    percents = list(range(1, 100))
+    exact = numberList.percentiles(percents)
+    exactSeconds = perf_counter() - start
+    sortedValues = sorted(values)
+
+    print("{} values, {} bytes per serialized shard".format(count, len(shards[0])))
+    print("sketch {:.4f}s, exact {:.4f}s".format(sketchSeconds, exactSeconds))
+    print("{:>8} {:>12} {:>12} {:>11}".format("percent", "exact", "estimate", "rank error"))
+
+    for (percent, exactValue, estimate) in zip(percents, exact, sketch.percentiles(percents)):
+        # The rank error is the distance from the exact rank to the
+        # closest rank the estimate has
+        exactRank = (count - 1) * percent / 100
+        (lowRank, highRank) = (bisect_left(sortedValues, estimate), bisect_right(sortedValues, estimate) - 1)
+        rankError = 0 if lowRank <= exactRank <= highRank else \
+            min(abs(lowRank - exactRank), abs(highRank - exactRank)) / count
+
+        if percent % 10 == 0:
+            print("{:>8} {:>12.6f} {:>12.6f} {:>10.3%}".format(percent, exactValue, estimate, rankError))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measures the time of adding and multiplying matrices whose
+elements are mostly zeros, stored densely and as sparse matrices.
+Run from the root of the repository with:
+python -m benchmarks.SparseBenchmark [size] [density]
+"""
+
+import sys
+from random import random, randrange
+from time import perf_counter
+from calc.SparseMatrix import SparseMatrix
+from calc.Vector import Vector
+
+
+def _randomElements(size: int, density: float) -> dict:
+    """
+    Chooses random non-zero elements of a square matrix
+
+    :param size: The number of rows and columns of the matrix
+    :param density: The fraction of the elements that are non-zero
+    :return: A mapping from the indices of the elements to their
+        values
+    """
+
+    return {(randrange(size), randrange(size)): random() + 1 for _ in range(int(size * size * density))}
+
+
+def _seconds(function) -> float:
+    """
+    Returns the time taken by the given function
+
+    :param function: The function to be timed
+    :return: The number of seconds taken
+    """
+
+    start = perf_counter()
+    function()
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    density = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    left = SparseMatrix(size, size, _randomElements(size, density))
+    right = SparseMatrix(size, size, _randomElements(size, density))
+    (denseLeft, denseRight) = (left.toMatrix(), right.toMatrix())
+    vector = Vector([random() for _ in range(size)])
+
+    print("{}x{} with {} and {} non-zero elements".format(size, size, left.nonZeroCount, right.nonZeroCount))
+    print("{:<10} {:>10} {:>10}".format("operation", "dense", "sparse"))
+
+    for (name, denseOperation, sparseOperation) in (
+            ("add", lambda: denseLeft + denseRight, lambda: left + right),
+            ("multiply", lambda: denseLeft * denseRight, lambda: left * right),
+            ("vector", lambda: denseLeft * vector, lambda: left * vector),
+            ("transpose", denseLeft.transpose, left.transpose)):
+        print("{:<10} {:>9.4f}s {:>9.4f}s".format(name, _seconds(denseOperation), _seconds(sparseOperation)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,524 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Dict, Mapping, Iterator, Optional, Callable
+from fractions import Fraction
+from calc.Quaternion import Quaternion
+from calc.Matrix import Matrix
+from calc.StructuredMatrix import StructuredMatrix, _leftDivide, _rightDivide
+from calc.DiagonalMatrix import DiagonalMatrix
+
+
+class BandedMatrix(StructuredMatrix):
+    """
+    Instances of this class represent square matrices whose
+    elements are zero outside of a band around the diagonal. The
+    band holds the given number of diagonals below the diagonal
+    and above it, and is stored row by row. Solving and the
+    determinant use an LU factorization with partial pivoting that
+    stays inside the band, which costs time proportional to the
+    size of the matrix times the square of the width of the band.
+    Matrices consisting only of ints are factored exactly using
+    fractions
+    """
+
+    def __init__(self, size: int, diagonals: Mapping[int, List[Union[int, float, complex, Quaternion]]]):
+        """
+        Constructs a banded matrix from its diagonals
+
+        :param size: The number of rows and columns of the matrix
+        :param diagonals: A mapping from the offset of each
+            diagonal to its elements, from the top left to the
+            bottom right. The main diagonal has an offset of 0,
+            diagonals above it have positive offsets and diagonals
+            below it have negative offsets. Missing diagonals
+            inside the band are zero
+        :raises ValueError: Raised if a diagonal is outside of the
+            matrix or does not hold one element for each of its
+            positions
+        """
+
+        for (offset, diagonal) in diagonals.items():
+            if abs(offset) >= size or len(diagonal) != size - abs(offset):
+                raise ValueError("Each diagonal must be inside the Matrix and hold one element for each of its positions")
+
+        super().__init__(size)
+
+        self.__lowerBandwidth = max([-offset for offset in diagonals] + [0])
+        self.__upperBandwidth = max([offset for offset in diagonals] + [0])
+        self.__band = [0] * (size * self.__width)
+        self.__factorization = None
+
+        for (offset, diagonal) in diagonals.items():
+            firstRow = max(-offset, 0)
+
+            for (index, value) in enumerate(diagonal):
+                rowIndex = firstRow + index
+                self.__band[self.__indexOf((rowIndex, rowIndex + offset))] = value
+
+    @staticmethod
+    def __createFromBand(band: List[Union[int, float, complex, Quaternion]], size: int,
+                         lowerBandwidth: int, upperBandwidth: int) -> BandedMatrix:
+        """
+        Creates a banded matrix that uses the given band directly
+
+        :param band: The stored elements, row by row, including
+            the positions of the band that are outside the matrix
+        :param size: The number of rows and columns of the matrix
+        :param lowerBandwidth: The number of diagonals stored below
+            the main diagonal
+        :param upperBandwidth: The number of diagonals stored above
+            the main diagonal
+        :return: A banded matrix backed by the given band
+        """
+
+        matrix = BandedMatrix(0, {})
+        StructuredMatrix.__init__(matrix, size)
+        matrix.__lowerBandwidth = lowerBandwidth
+        matrix.__upperBandwidth = upperBandwidth
+        matrix.__band = band
+
+        return matrix
+
+    @staticmethod
+    def createBandedMatrixFromMatrix(matrix: Matrix, lowerBandwidth: int, upperBandwidth: int) -> BandedMatrix:
+        """
+        Creates a banded matrix from the elements of the given
+        dense matrix inside the given band. The elements outside
+        of the band are ignored
+
+        :param matrix: A square dense matrix
+        :param lowerBandwidth: The number of diagonals to keep
+            below the main diagonal
+        :param upperBandwidth: The number of diagonals to keep
+            above the main diagonal
+        :return: A banded matrix with the elements of the given
+            matrix inside the band
+        :raises ArithmeticError: Raised if the given matrix is not
+            square
+        :raises ValueError: Raised if a bandwidth is negative
+        """
+
+        if not matrix.isSquare:
+            raise ArithmeticError("Only square Matrices can be banded")
+        if lowerBandwidth < 0 or upperBandwidth < 0:
+            raise ValueError("Bandwidths cannot be negative")
+
+        size = matrix.rowLength
+        table = list(matrix)
+        diagonals = {}
+
+        for offset in range(-min(lowerBandwidth, size - 1), min(upperBandwidth, size - 1) + 1):
+            firstRow = max(-offset, 0)
+            diagonals[offset] = [table[rowIndex * size + rowIndex + offset]
+                                 for rowIndex in range(firstRow, size - max(offset, 0))]
+
+        return BandedMatrix(size, diagonals)
+
+    @property
+    def lowerBandwidth(self) -> int:
+        """
+        Returns the number of diagonals stored below the main
+        diagonal
+
+        :return: The lower bandwidth of this matrix
+        """
+
+        return self.__lowerBandwidth
+
+    @property
+    def upperBandwidth(self) -> int:
+        """
+        Returns the number of diagonals stored above the main
+        diagonal
+
+        :return: The upper bandwidth of this matrix
+        """
+
+        return self.__upperBandwidth
+
+    @property
+    def __width(self) -> int:
+        """
+        Returns the number of elements stored for each row
+
+        :return: The number of diagonals in the band
+        """
+
+        return self.__lowerBandwidth + self.__upperBandwidth + 1
+
+    def __inBand(self, coordinates: Tuple[int, int]) -> bool:
+        """
+        Checks if the element at the given indices is inside the
+        band
+
+        :param coordinates: A tuple containing the row and column
+            indices of an element
+        :return: True if the element is stored, False if it is
+            always zero
+        """
+
+        return -self.__lowerBandwidth <= coordinates[1] - coordinates[0] <= self.__upperBandwidth
+
+    def __indexOf(self, coordinates: Tuple[int, int]) -> int:
+        """
+        Returns the position of an element inside the band
+
+        :param coordinates: A tuple containing the row and column
+            indices of an element inside the band
+        :return: The index of the element in the stored band
+        """
+
+        return coordinates[0] * self.__width + coordinates[1] - coordinates[0] + self.__lowerBandwidth
+
+    def __columnRange(self, rowIndex: int) -> range:
+        """
+        Returns the columns of a row that are inside the band and
+        inside the matrix
+
+        :param rowIndex: The index of the row
+        :return: The range of the stored columns of the row
+        """
+
+        return range(max(rowIndex - self.__lowerBandwidth, 0), min(rowIndex + self.__upperBandwidth + 1, self.size))
+
+    def __valueAt(self, coordinates: Tuple[int, int]) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the element at the given indices without checking
+        that they are inside the matrix
+
+        :param coordinates: A tuple containing the row and column
+            indices of an element
+        :return: The element, which is zero outside of the band
+        """
+
+        return self.__band[self.__indexOf(coordinates)] if self.__inBand(coordinates) else 0
+
+    def __getitem__(self, coordinates: Tuple[int, int]) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be returned
+        :return: The element at the given row and column indices
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        """
+
+        self._checkIndices(coordinates)
+
+        return self.__valueAt(coordinates)
+
+    def __setitem__(self, coordinates: Tuple[int, int], value: Union[int, float, complex, Quaternion]) -> None:
+        """
+        Sets the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be set
+        :param value: The new value of the element
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        :raises ValueError: Raised if a non-zero value is placed
+            outside of the band
+        """
+
+        self._checkIndices(coordinates)
+
+        if self.__inBand(coordinates):
+            self.__band[self.__indexOf(coordinates)] = value
+            self.__factorization = None
+        elif value != 0:
+            raise ValueError("Elements outside of the band of a BandedMatrix must be zero")
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Union[int, float, complex, Quaternion]]]:
+        """
+        Returns an iterator over the elements stored in this
+        matrix, row by row
+
+        :return: An iterator over the row and column indices and
+            the value of each stored element
+        """
+
+        for rowIndex in range(self.size):
+            for columnIndex in self.__columnRange(rowIndex):
+                yield ((rowIndex, columnIndex), self.__band[self.__indexOf((rowIndex, columnIndex))])
+
+    def __factor(self) -> Tuple[List[Dict[int, Union[int, float, complex, Quaternion, Fraction]]], List[int], int,
+                                bool, bool]:
+        """
+        Performs Gaussian elimination with partial pivoting on the
+        rows of this matrix, leaving the multipliers of L below the
+        diagonal and U on and above the diagonal of each row. Rows
+        are only swapped with the rows below them inside the lower
+        bandwidth, so U has at most the sum of the bandwidths above
+        the diagonal. The factorization is kept until an element
+        of this matrix is set
+
+        :return: The factored rows, the row permutation, the number
+            of swaps, whether this matrix is singular and whether
+            it was factored exactly
+        """
+
+        if self.__factorization is not None:
+            return self.__factorization
+
+        size = self.size
+        values = [value for (_, value) in self.items()]
+        isExact = all(isinstance(value, int) for value in values)
+        rows = []
+
+        for rowIndex in range(size):
+            rows.append({columnIndex: Fraction(self.__band[self.__indexOf((rowIndex, columnIndex))]) if isExact
+                         else self.__band[self.__indexOf((rowIndex, columnIndex))]
+                         for columnIndex in self.__columnRange(rowIndex)})
+
+        permutation = list(range(size))
+        swapCount = 0
+        isSingular = False
+
+        for pivotIndex in range(size):
+            lastRow = min(pivotIndex + self.__lowerBandwidth, size - 1)
+            pivotRow = pivotIndex
+            pivotAbs = abs(rows[pivotIndex].get(pivotIndex, 0))
+
+            for rowIndex in range(pivotIndex + 1, lastRow + 1):
+                candidateAbs = abs(rows[rowIndex].get(pivotIndex, 0))
+
+                if candidateAbs > pivotAbs:
+                    pivotRow = rowIndex
+                    pivotAbs = candidateAbs
+
+            if pivotAbs == 0:
+                isSingular = True
+                continue
+
+            if pivotRow != pivotIndex:
+                rows[pivotIndex], rows[pivotRow] = rows[pivotRow], rows[pivotIndex]
+                permutation[pivotIndex], permutation[pivotRow] = permutation[pivotRow], permutation[pivotIndex]
+                swapCount += 1
+
+            pivotEntries = [(columnIndex, value) for (columnIndex, value) in rows[pivotIndex].items()
+                            if columnIndex > pivotIndex]
+            pivot = rows[pivotIndex][pivotIndex]
+
+            for rowIndex in range(pivotIndex + 1, lastRow + 1):
+                row = rows[rowIndex]
+                multiplier = _rightDivide(row.get(pivotIndex, 0), pivot)
+                row[pivotIndex] = multiplier
+
+                if multiplier == 0:
+                    continue
+
+                for (columnIndex, value) in pivotEntries:
+                    row[columnIndex] = row.get(columnIndex, 0) - multiplier * value
+
+        self.__factorization = (rows, permutation, swapCount, isSingular, isExact)
+
+        return self.__factorization
+
+    @property
+    def determinant(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the determinant of this matrix. Triangular banded
+        matrices multiply their diagonal, and other banded matrices
+        multiply the pivots of their factorization. For matrices
+        containing quaternions, this is the ordered product of the
+        pivots, which is only defined up to the order of
+        multiplication
+
+        :return: The determinant of this matrix
+        """
+
+        det = 1
+
+        if self.__lowerBandwidth == 0 or self.__upperBandwidth == 0:
+            for index in range(self.size):
+                det = det * self.__band[self.__indexOf((index, index))]
+
+            return det
+
+        (rows, _, swapCount, isSingular, isExact) = self.__factor()
+
+        if isSingular:
+            return 0
+
+        det = -1 if swapCount % 2 == 1 else 1
+
+        for (index, row) in enumerate(rows):
+            det = det * row[index]
+
+        if isExact:
+            return int(det)
+
+        return det
+
+    def transpose(self) -> BandedMatrix:
+        """
+        Returns the transpose of this matrix, whose lower and upper
+        bandwidths are swapped
+
+        :return: The transpose of this matrix
+        """
+
+        size = self.size
+        (lowerBandwidth, upperBandwidth) = (self.__upperBandwidth, self.__lowerBandwidth)
+        band = [0] * (size * self.__width)
+        width = self.__width
+
+        for ((rowIndex, columnIndex), value) in self.items():
+            band[columnIndex * width + rowIndex - columnIndex + lowerBandwidth] = value
+
+        return BandedMatrix.__createFromBand(band, size, lowerBandwidth, upperBandwidth)
+
+    def _solveValues(self, values: List[Union[int, float, complex, Quaternion]]) \
+            -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Solves this matrix times x equals the given values for x
+        using the factorization of this matrix
+
+        :param values: The right-hand side of the equation
+        :return: The solution of the equation
+        :raises ArithmeticError: Raised if this matrix is singular
+        """
+
+        (rows, permutation, _, isSingular, isExact) = self.__factor()
+
+        if isSingular:
+            raise ArithmeticError("Singular matrices cannot be solved against")
+
+        if isExact:
+            solution = [Fraction(values[index]) if isinstance(values[index], int) else values[index]
+                        for index in permutation]
+        else:
+            solution = [values[index] for index in permutation]
+
+        for (rowIndex, row) in enumerate(rows):
+            value = solution[rowIndex]
+
+            for (columnIndex, element) in row.items():
+                if columnIndex < rowIndex:
+                    value -= element * solution[columnIndex]
+
+            solution[rowIndex] = value
+
+        for rowIndex in range(self.size - 1, -1, -1):
+            row = rows[rowIndex]
+            value = solution[rowIndex]
+
+            for (columnIndex, element) in row.items():
+                if columnIndex > rowIndex:
+                    value -= element * solution[columnIndex]
+
+            solution[rowIndex] = _leftDivide(row[rowIndex], value)
+
+        if isExact:
+            return [float(value) if type(value) is Fraction else value for value in solution]
+
+        return solution
+
+    def _scale(self, scalar: Union[int, float, complex, Quaternion], isLeft: bool) -> BandedMatrix:
+        """
+        Multiplies the band of this matrix by a scalar
+
+        :param scalar: The scalar
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The banded product
+        """
+
+        if isLeft:
+            band = [value * scalar for value in self.__band]
+        else:
+            band = [scalar * value for value in self.__band]
+
+        return BandedMatrix.__createFromBand(band, self.size, self.__lowerBandwidth, self.__upperBandwidth)
+
+    @staticmethod
+    def __asBanded(matrix: StructuredMatrix) -> Optional[BandedMatrix]:
+        """
+        Views the given structured matrix as a banded matrix
+
+        :param matrix: A structured matrix
+        :return: The matrix itself if it is banded, a banded matrix
+            with the diagonal of a diagonal matrix, or None
+            otherwise
+        """
+
+        if isinstance(matrix, BandedMatrix):
+            return matrix
+        if isinstance(matrix, DiagonalMatrix):
+            return BandedMatrix(matrix.size, {0: matrix.diagonal})
+
+        return None
+
+    def _combine(self, matrix: StructuredMatrix, operation: Callable, isLeft: bool) -> Optional[BandedMatrix]:
+        """
+        Applies an elementwise operation to this matrix and a
+        banded or diagonal matrix. The band of the result covers
+        the bands of both matrices
+
+        :param matrix: The other structured matrix
+        :param operation: The elementwise operation
+        :param isLeft: True if this matrix is the left operand,
+            False if it is the right operand
+        :return: The banded result, or None if the other matrix is
+            not banded
+        """
+
+        other = BandedMatrix.__asBanded(matrix)
+
+        if other is None:
+            return None
+
+        (left, right) = (self, other) if isLeft else (other, self)
+        lowerBandwidth = max(self.__lowerBandwidth, other.__lowerBandwidth)
+        upperBandwidth = max(self.__upperBandwidth, other.__upperBandwidth)
+        size = self.size
+        band = [0] * (size * (lowerBandwidth + upperBandwidth + 1))
+        result = BandedMatrix.__createFromBand(band, size, lowerBandwidth, upperBandwidth)
+
+        for rowIndex in range(size):
+            for columnIndex in result.__columnRange(rowIndex):
+                coordinates = (rowIndex, columnIndex)
+                band[result.__indexOf(coordinates)] = operation(left.__valueAt(coordinates),
+                                                                right.__valueAt(coordinates))
+
+        return result
+
+    def _multiply(self, matrix: StructuredMatrix, isLeft: bool) -> Optional[BandedMatrix]:
+        """
+        Multiplies this matrix and a banded or diagonal matrix. The
+        bandwidths of the product are the sums of the bandwidths
+        of the two matrices, and each element of the product only
+        sums the products of elements inside both bands
+
+        :param matrix: The other structured matrix
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The banded product, or None if the other matrix
+            is not banded
+        """
+
+        other = BandedMatrix.__asBanded(matrix)
+
+        if other is None:
+            return None
+
+        (left, right) = (self, other) if isLeft else (other, self)
+        size = self.size
+        lowerBandwidth = min(left.__lowerBandwidth + right.__lowerBandwidth, max(size - 1, 0))
+        upperBandwidth = min(left.__upperBandwidth + right.__upperBandwidth, max(size - 1, 0))
+        band = [0] * (size * (lowerBandwidth + upperBandwidth + 1))
+        result = BandedMatrix.__createFromBand(band, size, lowerBandwidth, upperBandwidth)
+
+        for rowIndex in range(size):
+            for columnIndex in result.__columnRange(rowIndex):
+                firstShared = max(rowIndex - left.__lowerBandwidth, columnIndex - right.__upperBandwidth, 0)
+                lastShared = min(rowIndex + left.__upperBandwidth, columnIndex + right.__lowerBandwidth, size - 1)
+                total = 0
+
+                for sharedIndex in range(firstShared, lastShared + 1):
+                    total = total + left.__band[left.__indexOf((rowIndex, sharedIndex))] * \
+                            right.__band[right.__indexOf((sharedIndex, columnIndex))]
+
+                band[result.__indexOf((rowIndex, columnIndex))] = total
+
+        return result
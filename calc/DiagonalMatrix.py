@@ -0,0 +1,209 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Iterator, Optional, Callable
+from calc.Quaternion import Quaternion
+from calc.StructuredMatrix import StructuredMatrix, _inverseOf, _leftDivide
+
+
+class DiagonalMatrix(StructuredMatrix):
+    """
+    Instances of this class represent square matrices whose
+    elements are zero everywhere but on the diagonal. Only the
+    diagonal is stored, so products, the determinant, the inverse
+    and solving take time proportional to the size of the matrix
+    """
+
+    def __init__(self, diagonal: List[Union[int, float, complex, Quaternion]]):
+        """
+        Constructs a diagonal matrix with the given elements on
+        its diagonal
+
+        :param diagonal: The elements of the diagonal, from the
+            top left to the bottom right
+        """
+
+        super().__init__(len(diagonal))
+
+        self.__diagonal = list(diagonal)
+
+    @staticmethod
+    def identity(size: int) -> DiagonalMatrix:
+        """
+        Returns a square identity matrix of the given size, which
+        only stores its diagonal
+
+        :param size: The number of rows and columns of the matrix
+        :return: A diagonal identity matrix
+        """
+
+        return DiagonalMatrix([1] * size)
+
+    @property
+    def diagonal(self) -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Returns the elements of the diagonal of this matrix
+
+        :return: A list of the elements of the diagonal
+        """
+
+        return list(self.__diagonal)
+
+    def __getitem__(self, coordinates: Tuple[int, int]) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be returned
+        :return: The element at the given row and column indices
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        """
+
+        self._checkIndices(coordinates)
+
+        return self.__diagonal[coordinates[0]] if coordinates[0] == coordinates[1] else 0
+
+    def __setitem__(self, coordinates: Tuple[int, int], value: Union[int, float, complex, Quaternion]) -> None:
+        """
+        Sets the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be set
+        :param value: The new value of the element
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        :raises ValueError: Raised if a non-zero value is placed
+            outside of the diagonal
+        """
+
+        self._checkIndices(coordinates)
+
+        if coordinates[0] == coordinates[1]:
+            self.__diagonal[coordinates[0]] = value
+        elif value != 0:
+            raise ValueError("Only the diagonal of a DiagonalMatrix can be non-zero")
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Union[int, float, complex, Quaternion]]]:
+        """
+        Returns an iterator over the elements of the diagonal of
+        this matrix
+
+        :return: An iterator over the row and column indices and
+            the value of each element of the diagonal
+        """
+
+        for (index, value) in enumerate(self.__diagonal):
+            yield ((index, index), value)
+
+    @property
+    def determinant(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the determinant of this matrix, which is the
+        product of its diagonal. For matrices containing
+        quaternions, the product is taken from the top left to
+        the bottom right
+
+        :return: The determinant of this matrix
+        """
+
+        det = 1
+
+        for value in self.__diagonal:
+            det = det * value
+
+        return det
+
+    def transpose(self) -> DiagonalMatrix:
+        """
+        Returns the transpose of this matrix, which is a copy of
+        it
+
+        :return: The transpose of this matrix
+        """
+
+        return DiagonalMatrix(self.__diagonal)
+
+    def inverse(self) -> DiagonalMatrix:
+        """
+        Returns the inverse of this matrix, which inverts each
+        element of the diagonal
+
+        :return: The inverse of this matrix
+        :raises ArithmeticError: Raised if this matrix is singular
+        """
+
+        if any(value == 0 for value in self.__diagonal):
+            raise ArithmeticError("Singular Matrices do not have inverses")
+
+        return DiagonalMatrix([_inverseOf(value) for value in self.__diagonal])
+
+    def _solveValues(self, values: List[Union[int, float, complex, Quaternion]]) \
+            -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Solves this matrix times x equals the given values for x
+        by dividing each value by the matching diagonal element
+
+        :param values: The right-hand side of the equation
+        :return: The solution of the equation
+        :raises ArithmeticError: Raised if this matrix is singular
+        """
+
+        if any(value == 0 for value in self.__diagonal):
+            raise ArithmeticError("Singular matrices cannot be solved against")
+
+        return [_leftDivide(diagonalValue, value) for (diagonalValue, value) in zip(self.__diagonal, values)]
+
+    def _scale(self, scalar: Union[int, float, complex, Quaternion], isLeft: bool) -> DiagonalMatrix:
+        """
+        Multiplies the diagonal of this matrix by a scalar
+
+        :param scalar: The scalar
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The diagonal product
+        """
+
+        if isLeft:
+            return DiagonalMatrix([value * scalar for value in self.__diagonal])
+
+        return DiagonalMatrix([scalar * value for value in self.__diagonal])
+
+    def _combine(self, matrix: StructuredMatrix, operation: Callable, isLeft: bool) -> Optional[DiagonalMatrix]:
+        """
+        Applies an elementwise operation to the diagonals of this
+        matrix and another diagonal matrix
+
+        :param matrix: The other structured matrix
+        :param operation: The elementwise operation
+        :param isLeft: True if this matrix is the left operand,
+            False if it is the right operand
+        :return: The diagonal result, or None if the other matrix
+            is not diagonal
+        """
+
+        if not isinstance(matrix, DiagonalMatrix):
+            return None
+
+        if isLeft:
+            return DiagonalMatrix(list(map(operation, self.__diagonal, matrix.__diagonal)))
+
+        return DiagonalMatrix(list(map(operation, matrix.__diagonal, self.__diagonal)))
+
+    def _multiply(self, matrix: StructuredMatrix, isLeft: bool) -> Optional[DiagonalMatrix]:
+        """
+        Multiplies the diagonals of this matrix and another
+        diagonal matrix
+
+        :param matrix: The other structured matrix
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The diagonal product, or None if the other matrix
+            is not diagonal
+        """
+
+        if not isinstance(matrix, DiagonalMatrix):
+            return None
+
+        if isLeft:
+            return DiagonalMatrix([left * right for (left, right) in zip(self.__diagonal, matrix.__diagonal)])
+
+        return DiagonalMatrix([left * right for (left, right) in zip(matrix.__diagonal, self.__diagonal)])
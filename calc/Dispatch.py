@@ -0,0 +1,220 @@
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, List
+from types import MappingProxyType
+from numbers import Integral, Real, Complex
+from math import nan
+
+
+Handler = Callable[[Any, Any], Any]
+
+# Numbers that do not derive from a built-in numeric type, such as
+# numpy.int64 and numpy.float32, use the handlers of the built-in
+# type matching the abstract number type they are registered as
+_NUMERIC_TYPES = ((Integral, int), (Real, float), (Complex, complex))
+
+
+def _candidateTypes(operandType: type) -> List[type]:
+    """
+    Returns the types whose handlers may be used for an operand
+    of the given type, from the most to the least specific
+
+    :param operandType: The type of an operand
+    :return: The method resolution order of the type, followed by
+        the built-in numeric types that it can stand in for
+    """
+
+    candidates = list(operandType.__mro__)
+
+    for (abstractType, concreteType) in _NUMERIC_TYPES:
+        if concreteType not in candidates and issubclass(operandType, abstractType):
+            candidates.append(concreteType)
+
+    return candidates
+
+
+class DispatchTable:
+    """
+    Instances of this class map pairs of operand types to the
+    functions that apply an operator to operands of those types.
+    The handler of a pair of types is resolved once, by walking
+    the method resolution order of both types so that subclasses
+    use the handlers of the types they derive from, and is then
+    cached. Numbers registered with the abstract types of the
+    numbers module, such as numpy scalars, use the handlers of the
+    matching built-in int, float or complex. Every later operation
+    on the same pair of types costs a single dictionary lookup
+    """
+
+    def __init__(self, name: str, default: Any):
+        """
+        Constructs an empty dispatch table
+
+        :param name: The name of the operator that this table
+            dispatches
+        :param default: The result of applying the operator to
+            a pair of types that has no handler
+        """
+
+        self.__name = name
+        self.__default = default
+        self.__handlers: Dict[Tuple[type, type], Handler] = {}
+        self.__cache: Dict[Tuple[type, type], Optional[Handler]] = {}
+        self.__dispatcher = self.__createDispatcher()
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the operator that this table
+        dispatches
+
+        :return: The name of the operator
+        """
+
+        return self.__name
+
+    @property
+    def handlers(self) -> Mapping[Tuple[type, type], Handler]:
+        """
+        Returns a read-only view of the registered handlers,
+        keyed by the types of the left and right operands
+
+        :return: A read-only view of the registered handlers
+        """
+
+        return MappingProxyType(self.__handlers)
+
+    def register(self, leftType: type, rightType: type, handler: Handler) -> None:
+        """
+        Registers the handler of the operator for operands of the
+        given types, replacing any handler already registered for
+        them. The handler is also used for subclasses of the given
+        types that have no handler of their own
+
+        :param leftType: The type of the left operand
+        :param rightType: The type of the right operand
+        :param handler: A function taking the left and right
+            operands and returning the result of the operator
+        :return: None
+        """
+
+        self.__handlers[(leftType, rightType)] = handler
+        self.__cache.clear()
+
+    def registerAll(self, handlers: Mapping[Tuple[type, type], Handler]) -> None:
+        """
+        Registers every handler in the given mapping. The handlers
+        are copied into this table, so later changes to the mapping
+        are not seen by it. Handlers added afterwards must be passed
+        to register or registerAll, which also clear the cache of
+        resolved handlers
+
+        :param handlers: A mapping from pairs of operand types to
+            handlers
+        :return: None
+        """
+
+        self.__handlers.update(handlers)
+        self.__cache.clear()
+
+    def resolve(self, leftType: type, rightType: type) -> Optional[Handler]:
+        """
+        Finds the handler of the operator for operands of the given
+        types. The most specific registered type of the left operand
+        is preferred, then the most specific registered type of the
+        right operand. A type that is only registered as an
+        Integral, Real or Complex number is treated as an int, float
+        or complex number. The result is memoized for the pair of
+        types
+
+        :param leftType: The type of the left operand
+        :param rightType: The type of the right operand
+        :return: The handler for the given types, or None if the
+            operator is not defined for them
+        """
+
+        key = (leftType, rightType)
+
+        try:
+            return self.__cache[key]
+        except KeyError:
+            pass
+
+        handler = None
+        handlers = self.__handlers
+
+        rightCandidates = _candidateTypes(rightType)
+
+        for leftBase in _candidateTypes(leftType):
+            for rightBase in rightCandidates:
+                handler = handlers.get((leftBase, rightBase))
+
+                if handler is not None:
+                    break
+
+            if handler is not None:
+                break
+
+        self.__cache[key] = handler
+
+        return handler
+
+    def __createDispatcher(self) -> Handler:
+        """
+        Creates the function that applies the operator. The
+        function keeps the cache and default result in local
+        variables, which is faster than reading them from this
+        table on every call
+
+        :return: A function taking the left and right operands
+            and returning the result of the operator
+        """
+
+        cache = self.__cache
+        resolve = self.resolve
+        default = self.__default
+
+        def dispatch(left: Any, right: Any) -> Any:
+            try:
+                handler = cache[(type(left), type(right))]
+            except KeyError:
+                handler = resolve(type(left), type(right))
+
+            if handler is None:
+                return default
+
+            return handler(left, right)
+
+        return dispatch
+
+    @property
+    def dispatcher(self) -> Handler:
+        """
+        Returns a function that applies the operator to a left
+        and right operand. It returns the default result of this
+        table if the operator is not defined for the types of the
+        operands
+
+        :return: The function that applies the operator
+        """
+
+        return self.__dispatcher
+
+    def __call__(self, left: Any, right: Any) -> Any:
+        """
+        Applies the operator to the given operands
+
+        :param left: The left operand
+        :param right: The right operand
+        :return: The result of the operator, or the default result
+            of this table if the operator is not defined for the
+            types of the operands
+        """
+
+        return self.__dispatcher(left, right)
+
+
+addition = DispatchTable("addition", nan)
+subtraction = DispatchTable("subtraction", nan)
+multiplication = DispatchTable("multiplication", nan)
+division = DispatchTable("division", nan)
+exponentiation = DispatchTable("exponentiation", nan)
+equality = DispatchTable("equality", False)
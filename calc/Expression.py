@@ -0,0 +1,390 @@
+from __future__ import annotations
+from typing import Union, Tuple, Dict, Iterator, Callable, Optional
+from itertools import repeat, starmap, zip_longest
+from numbers import Complex
+from operator import add, sub, mul, truediv
+import numpy
+from calc.MathEntity import MathEntity
+from calc.Quaternion import Quaternion
+from calc.Matrix import Matrix
+from calc.NumberList import NumberList
+
+
+# The elementwise operations that can be fused, with their numpy
+# equivalents
+_UFUNCS = {add: numpy.add, sub: numpy.subtract, mul: numpy.multiply, truediv: numpy.true_divide}
+
+
+def _isScalar(value: object) -> bool:
+    """
+    Checks if the given value is a number that matrices and lists
+    of numbers can be combined with elementwise
+
+    :param value: The value to be checked
+    :return: True if the value is an int, float, complex number
+        or quaternion, False otherwise
+    """
+
+    return isinstance(value, (Complex, Quaternion))
+
+
+def _kindOf(value: object) -> Optional[type]:
+    """
+    Returns the type of entity that the given operand evaluates to
+
+    :param value: An operand of an expression
+    :return: Matrix or NumberList, or None if the operand is
+        neither
+    """
+
+    if isinstance(value, LazyExpression):
+        return value.kind
+    if isinstance(value, Matrix):
+        return Matrix
+    if isinstance(value, NumberList):
+        return NumberList
+
+    return None
+
+
+class LazyExpression(MathEntity):
+    """
+    Instances of this class represent an elementwise expression on
+    matrices or lists of numbers that has not been computed yet.
+    Adding, subtracting, multiplying and dividing an expression
+    builds a larger expression instead of a temporary entity, and
+    the whole expression is computed in a single pass over the
+    elements when it is evaluated, indexed or iterated. The
+    operands are read when the expression is first evaluated, and
+    the result is kept from then on. Operations that are not
+    elementwise, such as matrix products, evaluate the expression
+    and are then performed as usual
+    """
+
+    def __init__(self, entity: Union[Matrix, NumberList]):
+        """
+        Constructs an expression consisting of the given entity
+
+        :param entity: The matrix or list of numbers to be used in
+            lazily evaluated expressions
+        :raises TypeError: Raised if the given entity is not a
+            matrix or a list of numbers
+        """
+
+        kind = _kindOf(entity)
+
+        if kind is None:
+            raise TypeError("Only matrices and lists of numbers can be evaluated lazily")
+
+        self.__kind = kind
+        self.__operation = None
+        self.__operands = ()
+        self.__value = entity.evaluate() if isinstance(entity, LazyExpression) else entity
+        self.__rowLength = entity.rowLength if kind is Matrix else 1
+        self.__columnLength = entity.columnLength if kind is Matrix else len(entity)
+
+    @staticmethod
+    def __createNode(operation: Callable, operands: Tuple[object, object], kind: type,
+                     rowLength: int, columnLength: int) -> LazyExpression:
+        """
+        Creates an expression applying the given operation to the
+        given operands
+
+        :param operation: The elementwise operation
+        :param operands: The left and right operands
+        :param kind: The type of entity the expression evaluates to
+        :param rowLength: The number of rows of the result
+        :param columnLength: The number of columns of the result,
+            or the length of a resulting list of numbers
+        :return: The new expression
+        """
+
+        node = LazyExpression.__new__(LazyExpression)
+        node.__kind = kind
+        node.__operation = operation
+        node.__operands = operands
+        node.__value = None
+        node.__rowLength = rowLength
+        node.__columnLength = columnLength
+
+        return node
+
+    @staticmethod
+    def combine(operation: Callable, left: object, right: object) -> Union[MathEntity, float, bool]:
+        """
+        Applies an operation to two operands, at least one of which
+        is an expression. The result is a new expression if the
+        operation is elementwise on matrices or lists of numbers,
+        and is computed immediately otherwise
+
+        :param operation: The operation, such as operator.add
+        :param left: The left operand
+        :param right: The right operand
+        :return: The expression for the operation, or its result
+        :raises ArithmeticError: Raised if two matrices being added
+            or subtracted do not have the same dimensions
+        """
+
+        leftKind = _kindOf(left)
+        rightKind = _kindOf(right)
+
+        if operation in _UFUNCS:
+            if leftKind is Matrix and rightKind is Matrix and operation in (add, sub):
+                if (left.rowLength, left.columnLength) != (right.rowLength, right.columnLength):
+                    if operation is add:
+                        raise ArithmeticError("Matrices must be of equal dimensions to be added together")
+
+                    raise ArithmeticError("Matrices must be of equal dimensions to be subtracted from each other")
+
+                return LazyExpression.__createNode(operation, (left, right), Matrix,
+                                                   left.rowLength, left.columnLength)
+
+            if leftKind is Matrix and rightKind is None and _isScalar(right) and operation in (mul, truediv):
+                return LazyExpression.__createNode(operation, (left, right), Matrix,
+                                                   left.rowLength, left.columnLength)
+
+            if leftKind is None and rightKind is Matrix and _isScalar(left) and operation is mul:
+                return LazyExpression.__createNode(operation, (left, right), Matrix,
+                                                   right.rowLength, right.columnLength)
+
+            if leftKind is NumberList and rightKind is NumberList:
+                return LazyExpression.__createNode(operation, (left, right), NumberList,
+                                                   1, max(len(left), len(right)))
+
+            if leftKind is NumberList and rightKind is None and _isScalar(right):
+                return LazyExpression.__createNode(operation, (left, right), NumberList, 1, len(left))
+
+            # Quaternions cannot be divided by a list of numbers
+            if leftKind is None and rightKind is NumberList and _isScalar(left) and \
+                    not (operation is truediv and isinstance(left, Quaternion)):
+                return LazyExpression.__createNode(operation, (left, right), NumberList, 1, len(right))
+
+        if isinstance(left, LazyExpression):
+            left = left.evaluate()
+        if isinstance(right, LazyExpression):
+            right = right.evaluate()
+
+        return operation(left, right)
+
+    @property
+    def kind(self) -> type:
+        """
+        Returns the type of entity that this expression evaluates
+        to
+
+        :return: Matrix or NumberList
+        """
+
+        return self.__kind
+
+    @property
+    def rowLength(self) -> int:
+        """
+        Returns the number of rows of the matrix that this
+        expression evaluates to
+
+        :return: The number of rows of the result
+        """
+
+        return self.__rowLength
+
+    @property
+    def columnLength(self) -> int:
+        """
+        Returns the number of columns of the matrix that this
+        expression evaluates to
+
+        :return: The number of columns of the result
+        """
+
+        return self.__columnLength
+
+    def evaluate(self) -> Union[Matrix, NumberList]:
+        """
+        Computes the value of this expression in a single pass over
+        the elements of its operands. Matrices that are all backed
+        by numpy arrays are combined with numpy, reusing the arrays
+        of intermediate results. Otherwise the operations are
+        chained elementwise so that no intermediate list is built
+
+        :return: The matrix or list of numbers that this expression
+            evaluates to
+        """
+
+        if self.__value is None:
+            if self.__kind is Matrix and self.__isArrayComputable():
+                self.__value = Matrix.createMatrixFromArray(self.__computeArray()[0])
+            elif self.__kind is Matrix:
+                self.__value = Matrix.createMatrixFrom1DList(list(self.__iterate()),
+                                                             self.__rowLength, self.__columnLength)
+            else:
+                self.__value = NumberList(list(self.__iterate()))
+
+            # The operands are no longer needed once the value is known
+            self.__operation = None
+            self.__operands = ()
+
+        return self.__value
+
+    def __isArrayComputable(self) -> bool:
+        """
+        Checks if every matrix in this expression is backed by a
+        numpy array and no scalar is a quaternion
+
+        :return: True if this expression can be computed with
+            numpy, False otherwise
+        """
+
+        if self.__value is not None:
+            return self.__value.isArrayBacked
+
+        for operand in self.__operands:
+            if isinstance(operand, LazyExpression):
+                if not operand.__isArrayComputable():
+                    return False
+            elif isinstance(operand, Matrix):
+                if not operand.isArrayBacked:
+                    return False
+            elif isinstance(operand, Quaternion):
+                return False
+
+        return True
+
+    def __computeArray(self) -> Tuple[numpy.ndarray, bool]:
+        """
+        Computes this expression with numpy
+
+        :return: The resulting array, and whether it is a temporary
+            array that may be overwritten
+        """
+
+        if self.__value is not None:
+            return (self.__value.toArray(), False)
+
+        operands = []
+        temporaries = []
+
+        for operand in self.__operands:
+            if isinstance(operand, LazyExpression):
+                (array, isTemporary) = operand.__computeArray()
+            elif isinstance(operand, Matrix):
+                (array, isTemporary) = (operand.toArray(), False)
+            else:
+                (array, isTemporary) = (operand, False)
+
+            operands.append(array)
+            temporaries.append(isTemporary)
+
+        (left, right) = operands
+        resultType = numpy.result_type(left, right)
+
+        # Write the result over an intermediate result if one has
+        # the type of the result, instead of allocating a new array
+        if temporaries[0] and left.dtype == resultType:
+            out = left
+        elif temporaries[1] and right.dtype == resultType:
+            out = right
+        else:
+            out = None
+
+        return (_UFUNCS[self.__operation](left, right, out=out), True)
+
+    def __iterate(self) -> Iterator[Union[int, float, complex, Quaternion]]:
+        """
+        Returns an iterator computing the elements of this
+        expression one at a time
+
+        :return: An iterator over the elements of the result
+        """
+
+        if self.__value is not None:
+            return iter(self.__value)
+
+        (left, right) = (LazyExpression.__iterateOperand(operand) for operand in self.__operands)
+
+        # Lists of numbers of different lengths are padded with zeros
+        if self.__kind is NumberList and not _isScalar(self.__operands[0]) and not _isScalar(self.__operands[1]):
+            return starmap(self.__operation, zip_longest(left, right, fillvalue=0))
+
+        return map(self.__operation, left, right)
+
+    @staticmethod
+    def __iterateOperand(operand: object) -> Iterator[Union[int, float, complex, Quaternion]]:
+        """
+        Returns an iterator over the elements of an operand
+
+        :param operand: An expression, entity or scalar
+        :return: An iterator over the elements of the operand,
+            which repeats a scalar indefinitely
+        """
+
+        if isinstance(operand, LazyExpression):
+            return operand.__iterate()
+        if _isScalar(operand):
+            return repeat(operand)
+
+        return iter(operand)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements this expression evaluates to
+
+        :return: The number of elements of the result
+        """
+
+        return self.__rowLength * self.__columnLength
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]) -> Union[int, float, complex, Quaternion]:
+        """
+        Evaluates this expression and returns one of its elements
+
+        :param index: The index of the element, or its row and
+            column for a matrix
+        :return: The element at the given index
+        """
+
+        return self.evaluate()[index]
+
+    def __iter__(self) -> Iterator[Union[int, float, complex, Quaternion]]:
+        """
+        Evaluates this expression and returns an iterator over its
+        elements
+
+        :return: An iterator over the elements of the result
+        """
+
+        return iter(self.evaluate())
+
+    def __hash__(self) -> int:
+        """
+        Computes a hash code for the value of this expression
+
+        :return: A hash code for the value of this expression
+        """
+
+        return hash(self.evaluate())
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the value of this
+        expression
+
+        :return: A string representation of the value of this
+            expression
+        """
+
+        return str(self.evaluate())
+
+
+def lazyHandlers(operation: Callable) -> Dict[Tuple[type, type], Callable]:
+    """
+    Creates the handlers of an operator for operations that have
+    an expression on either side
+
+    :param operation: The operation of the operator
+    :return: The handlers to be registered with the dispatch table
+        of the operator
+    """
+
+    return {(LazyExpression, object): lambda left, right: LazyExpression.combine(operation, left, right),
+            (object, LazyExpression): lambda left, right: LazyExpression.combine(operation, left, right)}
@@ -0,0 +1,201 @@
+from __future__ import annotations
+from typing import List, Tuple, Iterable, Iterator, Any
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+
+
+def _isNaN(value: Any) -> bool:
+    """
+    Checks if the given value is not a number, which is the only
+    kind of value that is not equal to itself
+
+    :param value: The value to be checked
+    :return: True if the value is a NaN float, or a complex number
+        or quaternion with a NaN component, False otherwise
+    """
+
+    try:
+        return bool(value != value)
+    except (TypeError, ValueError):
+        return False
+
+
+def _isEqual(left: Any, right: Any) -> bool:
+    """
+    Checks if two values are equal, treating comparisons that do
+    not produce a single truth value as unequal
+
+    :param left: The first value
+    :param right: The second value
+    :return: True if the values are equal, False otherwise
+    """
+
+    try:
+        return bool(left == right)
+    except (TypeError, ValueError):
+        return False
+
+
+class FrequencyTable:
+    """
+    Instances of this class count how many times each value occurs
+    in a sequence, in a single pass. Hashable values are counted in
+    a hash table, so the table takes linear time to build. Values
+    that cannot be hashed are compared with each of the other
+    unhashable values instead. Every NaN is counted as one value,
+    since NaNs are never equal to each other, not even to
+    themselves. Values that are equal, such as 1 and 1.0, are
+    counted together under the first of them to occur
+    """
+
+    def __init__(self, values: Iterable[Any]):
+        """
+        Counts the occurrences of each of the given values
+
+        :param values: The values to be counted
+        """
+
+        values = values if isinstance(values, (list, tuple)) else list(values)
+
+        self.__unhashable = []
+        self.__nanValue = None
+        self.__nanCount = 0
+
+        try:
+            self.__counts = Counter(values)
+        except TypeError:
+            self.__counts = Counter()
+            self.__countSlowly(values)
+
+        # NaNs that are distinct objects have separate entries, so
+        # they are combined into one
+        for value in [value for value in self.__counts if _isNaN(value)]:
+            if self.__nanCount == 0:
+                self.__nanValue = value
+
+            self.__nanCount += self.__counts.pop(value)
+
+    def __countSlowly(self, values: List[Any]) -> None:
+        """
+        Counts values that are not all hashable, searching the
+        unhashable values already counted for each unhashable value
+
+        :param values: The values to be counted
+        :return: None
+        """
+
+        counts = self.__counts
+        unhashable = self.__unhashable
+
+        for value in values:
+            try:
+                counts[value] += 1
+            except TypeError:
+                for entry in unhashable:
+                    if entry[0] is value or _isEqual(entry[0], value):
+                        entry[1] += 1
+                        break
+                else:
+                    unhashable.append([value, 1])
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct values counted
+
+        :return: The number of distinct values
+        """
+
+        return len(self.__counts) + len(self.__unhashable) + (1 if self.__nanCount > 0 else 0)
+
+    @property
+    def total(self) -> int:
+        """
+        Returns the number of values counted, including repeated
+        values
+
+        :return: The number of values counted
+        """
+
+        return sum(self.__counts.values()) + sum(entry[1] for entry in self.__unhashable) + self.__nanCount
+
+    def count(self, value: Any) -> int:
+        """
+        Returns the number of times the given value occurs
+
+        :param value: The value whose occurrences are counted
+        :return: The number of occurrences of the value, which is 0
+            if it does not occur
+        """
+
+        if _isNaN(value):
+            return self.__nanCount
+
+        try:
+            return self.__counts[value]
+        except TypeError:
+            for (otherValue, count) in self.__unhashable:
+                if otherValue is value or _isEqual(otherValue, value):
+                    return count
+
+            return 0
+
+    def items(self) -> Iterator[Tuple[Any, int]]:
+        """
+        Returns an iterator over each distinct value and the number
+        of times it occurs. Hashable values come first, in the order
+        they first occur, followed by unhashable values and then
+        by NaN
+
+        :return: An iterator over the values and their counts
+        """
+
+        yield from self.__counts.items()
+        yield from ((value, count) for (value, count) in self.__unhashable)
+
+        if self.__nanCount > 0:
+            yield (self.__nanValue, self.__nanCount)
+
+    def mode(self) -> List[Any]:
+        """
+        Returns the values that occur the most often
+
+        :return: The most frequent values, in the order of items
+        """
+
+        entries = list(self.items())
+
+        if len(entries) == 0:
+            return []
+
+        highestCount = max(count for (_, count) in entries)
+
+        return [value for (value, count) in entries if count == highestCount]
+
+    def topK(self, k: int) -> List[Tuple[Any, int]]:
+        """
+        Returns the given number of values that occur the most often,
+        keeping only that many values in a heap while the counts
+        are scanned. Values with equal counts are kept in the order
+        of items
+
+        :param k: The number of values to be returned
+        :return: The most frequent values and their counts, from
+            the most frequent to the least frequent
+        :raises ValueError: Raised if k is negative
+        """
+
+        if k < 0:
+            raise ValueError("k cannot be negative")
+
+        return nlargest(k, self.items(), key=itemgetter(1))
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of this frequency table
+
+        :return: A string representation of this frequency table
+        """
+
+        return "{" + ", ".join(str(value) + ": " + str(count) for (value, count) in self.items()) + "}"
+
@@ -0,0 +1,341 @@
+from __future__ import annotations
+from typing import Union, List, Tuple
+from fractions import Fraction
+from calc.Quaternion import Quaternion
+
+
+class LUDecomposition:
+    """
+    Instances of this class represent the LU factorization of a
+    square matrix with partial pivoting, such that P * A = L * U.
+    Matrices consisting only of ints are factored exactly using
+    fractions. Matrices containing quaternions are factored without
+    assuming that multiplication is commutative
+    """
+
+    def __init__(self, matrix: "Matrix"):
+        """
+        Factors the given square matrix
+
+        :param matrix: The matrix to be factored
+        :raises ArithmeticError: Raised if the given matrix
+            is not square
+        """
+
+        if not matrix.isSquare:
+            raise ArithmeticError("Only square matrices have LU decompositions")
+
+        table = list(matrix)
+        size = matrix.rowLength
+
+        self.__size = size
+        self.__exact = all(isinstance(value, int) for value in table)
+        self.__noncommutative = any(type(value) is Quaternion for value in table)
+
+        if self.__exact:
+            table = [Fraction(value) for value in table]
+
+        self.__permutation = list(range(size))
+        self.__swapCount = 0
+        self.__singular = False
+        self.__factor(table, size)
+        self.__table = table
+
+    def __factor(self, table: List[Union[int, float, complex, Quaternion, Fraction]], size: int) -> None:
+        """
+        Performs Gaussian elimination with partial pivoting
+        on the given table, leaving the multipliers of L below
+        the diagonal and U on and above the diagonal
+
+        :param table: The row-major table to be factored in place
+        :param size: The number of rows in the table
+        :return: None
+        """
+
+        for pivotIndex in range(size):
+            pivotRow = pivotIndex
+            pivotAbs = abs(table[pivotIndex * size + pivotIndex])
+
+            for rowIndex in range(pivotIndex + 1, size):
+                candidateAbs = abs(table[rowIndex * size + pivotIndex])
+
+                if candidateAbs > pivotAbs:
+                    pivotRow = rowIndex
+                    pivotAbs = candidateAbs
+
+            if pivotAbs == 0:
+                self.__singular = True
+                continue
+
+            if pivotRow != pivotIndex:
+                self.__swapRows(table, size, pivotIndex, pivotRow)
+
+            pivotStart = pivotIndex * size
+            pivot = table[pivotStart + pivotIndex]
+
+            for rowIndex in range(pivotIndex + 1, size):
+                rowStart = rowIndex * size
+                multiplier = self.__rightDivide(table[rowStart + pivotIndex], pivot)
+                table[rowStart + pivotIndex] = multiplier
+
+                if multiplier == 0:
+                    continue
+
+                for columnIndex in range(pivotIndex + 1, size):
+                    table[rowStart + columnIndex] -= multiplier * table[pivotStart + columnIndex]
+
+    def __swapRows(self, table: List[Union[int, float, complex, Quaternion, Fraction]], size: int,
+                   firstRow: int, secondRow: int) -> None:
+        """
+        Swaps two rows of the given table and records the swap
+        in the row permutation
+
+        :param table: The row-major table whose rows are swapped
+        :param size: The number of columns in the table
+        :param firstRow: The index of the first row
+        :param secondRow: The index of the second row
+        :return: None
+        """
+
+        firstStart = firstRow * size
+        secondStart = secondRow * size
+
+        table[firstStart: firstStart + size], table[secondStart: secondStart + size] = \
+            table[secondStart: secondStart + size], table[firstStart: firstStart + size]
+
+        self.__permutation[firstRow], self.__permutation[secondRow] = \
+            self.__permutation[secondRow], self.__permutation[firstRow]
+        self.__swapCount += 1
+
+    def __inverseOf(self, value: Union[int, float, complex, Quaternion, Fraction]) -> Union[float, complex, Quaternion, Fraction]:
+        """
+        Computes the multiplicative inverse of the given value
+
+        :param value: The value to be inverted
+        :return: The multiplicative inverse of the given value
+        """
+
+        if type(value) is Quaternion:
+            return value.conjugate() * (1 / (abs(value) ** 2))
+        elif self.__exact:
+            return 1 / Fraction(value)
+        else:
+            return 1 / value
+
+    def __rightDivide(self, numerator: Union[int, float, complex, Quaternion, Fraction],
+                      denominator: Union[int, float, complex, Quaternion, Fraction]) -> Union[int, float, complex, Quaternion, Fraction]:
+        """
+        Computes numerator * denominator^-1
+
+        :param numerator: The value being divided
+        :param denominator: The value being divided by
+        :return: The numerator multiplied on the right by the
+            inverse of the denominator
+        """
+
+        if self.__noncommutative:
+            return numerator * self.__inverseOf(denominator)
+        else:
+            return numerator / denominator
+
+    def __leftDivide(self, denominator: Union[int, float, complex, Quaternion, Fraction],
+                     numerator: Union[int, float, complex, Quaternion, Fraction]) -> Union[int, float, complex, Quaternion, Fraction]:
+        """
+        Computes denominator^-1 * numerator
+
+        :param denominator: The value being divided by
+        :param numerator: The value being divided
+        :return: The numerator multiplied on the left by the
+            inverse of the denominator
+        """
+
+        if self.__noncommutative:
+            return self.__inverseOf(denominator) * numerator
+        else:
+            return numerator / denominator
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of rows and columns of the
+        factored matrix
+
+        :return: The number of rows and columns of the
+            factored matrix
+        """
+
+        return self.__size
+
+    @property
+    def isSingular(self) -> bool:
+        """
+        Checks if the factored matrix is singular
+
+        :return: True if the factored matrix is singular,
+            False otherwise
+        """
+
+        return self.__singular
+
+    @property
+    def isExact(self) -> bool:
+        """
+        Checks if the factorization was computed exactly
+        using fractions
+
+        :return: True if the factored matrix only contained
+            ints, False otherwise
+        """
+
+        return self.__exact
+
+    @property
+    def permutation(self) -> Tuple[int, ...]:
+        """
+        Returns the row permutation applied to the factored
+        matrix. The row at index i of P * A is the row at
+        index permutation[i] of A
+
+        :return: The row permutation of this factorization
+        """
+
+        return tuple(self.__permutation)
+
+    @property
+    def lower(self) -> "Matrix":
+        """
+        Returns the unit lower triangular factor L
+
+        :return: The unit lower triangular factor L
+        """
+
+        from calc.Matrix import Matrix
+
+        size = self.__size
+        table = []
+
+        for rowIndex in range(size):
+            for columnIndex in range(size):
+                if columnIndex < rowIndex:
+                    table.append(self.__export(self.__table[rowIndex * size + columnIndex]))
+                elif columnIndex == rowIndex:
+                    table.append(1)
+                else:
+                    table.append(0)
+
+        return Matrix.createMatrixFrom1DList(table, size, size)
+
+    @property
+    def upper(self) -> "Matrix":
+        """
+        Returns the upper triangular factor U
+
+        :return: The upper triangular factor U
+        """
+
+        from calc.Matrix import Matrix
+
+        size = self.__size
+        table = []
+
+        for rowIndex in range(size):
+            for columnIndex in range(size):
+                if columnIndex < rowIndex:
+                    table.append(0)
+                else:
+                    table.append(self.__export(self.__table[rowIndex * size + columnIndex]))
+
+        return Matrix.createMatrixFrom1DList(table, size, size)
+
+    @staticmethod
+    def __export(value: Union[int, float, complex, Quaternion, Fraction]) -> Union[int, float, complex, Quaternion]:
+        """
+        Converts a value of the factorization to a type that
+        the rest of the library supports
+
+        :param value: The value to be converted
+        :return: The value as an int if it is a whole fraction,
+            as a float if it is any other fraction, and unchanged
+            otherwise
+        """
+
+        if type(value) is Fraction:
+            return int(value) if value.denominator == 1 else float(value)
+
+        return value
+
+    @property
+    def determinant(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the determinant of the factored matrix. For
+        matrices containing quaternions, this is the ordered
+        product of the pivots, which is only defined up to the
+        order of multiplication
+
+        :return: The determinant of the factored matrix
+        """
+
+        if self.__singular:
+            return 0
+
+        size = self.__size
+        det = -1 if self.__swapCount % 2 == 1 else 1
+
+        for index in range(size):
+            det = det * self.__table[index * size + index]
+
+        if self.__exact:
+            return int(det)
+
+        return det
+
+    def solve(self, values: List[Union[int, float, complex, Quaternion]]) -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Solves A * x = b for x, where A is the factored matrix
+        and b is the given list of values
+
+        :param values: The right-hand side of the equation
+        :return: The solution of the equation
+        :raises ArithmeticError: Raised if the number of values
+            does not match the size of the factored matrix or
+            if the factored matrix is singular
+        """
+
+        size = self.__size
+
+        if len(values) != size:
+            raise ArithmeticError("The number of values must match the size of the Matrix")
+
+        if self.__singular:
+            raise ArithmeticError("Singular matrices cannot be solved against")
+
+        table = self.__table
+
+        if self.__exact:
+            solution = [Fraction(values[index]) if isinstance(values[index], int) else values[index]
+                        for index in self.__permutation]
+        else:
+            solution = [values[index] for index in self.__permutation]
+
+        for rowIndex in range(1, size):
+            rowStart = rowIndex * size
+            value = solution[rowIndex]
+
+            for columnIndex in range(rowIndex):
+                value -= table[rowStart + columnIndex] * solution[columnIndex]
+
+            solution[rowIndex] = value
+
+        for rowIndex in range(size - 1, -1, -1):
+            rowStart = rowIndex * size
+            value = solution[rowIndex]
+
+            for columnIndex in range(rowIndex + 1, size):
+                value -= table[rowStart + columnIndex] * solution[columnIndex]
+
+            solution[rowIndex] = self.__leftDivide(table[rowStart + rowIndex], value)
+
+        if self.__exact:
+            return [float(value) if type(value) is Fraction else value for value in solution]
+
+        return solution
@@ -0,0 +1,506 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Iterator, Optional
+import os
+import tempfile
+import weakref
+from numbers import Complex
+import numpy
+from calc.MathEntity import MathEntity
+from calc.Matrix import Matrix
+from calc.Serialization import HEADER_SIZE, _packMatrixHeader, _unpackMatrixHeader
+
+
+# The number of rows and columns in each square tile that the
+# block-streamed operations read and write at a time
+BLOCK_LENGTH = 1024
+
+# The directory that files of intermediate results are created
+# in. The system's temporary directory is used if this is None
+TEMPORARY_DIRECTORY: Optional[str] = None
+
+
+class MappedMatrix(MathEntity):
+    """
+    Instances of this class represent a matrix of floats or
+    complex numbers whose elements live in a memory-mapped file
+    rather than in memory. Rows are only read from the file when
+    they are accessed, and addition, multiplication and
+    transposition stream through the operands one block at a time,
+    writing their results directly to another mapped file. The file
+    holds the same header and packed little-endian elements that
+    writeEntity writes for an array-backed matrix
+    """
+
+    def __init__(self, path: str, writable: bool=False):
+        """
+        Maps the matrix stored in the given file
+
+        :param path: The path of a file written by writeEntity or
+            createMappedMatrix
+        :param writable: True if elements may be changed through
+            this matrix, False if the file is only read
+        :raises ValueError: Raised if the file does not hold a matrix
+            of floats or complex numbers
+        """
+
+        with open(path, "rb") as file:
+            (rowLength, columnLength, isComplex) = _unpackMatrixHeader(file.read(HEADER_SIZE))
+
+        self.__path = path
+        self.__isComplex = isComplex
+        dtype = "<c16" if isComplex else "<f8"
+
+        # Files without any elements cannot be mapped
+        if rowLength * columnLength == 0:
+            self.__array = numpy.zeros((rowLength, columnLength), dtype=dtype)
+        else:
+            self.__array = numpy.memmap(path, dtype=dtype, mode="r+" if writable else "r",
+                                        offset=HEADER_SIZE, shape=(rowLength, columnLength))
+
+    @staticmethod
+    def createMappedMatrix(rowLength: int, columnLength: int, isComplex: bool=False,
+                           path: Optional[str]=None) -> MappedMatrix:
+        """
+        Creates a file holding a matrix of zeros and maps it.
+        The file is sparse on file systems that support it, so
+        disk space is only used as elements are written
+
+        :param rowLength: The number of rows of the matrix
+        :param columnLength: The number of columns of the matrix
+        :param isComplex: True if the matrix holds complex numbers,
+            False if it holds floats
+        :param path: The path of the file to be created. If None,
+            a temporary file is created in TEMPORARY_DIRECTORY and
+            deleted once the matrix is garbage collected
+        :return: A writable mapped matrix of zeros
+        """
+
+        isTemporary = path is None
+
+        if isTemporary:
+            (handle, path) = tempfile.mkstemp(suffix=".matrix", dir=TEMPORARY_DIRECTORY)
+            os.close(handle)
+
+        header = _packMatrixHeader(rowLength, columnLength, isComplex)
+
+        with open(path, "wb") as file:
+            file.write(header)
+            file.truncate(len(header) + rowLength * columnLength * (16 if isComplex else 8))
+
+        matrix = MappedMatrix(path, True)
+
+        if isTemporary:
+            weakref.finalize(matrix, os.remove, path)
+
+        return matrix
+
+    @staticmethod
+    def createMappedMatrixFromMatrix(matrix: Matrix, path: Optional[str]=None) -> MappedMatrix:
+        """
+        Writes the elements of the given matrix to a mapped file
+
+        :param matrix: The matrix to be written
+        :param path: The path of the file to be created. If None,
+            a temporary file is used
+        :return: A writable mapped matrix with the same elements
+            as the given matrix
+        :raises TypeError: Raised if the given matrix contains
+            quaternions
+        """
+
+        values = matrix.toArray()
+        mapped = MappedMatrix.createMappedMatrix(matrix.rowLength, matrix.columnLength,
+                                                 numpy.iscomplexobj(values), path)
+        mapped.__array[:] = values
+        mapped.flush()
+
+        return mapped
+
+    @property
+    def path(self) -> str:
+        """
+        Returns the path of the file backing this matrix
+
+        :return: The path of the file backing this matrix
+        """
+
+        return self.__path
+
+    @property
+    def rowLength(self) -> int:
+        """
+        Returns the number of rows that this matrix has
+
+        :return: The number of rows that this matrix has
+        """
+
+        return self.__array.shape[0]
+
+    @property
+    def columnLength(self) -> int:
+        """
+        Returns the number of columns that this matrix has
+
+        :return: The number of columns that this matrix has
+        """
+
+        return self.__array.shape[1]
+
+    @property
+    def isComplex(self) -> bool:
+        """
+        Checks if the elements of this matrix are stored as
+        complex numbers
+
+        :return: True if the elements are complex numbers,
+            False if they are floats
+        """
+
+        return self.__isComplex
+
+    @property
+    def isSquare(self) -> bool:
+        """
+        Checks if the number of rows that this matrix has is equal
+        to the number of columns it has
+
+        :return: True if the number of rows that this matrix has is
+            equal to the number of columns it has
+        """
+
+        return self.rowLength == self.columnLength
+
+    def equalDimensions(self, matrix: Union[MappedMatrix, Matrix]) -> bool:
+        """
+        Checks if two matrices have the same number
+        of rows and the same number of columns
+
+        :param matrix: The matrix to be compared with
+            this matrix
+        :return: True if this matrix has the same dimensions
+            as the given matrix, False otherwise
+        """
+
+        return self.rowLength == matrix.rowLength and self.columnLength == matrix.columnLength
+
+    def multipliable(self, matrix: Union[MappedMatrix, Matrix]) -> bool:
+        """
+        Checks if this matrix can be multiplied by another
+        matrix with this matrix on the left side of the
+        multiplication operator
+
+        :param matrix: The matrix on the right side of the
+            multiplication operator
+        :return: True if (self * matrix) is possible, False
+            otherwise
+        """
+
+        return self.columnLength == matrix.rowLength
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements contained in this matrix
+
+        :return: The number of elements contained in this matrix
+        """
+
+        return self.rowLength * self.columnLength
+
+    def __getitem__(self, coordinates: Tuple[int, int]) -> Union[float, complex]:
+        """
+        Returns the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be returned
+        :return: The element at the given row and column indices
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        """
+
+        if coordinates[0] < 0 or coordinates[0] >= self.rowLength or coordinates[1] < 0 or coordinates[1] >= self.columnLength:
+            raise IndexError("Invalid indices")
+
+        return self.__array[coordinates[0], coordinates[1]].item()
+
+    def __setitem__(self, coordinates: Tuple[int, int], value: Union[int, float, complex]) -> None:
+        """
+        Sets the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and
+            column indices of the element to be set
+        :param value: The new value of the element
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        :raises ValueError: Raised if this matrix is not writable
+        :raises TypeError: Raised if a complex number is stored
+            in a matrix of floats
+        """
+
+        if coordinates[0] < 0 or coordinates[0] >= self.rowLength or coordinates[1] < 0 or coordinates[1] >= self.columnLength:
+            raise IndexError("Invalid indices")
+
+        if isinstance(value, complex) and not self.__isComplex:
+            raise TypeError("Complex numbers cannot be stored in a mapped Matrix of floats")
+
+        self.__array[coordinates[0], coordinates[1]] = value
+
+    def row(self, index: int) -> List[Union[float, complex]]:
+        """
+        Reads the row at the given index from the file
+
+        :param index: The index of the row
+        :return: The elements of the row
+        :raises IndexError: Raised if the index is outside the
+            bounds of this matrix
+        """
+
+        if index < 0 or index >= self.rowLength:
+            raise IndexError("Invalid row index")
+
+        return self.__array[index].tolist()
+
+    def rows(self) -> Iterator[List[Union[float, complex]]]:
+        """
+        Returns an iterator that reads the rows of this matrix
+        one at a time
+
+        :return: An iterator over the rows of this matrix
+        """
+
+        for index in range(self.rowLength):
+            yield self.__array[index].tolist()
+
+    def __iter__(self) -> Iterator[Union[float, complex]]:
+        """
+        Returns a row-by-row iterator over the elements
+        of this matrix. Only one row is read into memory
+        at a time
+
+        :return: A row-by-row iterator over the elements
+            of this matrix
+        """
+
+        for row in self.rows():
+            yield from row
+
+    def toArray(self) -> numpy.ndarray:
+        """
+        Returns the memory-mapped array backing this matrix.
+        No elements are read until the array is used
+
+        :return: The 2D memory-mapped array backing this matrix
+        """
+
+        return self.__array
+
+    def toMatrix(self) -> Matrix:
+        """
+        Reads every element of this matrix into an in-memory
+        matrix
+
+        :return: An array-backed matrix with the same elements
+            as this matrix
+        """
+
+        return Matrix.createMatrixFromArray(numpy.array(self.__array, dtype=self.__array.dtype.newbyteorder("=")))
+
+    def flush(self) -> None:
+        """
+        Writes any changes to the elements of this matrix
+        to its file
+
+        :return: None
+        """
+
+        if isinstance(self.__array, numpy.memmap):
+            self.__array.flush()
+
+    @staticmethod
+    def __arrayOf(matrix: Union[MappedMatrix, Matrix]) -> numpy.ndarray:
+        """
+        Returns the elements of the given matrix as a 2D array.
+        The elements of a mapped matrix stay in its file
+
+        :param matrix: A mapped or in-memory matrix
+        :return: A 2D array with the elements of the matrix
+        :raises TypeError: Raised if the given matrix contains
+            quaternions
+        """
+
+        if isinstance(matrix, MappedMatrix):
+            return matrix.__array
+
+        return matrix.toArray()
+
+    @staticmethod
+    def __tiles(rowLength: int, columnLength: int) -> Iterator[Tuple[slice, slice]]:
+        """
+        Returns the square tiles, at most BLOCK_LENGTH rows and
+        columns each, that cover a matrix of the given size
+
+        :param rowLength: The number of rows of the matrix
+        :param columnLength: The number of columns of the matrix
+        :return: An iterator over the row and column slices of
+            each tile
+        """
+
+        for rowStart in range(0, rowLength, BLOCK_LENGTH):
+            for columnStart in range(0, columnLength, BLOCK_LENGTH):
+                yield (slice(rowStart, rowStart + BLOCK_LENGTH), slice(columnStart, columnStart + BLOCK_LENGTH))
+
+    @staticmethod
+    def __product(left: numpy.ndarray, right: numpy.ndarray, path: Optional[str]) -> MappedMatrix:
+        """
+        Multiplies two 2D arrays one tile of the result at a
+        time, so that at most three tiles are held in memory
+
+        :param left: The array on the left side of the product
+        :param right: The array on the right side of the product
+        :param path: The path of the file of the result, or None
+            for a temporary file
+        :return: The product, in a mapped file
+        """
+
+        (rowLength, sharedLength) = left.shape
+        columnLength = right.shape[1]
+        result = MappedMatrix.createMappedMatrix(rowLength, columnLength,
+                                                 numpy.iscomplexobj(left) or numpy.iscomplexobj(right), path)
+        output = result.__array
+
+        for (rows, columns) in MappedMatrix.__tiles(rowLength, columnLength):
+            tile = numpy.zeros(output[rows, columns].shape, dtype=output.dtype)
+
+            for sharedStart in range(0, sharedLength, BLOCK_LENGTH):
+                shared = slice(sharedStart, sharedStart + BLOCK_LENGTH)
+                tile += left[rows, shared] @ right[shared, columns]
+
+            output[rows, columns] = tile
+
+        result.flush()
+
+        return result
+
+    def add(self, matrix: Union[MappedMatrix, Matrix], path: Optional[str]=None) -> MappedMatrix:
+        """
+        Adds the given matrix to this matrix, streaming through
+        both of them one block of rows at a time
+
+        :param matrix: A mapped or in-memory matrix
+        :param path: The path of the file of the result. If None,
+            a temporary file is used
+        :return: The sum of the two matrices, in a mapped file
+        :raises ArithmeticError: Raised if the two matrices do not
+            have the same dimensions
+        :raises TypeError: Raised if the given matrix contains
+            quaternions
+        """
+
+        if not self.equalDimensions(matrix):
+            raise ArithmeticError("Matrices must be of equal dimensions to be added together")
+
+        right = MappedMatrix.__arrayOf(matrix)
+        result = MappedMatrix.createMappedMatrix(self.rowLength, self.columnLength,
+                                                 self.__isComplex or numpy.iscomplexobj(right), path)
+        output = result.__array
+
+        for (rows, columns) in MappedMatrix.__tiles(self.rowLength, self.columnLength):
+            numpy.add(self.__array[rows, columns], right[rows, columns], out=output[rows, columns])
+
+        result.flush()
+
+        return result
+
+    def multiply(self, value: Union[MappedMatrix, Matrix, int, float, complex],
+                 path: Optional[str]=None) -> MappedMatrix:
+        """
+        Multiplies this matrix, on the left, by the given matrix
+        or scalar, streaming through the operands one tile at a
+        time
+
+        :param value: A mapped or in-memory matrix, or a scalar
+        :param path: The path of the file of the result. If None,
+            a temporary file is used
+        :return: The product, in a mapped file
+        :raises ArithmeticError: Raised if this matrix does not
+            have as many columns as the given matrix has rows
+        :raises TypeError: Raised if the given matrix contains
+            quaternions
+        """
+
+        if isinstance(value, Complex):
+            result = MappedMatrix.createMappedMatrix(self.rowLength, self.columnLength,
+                                                     self.__isComplex or numpy.iscomplexobj(value), path)
+            output = result.__array
+
+            for (rows, columns) in MappedMatrix.__tiles(self.rowLength, self.columnLength):
+                numpy.multiply(self.__array[rows, columns], value, out=output[rows, columns])
+
+            result.flush()
+
+            return result
+
+        if not self.multipliable(value):
+            raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+        return MappedMatrix.__product(self.__array, MappedMatrix.__arrayOf(value), path)
+
+    def multiplyOnLeft(self, matrix: Matrix, path: Optional[str]=None) -> MappedMatrix:
+        """
+        Multiplies the given in-memory matrix, on the left, by
+        this matrix, on the right
+
+        :param matrix: The matrix on the left side of the product
+        :param path: The path of the file of the result. If None,
+            a temporary file is used
+        :return: The product, in a mapped file
+        :raises ArithmeticError: Raised if the given matrix does
+            not have as many columns as this matrix has rows
+        :raises TypeError: Raised if the given matrix contains
+            quaternions
+        """
+
+        if not matrix.multipliable(self):
+            raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+        return MappedMatrix.__product(matrix.toArray(), self.__array, path)
+
+    def transpose(self, path: Optional[str]=None) -> MappedMatrix:
+        """
+        Returns the transpose of this matrix, copying one tile
+        at a time
+
+        :param path: The path of the file of the result. If None,
+            a temporary file is used
+        :return: The transpose of this matrix, in a mapped file
+        """
+
+        result = MappedMatrix.createMappedMatrix(self.columnLength, self.rowLength, self.__isComplex, path)
+        output = result.__array
+
+        for (rows, columns) in MappedMatrix.__tiles(self.rowLength, self.columnLength):
+            output[columns, rows] = self.__array[rows, columns].transpose()
+
+        result.flush()
+
+        return result
+
+    def __str__(self) -> str:
+        """
+        Returns a string describing this matrix without reading
+        its elements
+
+        :return: A string describing this matrix
+        """
+
+        return "MappedMatrix(" + str(self.rowLength) + "x" + str(self.columnLength) + ", " + repr(self.__path) + ")"
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of this matrix for the
+        Python shell
+
+        :return: A string representation of this matrix for the
+            Python shell
+        """
+
+        return str(self)
@@ -1,5 +1,15 @@
 from __future__ import annotations
 from typing import Union, Optional
+from calc.Dispatch import addition, subtraction, multiplication, division, exponentiation, equality
+
+
+# The dispatchers are looked up once rather than on every operation
+_add = addition.dispatcher
+_subtract = subtraction.dispatcher
+_multiply = multiplication.dispatcher
+_divide = division.dispatcher
+_exponentiate = exponentiation.dispatcher
+_equals = equality.dispatcher
 
 
 class MathEntity:
@@ -10,6 +20,14 @@ class MathEntity:
     these operations
     """
 
+    __slots__ = ()
+
+    # Makes numpy arrays and scalars return NotImplemented from their
+    # operators, so that an operation with a numpy value on the left
+    # is dispatched by the reflected operator of this entity instead
+    # of numpy treating this entity as a sequence
+    __array_ufunc__ = None
+
     def __add__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
         Performs addition with this entity on the left side of the
@@ -20,9 +38,7 @@ class MathEntity:
         :return: The sum of this entity and the given entity
         """
 
-        from calc._AdditionMediator import doAddition
-
-        return doAddition(self, mathEntity)
+        return _add(self, mathEntity)
 
     def __iadd__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -47,9 +63,7 @@ class MathEntity:
         :return: The sum of the given entity and this entity
         """
 
-        from calc._AdditionMediator import doAddition
-
-        return doAddition(mathEntity, self)
+        return _add(mathEntity, self)
 
     def __sub__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -62,9 +76,7 @@ class MathEntity:
         :return: The difference of this entity and the given entity
         """
 
-        from calc._SubtractionMediator import doSubtraction
-
-        return doSubtraction(self, mathEntity)
+        return _subtract(self, mathEntity)
 
     def __isub__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -90,9 +102,7 @@ class MathEntity:
         :return: The difference of the given entity and this entity
         """
 
-        from calc._SubtractionMediator import doSubtraction
-
-        return doSubtraction(mathEntity, self)
+        return _subtract(mathEntity, self)
 
     def __mul__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -105,9 +115,7 @@ class MathEntity:
         :return: The product of this entity and the given entity
         """
 
-        from calc._MultiplicationMediator import doMultiplication
-
-        return doMultiplication(self, mathEntity)
+        return _multiply(self, mathEntity)
 
     def __imul__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -133,9 +141,7 @@ class MathEntity:
         :return: The product of the given entity and this entity
         """
 
-        from calc._MultiplicationMediator import doMultiplication
-
-        return doMultiplication(mathEntity, self)
+        return _multiply(mathEntity, self)
 
     def __truediv__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -148,9 +154,7 @@ class MathEntity:
         :return: The quotient of this entity and the given entity
         """
 
-        from calc._DivisionMediator import doDivision
-
-        return doDivision(self, mathEntity)
+        return _divide(self, mathEntity)
 
     def __itruediv__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -176,9 +180,7 @@ class MathEntity:
         :return: The quotient of the given entity and this entity
         """
 
-        from calc._DivisionMediator import doDivision
-
-        return doDivision(mathEntity, self)
+        return _divide(mathEntity, self)
 
     def __pow__(self, mathEntity: Union[MathEntity, int, float, complex], modulo: Optional[int]=None) -> Union[MathEntity, float]:
         """
@@ -197,9 +199,7 @@ class MathEntity:
             entity
         """
 
-        from calc._ExponentiationMediator import doExponentiation
-
-        return doExponentiation(self, mathEntity)
+        return _exponentiate(self, mathEntity)
 
     def __ipow__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
         """
@@ -234,9 +234,7 @@ class MathEntity:
             entity
         """
 
-        from calc._ExponentiationMediator import doExponentiation
-
-        return doExponentiation(mathEntity, self)
+        return _exponentiate(mathEntity, self)
 
     def __pos__(self) -> MathEntity:
         """
@@ -269,9 +267,7 @@ class MathEntity:
             false otherwise
         """
 
-        from calc._EqualityMediator import doEquality
-
-        return doEquality(self, mathEntity)
+        return _equals(self, mathEntity)
 
     def __ne__(self, mathEntity: Union[MathEntity, int, float, complex]) -> bool:
         """
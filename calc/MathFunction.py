@@ -3,6 +3,7 @@ import cmath
 from calc.MathEntity import MathEntity
 from calc.Quaternion import Quaternion
 from calc.Matrix import Matrix
+from calc.QuaternionArray import QuaternionArray
 from calc.QuaternionFunction import expQuaternion, sqrtQuaternion, logQuaternion, log10Quaternion, signumQuaternion
 from calc.MatrixFunction import expMatrix, logMatrix, sqrtMatrix, sinMatrix, cosMatrix, tanMatrix, sinhMatrix, \
                                 coshMatrix, tanhMatrix, signumMatrix
@@ -14,15 +15,18 @@ functionDictionary = {("exp", int): math.exp,
                       ("exp", complex): cmath.exp,
                       ("exp", Quaternion): expQuaternion,
                       ("exp", Matrix): expMatrix,
+                      ("exp", QuaternionArray): QuaternionArray.exp,
                       ("log", int): math.log,
                       ("log", float): math.log,
                       ("log", complex): cmath.log,
                       ("log", Quaternion): logQuaternion,
                       ("log", Matrix): logMatrix,
+                      ("log", QuaternionArray): QuaternionArray.log,
                       ("log10", int): math.log10,
                       ("log10", float): math.log10,
                       ("log10", complex): cmath.log10,
                       ("log10", Quaternion): log10Quaternion,
+                      ("log10", QuaternionArray): lambda quaternions: quaternions.log(10),
                       ("sqrt", int): math.sqrt,
                       ("sqrt", float): math.sqrt,
                       ("sqrt", complex): cmath.sqrt,
@@ -1,8 +1,17 @@
 from __future__ import annotations
-from typing import Union, List, Tuple, Iterator, NoReturn
+from typing import Union, List, Tuple, Iterator, NoReturn, Callable, TYPE_CHECKING
 from calc.MathEntity import MathEntity
 from calc.Quaternion import Quaternion
 from copy import copy, deepcopy
+from numbers import Complex
+from operator import add, sub, mul, truediv
+import numpy
+
+if TYPE_CHECKING:
+    from calc.Vector import Vector
+    from calc.LUDecomposition import LUDecomposition
+    from calc.QRDecomposition import QRDecomposition
+    from calc.Expression import LazyExpression
 
 
 class Matrix(MathEntity):
@@ -10,7 +19,9 @@ class Matrix(MathEntity):
     Instances of this class represent mathematical
     matrices. Matrices are containers of real numbers,
     complex numbers and/or quaternions which are arranged
-    into rows and columns
+    into rows and columns. Matrices of real or complex numbers
+    can instead be backed by a contiguous numpy array, which
+    lets them be passed to numpy and scipy without copying
     """
 
     def __init__(self, table: List[List[Union[int, float, complex, Quaternion]]]):
@@ -23,6 +34,9 @@ class Matrix(MathEntity):
         """
         self.__table = []
         self.__rowLength = len(table)
+        self.__luDecomposition = None
+        self.__qrDecomposition = None
+        self.__powerCache = None
 
         if self.__rowLength == 0:
             self.__columnLength = 0
@@ -36,7 +50,10 @@ class Matrix(MathEntity):
     def createMatrixFrom1DList(table: List[Union[int, float, complex, Quaternion]],
                                rowLength: int, columnLength: int) -> Matrix:
         """
-        Creates a matrix using the given list
+        Creates a matrix using the given list. The list is copied,
+        so that later changes to it do not reach the matrix, whose
+        cached decompositions and powers assume that its elements
+        only change through it
 
         :param table: The list whose elements will be placed into
             the new matrix
@@ -49,12 +66,68 @@ class Matrix(MathEntity):
         """
 
         mat = Matrix([])
-        mat.__table = table
+        mat.__table = copy(table)
         mat.__rowLength = rowLength
         mat.__columnLength = columnLength
 
         return mat
 
+    @staticmethod
+    def createMatrixFromArray(array: numpy.ndarray) -> Matrix:
+        """
+        Creates a matrix whose elements are stored in a
+        contiguous float64 or complex128 array. The elements
+        are copied, so that later changes to the given array
+        do not reach the matrix
+
+        :param array: A 2D array with the elements of the
+            new matrix
+        :return: A matrix backed by the given array
+        :raises ValueError: Raised if the given array is not
+            two-dimensional
+        """
+
+        if array.ndim != 2:
+            raise ValueError("Only 2D arrays can be converted to Matrices")
+
+        dtype = numpy.complex128 if numpy.iscomplexobj(array) else numpy.float64
+        table = numpy.ascontiguousarray(array, dtype=dtype).reshape(-1)
+
+        return Matrix.createMatrixFrom1DList(table, array.shape[0], array.shape[1])
+
+    @property
+    def isArrayBacked(self) -> bool:
+        """
+        Checks if the elements of this matrix are stored
+        in a numpy array rather than a list
+
+        :return: True if this matrix is backed by a numpy
+            array, False otherwise
+        """
+
+        return isinstance(self.__table, numpy.ndarray)
+
+    def toArray(self) -> numpy.ndarray:
+        """
+        Returns the elements of this matrix as a 2D numpy
+        array. If this matrix is backed by an array, the
+        returned array is a view of it, so no elements are
+        copied
+
+        :return: A 2D array with the same elements as this
+            matrix
+        :raises TypeError: Raised if this matrix contains
+            quaternions
+        """
+
+        if self.isArrayBacked:
+            return self.__table.reshape(self.rowLength, self.columnLength)
+
+        if any(type(value) is Quaternion for value in self.__table):
+            raise TypeError("Matrices containing Quaternions cannot be converted to arrays")
+
+        return numpy.array(self.__table).reshape(self.rowLength, self.columnLength)
+
     def __len__(self) -> int:
         """
         Returns the number of elements contained in this matrix
@@ -157,7 +230,12 @@ class Matrix(MathEntity):
         if coordinates[0] < 0 or coordinates[0] >= self.rowLength or coordinates[1] < 0 or coordinates[1] >= self.columnLength:
             raise IndexError("Invalid indices")
 
-        return self.__table[coordinates[0] * self.columnLength + coordinates[1]]
+        value = self.__table[coordinates[0] * self.columnLength + coordinates[1]]
+
+        if self.isArrayBacked:
+            return value.item()
+
+        return value
 
     def __setitem__(self, coordinates: Tuple[int, int], value: Union[int, float, complex, Quaternion]) -> NoReturn:
         """
@@ -175,7 +253,28 @@ class Matrix(MathEntity):
         if coordinates[0] < 0 or coordinates[0] >= self.rowLength or coordinates[1] < 0 or coordinates[1] >= self.columnLength:
             raise IndexError("Invalid indices")
 
+        if self.isArrayBacked:
+            if type(value) is Quaternion:
+                self.__table = self.__table.tolist()
+            elif type(value) is complex and self.__table.dtype != numpy.complex128:
+                self.__table = self.__table.astype(numpy.complex128)
+
         self.__table[coordinates[0] * self.columnLength + coordinates[1]] = value
+        self.__invalidateCaches()
+
+    def __invalidateCaches(self) -> NoReturn:
+        """
+        Discards the decompositions and powers that were
+        computed from the previous elements of this matrix
+
+        :return: None
+        """
+
+        self.__luDecomposition = None
+        self.__qrDecomposition = None
+
+        if self.__powerCache is not None:
+            self.__powerCache = {}
 
     def __contains__(self, searchValue: Union[int, float, complex, Quaternion]) -> bool:
         """
@@ -187,6 +286,9 @@ class Matrix(MathEntity):
             given value, False otherwise
         """
 
+        if self.isArrayBacked:
+            return type(searchValue) is not Quaternion and bool((self.__table == searchValue).any())
+
         return searchValue in self.__table
 
     @staticmethod
@@ -221,6 +323,9 @@ class Matrix(MathEntity):
             if they have one
         """
 
+        if self.isArrayBacked:
+            return Matrix.createMatrixFrom1DList(self.__table.conjugate(), self.rowLength, self.columnLength)
+
         newTable = []
 
         for value in self:
@@ -231,6 +336,24 @@ class Matrix(MathEntity):
 
         return Matrix.createMatrixFrom1DList(newTable, self.rowLength, self.columnLength)
 
+    def lu(self) -> LUDecomposition:
+        """
+        Returns the LU decomposition of this matrix,
+        computing it if it has not been computed since
+        this matrix was last changed
+
+        :return: The LU decomposition of this matrix
+        :raises ArithmeticError: Raised if this matrix
+            is not square
+        """
+
+        if self.__luDecomposition is None:
+            from calc.LUDecomposition import LUDecomposition
+
+            self.__luDecomposition = LUDecomposition(self)
+
+        return self.__luDecomposition
+
     @property
     def determinant(self) -> Union[int, float, complex, Quaternion]:
         """
@@ -247,73 +370,191 @@ class Matrix(MathEntity):
         if self.rowLength == 1:
             return self[(0, 0)]
 
-        return Matrix.__determinant(self.__table, self.rowLength)
+        return self.lu().determinant
 
-    @staticmethod
-    def __determinant(table: List[Union[int, float, complex, Quaternion]], size: int) -> Union[int, float, complex, Quaternion]:
+    def inverse(self) -> Matrix:
         """
-        Computes the determinant of the matrix represented
-        by the given table
+        Returns the inverse of this matrix
 
-        :param table: The matrix whose determinant is to be
-            computed
-        :param size: The number of rows in the table
-        :return: The determinant of the matrix represented
-            by the table
+        :return: The inverse of this matrix
+        :raises ArithmeticError: Raised if this
+            matrix is not square or is singular
         """
 
-        if size == 2:
-            return table[0] * table[3] - table[2] * table[1]
+        if not self.isSquare:
+            raise ArithmeticError("Only square Matrices have inverses")
+
+        decomposition = self.lu()
+
+        if decomposition.isSingular:
+            raise ArithmeticError("Singular Matrices do not have inverses")
+
+        size = self.rowLength
+        table = [0] * (size * size)
+
+        for columnIndex in range(size):
+            unitColumn = [0] * size
+            unitColumn[columnIndex] = 1
+
+            for (rowIndex, value) in enumerate(decomposition.solve(unitColumn)):
+                table[rowIndex * size + columnIndex] = value
+
+        return Matrix.createMatrixFrom1DList(table, size, size)
+
+    def qr(self) -> QRDecomposition:
+        """
+        Returns the QR decomposition of this matrix,
+        computing it if it has not been computed since
+        this matrix was last changed
+
+        :return: The QR decomposition of this matrix
+        :raises ArithmeticError: Raised if this matrix
+            has fewer rows than columns or contains
+            quaternions
+        """
+
+        if self.__qrDecomposition is None:
+            from calc.QRDecomposition import QRDecomposition
+
+            self.__qrDecomposition = QRDecomposition(self)
+
+        return self.__qrDecomposition
+
+    def solve(self, rhs: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        """
+        Solves this matrix times x equals the given vector or
+        matrix for x. Square matrices are solved with their LU
+        decomposition. Matrices with more rows than columns are
+        solved in the least-squares sense with their QR
+        decomposition. Either decomposition is reused by later
+        calls, so each further right-hand side only costs a
+        forward and a backward substitution
+
+        :param rhs: A vector or a matrix whose columns are each
+            a right-hand side of the equation
+        :return: The solution of the equation, of the same type
+            as the given right-hand side
+        :raises ArithmeticError: Raised if this matrix has fewer
+            rows than columns, if it is singular, or if the
+            right-hand side does not have as many rows as this
+            matrix
+        """
+
+        from calc.Vector import Vector
+
+        if self.isSquare:
+            decomposition = self.lu()
+
+            if decomposition.isSingular:
+                raise ArithmeticError("Singular Matrices cannot be solved against")
         else:
-            det = 0
+            decomposition = self.qr()
 
-            # Move through the first row of this matrix
-            # Ignore values in the current column
-            for column in range(size):
-                subtable = []
+        if isinstance(rhs, Vector):
+            return Vector(decomposition.solve(rhs.toList()))
 
-                for rowIndex in range(1, size):  # Start with 1 to ignore first row
-                    for columnIndex in range(size):
+        if rhs.rowLength != self.rowLength:
+            raise ArithmeticError("The right-hand side must have the same row length as the Matrix")
 
-                        # Skip the value that is in the column being ignored
-                        if columnIndex != column:
-                            subtable.append(table[rowIndex * size + columnIndex])
+        rhsColumns = rhs.columnLength
+        rhsTable = list(rhs)
+        table = [0] * (self.columnLength * rhsColumns)
 
-                det += ((-1) ** column) * table[column] * Matrix.__determinant(subtable, size - 1)
+        for columnIndex in range(rhsColumns):
+            column = rhsTable[columnIndex::rhsColumns]
 
-            return det
+            for (rowIndex, value) in enumerate(decomposition.solve(column)):
+                table[rowIndex * rhsColumns + columnIndex] = value
 
-    def inverse(self) -> Matrix:
+        return Matrix.createMatrixFrom1DList(table, self.columnLength, rhsColumns)
+
+    def cachePowers(self, enabled: bool=True) -> NoReturn:
         """
-        Returns the inverse of this matrix
+        Enables or disables caching of the repeated squares
+        of this matrix (A^2, A^4, A^8, ...) that power()
+        computes. While enabled, later calls to power()
+        reuse the cached squares until this matrix is
+        changed
 
-        :return: The inverse of this matrix
-        :raises ArithmeticError: Raised if this
-            matrix is not square
+        :param enabled: True to enable the cache, False to
+            disable it and discard its contents
+        :return: None
+        """
+
+        if not enabled:
+            self.__powerCache = None
+        elif self.__powerCache is None:
+            self.__powerCache = {}
+
+    def power(self, exponent: int) -> Matrix:
+        """
+        Takes this matrix to the power of the given integer
+        using exponentiation by squaring. Negative exponents
+        take the inverse of this matrix to the power of the
+        absolute value of the exponent
+
+        :param exponent: The integer power to take this
+            matrix to
+        :return: The result of taking this matrix to the power
+            of the given integer
+        :raises ArithmeticError: Raised if this matrix is not
+            square or if the exponent is negative and this
+            matrix is singular
         """
 
         if not self.isSquare:
-            raise ArithmeticError("Only square Matrices have inverses")
+            raise ArithmeticError("Only square Matrices can be taken to an integer power")
+
+        if exponent < 0:
+            return self.inverse().power(-exponent)
 
-        tempMatrix = deepcopy(self)
-        newMatrix = Matrix.identity(self.rowLength)
+        if exponent == 0:
+            return Matrix.identity(self.rowLength)
 
-        for index1 in range(tempMatrix.rowLength):
-            divisor = tempMatrix[(index1, index1)]
+        result = None
+        square = self
+        squareIndex = 0
 
-            for index2 in range(tempMatrix.columnLength):
-                tempMatrix[(index1, index2)] /= divisor
-                newMatrix[(index1, index2)] /= divisor
+        while True:
+            if exponent & 1:
+                result = square if result is None else result * square
+
+            exponent >>= 1
+
+            if exponent == 0:
+                break
+
+            squareIndex += 1
+            square = self.__square(square, squareIndex)
+
+        # A power of two is either this matrix or a cached square,
+        # neither of which may be handed out to be changed
+        if result is square:
+            return deepcopy(result)
+
+        return result
+
+    def __square(self, square: Matrix, squareIndex: int) -> Matrix:
+        """
+        Squares the given power of this matrix, consulting
+        the power cache if it is enabled
+
+        :param square: This matrix to the power of 2^(squareIndex - 1)
+        :param squareIndex: The base 2 logarithm of the power
+            being computed
+        :return: This matrix to the power of 2^squareIndex
+        """
 
-            for index2 in range(tempMatrix.rowLength):
-                if tempMatrix[(index1, index2)] != 1:
-                    coefficient = tempMatrix[(index2, index1)]
+        if self.__powerCache is None:
+            return square * square
 
-                    for index3 in range(tempMatrix.columnLength):
-                        tempMatrix[(index2, index3)] -= coefficient * tempMatrix[(index1, index3)]
-                        newMatrix[(index2, index3)] -= coefficient * newMatrix[(index1, index3)]
+        cached = self.__powerCache.get(squareIndex)
 
-        return newMatrix
+        if cached is None:
+            cached = square * square
+            self.__powerCache[squareIndex] = cached
+
+        return cached
 
     def transpose(self) -> Matrix:
         """
@@ -322,6 +563,9 @@ class Matrix(MathEntity):
         :return: The transpose of this matrix
         """
 
+        if self.isArrayBacked:
+            return Matrix.createMatrixFromArray(self.toArray().transpose())
+
         table = []
 
         for colIndex in range(self.columnLength):
@@ -338,6 +582,9 @@ class Matrix(MathEntity):
             of this matrix
         """
 
+        if self.isArrayBacked:
+            return self.toArray().tolist()
+
         table = []
 
         for rowIndex in range(self.rowLength):
@@ -359,11 +606,156 @@ class Matrix(MathEntity):
             of this matrix
         """
 
+        if self.isArrayBacked:
+            return iter(self.__table.tolist())
+
         return iter(self.__table)
 
+    def lazy(self) -> LazyExpression:
+        """
+        Returns an expression of this matrix whose elementwise
+        additions, subtractions and multiplications or divisions
+        by scalars are combined into one pass over the elements
+        when the result is needed, rather than each creating a
+        temporary matrix
+
+        :return: A lazily evaluated expression of this matrix
+        """
+
+        from calc.Expression import LazyExpression
+
+        return LazyExpression(self)
+
+    def __updateElements(self, operand: Union[Matrix, int, float, complex, Quaternion],
+                         operation: Callable, ufunc: numpy.ufunc) -> NoReturn:
+        """
+        Replaces every element of this matrix with the result of
+        the given operation on it and the corresponding element
+        of the given matrix, or the given scalar. The elements are
+        written into the existing table, whose type only changes
+        where the out-of-place operation would also change it
+
+        :param operand: A matrix of the same dimensions as this
+            matrix, or a scalar
+        :param operation: The operation applied to each element
+        :param ufunc: The numpy equivalent of the operation
+        :return: None
+        """
+
+        isMatrix = isinstance(operand, Matrix)
+
+        if self.isArrayBacked:
+            if isMatrix and operand.isArrayBacked:
+                values = operand.__table
+            elif not isMatrix and type(operand) is not Quaternion:
+                values = operand
+            else:
+                values = None
+                self.__table = self.__table.tolist()
+
+            if values is not None:
+                if numpy.iscomplexobj(values) and self.__table.dtype != numpy.complex128:
+                    self.__table = self.__table.astype(numpy.complex128)
+
+                ufunc(self.__table, values, out=self.__table)
+
+        if not self.isArrayBacked:
+            table = self.__table
+
+            if isMatrix:
+                table[:] = map(operation, table, operand)
+            else:
+                table[:] = [operation(value, operand) for value in table]
+
+        self.__invalidateCaches()
+
+    def __iadd__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Adds another matrix of the same dimensions to this matrix
+        in place. Other entities are added as by the addition
+        operator
+
+        :param mathEntity: The entity being added to this matrix
+        :return: This matrix, or the sum if it could not be
+            computed in place
+        :raises ArithmeticError: Raised if the given matrix does
+            not have the same dimensions as this matrix
+        """
+
+        if isinstance(mathEntity, Matrix):
+            if not self.equalDimensions(mathEntity):
+                raise ArithmeticError("Matrices must be of equal dimensions to be added together")
+
+            self.__updateElements(mathEntity, add, numpy.add)
+
+            return self
+
+        return self + mathEntity
+
+    def __isub__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Subtracts another matrix of the same dimensions from this
+        matrix in place. Other entities are subtracted as by the
+        subtraction operator
+
+        :param mathEntity: The entity being subtracted from this
+            matrix
+        :return: This matrix, or the difference if it could not be
+            computed in place
+        :raises ArithmeticError: Raised if the given matrix does
+            not have the same dimensions as this matrix
+        """
+
+        if isinstance(mathEntity, Matrix):
+            if not self.equalDimensions(mathEntity):
+                raise ArithmeticError("Matrices must be of equal dimensions to be subtracted from each other")
+
+            self.__updateElements(mathEntity, sub, numpy.subtract)
+
+            return self
+
+        return self - mathEntity
+
+    def __imul__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Multiplies every element of this matrix by a scalar in
+        place. Matrix and vector products change the dimensions,
+        so they are computed as by the multiplication operator
+
+        :param mathEntity: The entity this matrix is multiplied by
+        :return: This matrix, or the product if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, (Complex, Quaternion)):
+            self.__updateElements(mathEntity, mul, numpy.multiply)
+
+            return self
+
+        return self * mathEntity
+
+    def __itruediv__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Divides every element of this matrix by a scalar in place.
+        Other entities are divided by as by the division operator
+
+        :param mathEntity: The entity this matrix is divided by
+        :return: This matrix, or the quotient if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, (Complex, Quaternion)):
+            self.__updateElements(mathEntity, truediv, numpy.true_divide)
+
+            return self
+
+        return self / mathEntity
+
     def __copy__(self: Matrix) -> Matrix:
         """
-        Creates a shallow copy of this matrix
+        Creates a shallow copy of this matrix. The elements are
+        shared, but the table holding them is not, so that
+        changing either matrix does not change the other
 
         :return: A shallow copy of this matrix
         """
@@ -378,7 +770,7 @@ class Matrix(MathEntity):
         :return: A deep copy of this matrix
         """
 
-        return Matrix.createMatrixFrom1DList(copy(self.__table), self.rowLength, self.columnLength)
+        return Matrix.createMatrixFrom1DList(self.__table, self.rowLength, self.columnLength)
 
     def __hash__(self) -> int:
         """
@@ -1,12 +1,13 @@
-import scipy
+import numpy
 from calc.Matrix import Matrix
 from scipy.linalg import expm, logm, sinm, cosm, tanm, sinhm, coshm, tanhm, signm
 
 
-def _createScipyArray(matrix: Matrix) -> scipy.ndarray:
+def _createScipyArray(matrix: Matrix) -> numpy.ndarray:
     """
-    Places the elements of a given matrix into an
-    ndarray
+    Returns the elements of a given matrix as an
+    ndarray. Matrices backed by an array are passed
+    through without copying their elements
 
     :param matrix: The matrix whose elements will
         be placed into a an ndarray
@@ -14,17 +15,7 @@ def _createScipyArray(matrix: Matrix) -> scipy.ndarray:
         and elements as the given matrix
     """
 
-    table = []
-
-    for rowIndex in range(matrix.rowLength):
-        row = []
-
-        for columnIndex in range(matrix.columnLength):
-            row.append(matrix[(rowIndex, columnIndex)])
-
-        table.append(row)
-
-    return scipy.array(table)
+    return matrix.toArray()
 
 
 def expMatrix(matrix: Matrix) -> Matrix:
@@ -38,7 +29,7 @@ def expMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = expm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist())
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def logMatrix(matrix: Matrix) -> Matrix:
@@ -52,7 +43,7 @@ def logMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = logm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist())
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def sqrtMatrix(matrix: Matrix) -> Matrix:
@@ -78,7 +69,7 @@ def sinMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = sinm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist()), matrix.rowLength, matrix.columnLength
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def cosMatrix(matrix: Matrix) -> Matrix:
@@ -92,7 +83,7 @@ def cosMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = cosm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist()), matrix.rowLength, matrix.columnLength
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def tanMatrix(matrix: Matrix) -> Matrix:
@@ -106,7 +97,7 @@ def tanMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = tanm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist()), matrix.rowLength, matrix.columnLength
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def sinhMatrix(matrix: Matrix) -> Matrix:
@@ -120,7 +111,7 @@ def sinhMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = sinhm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist()), matrix.rowLength, matrix.columnLength
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def coshMatrix(matrix: Matrix) -> Matrix:
@@ -134,7 +125,7 @@ def coshMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = coshm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist()), matrix.rowLength, matrix.columnLength
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def tanhMatrix(matrix: Matrix) -> Matrix:
@@ -148,7 +139,7 @@ def tanhMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = tanhm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist())
+    return Matrix.createMatrixFromArray(scipyArray)
 
 
 def signumMatrix(matrix: Matrix) -> Matrix:
@@ -161,4 +152,4 @@ def signumMatrix(matrix: Matrix) -> Matrix:
     """
 
     scipyArray = signm(_createScipyArray(matrix))
-    return Matrix(scipyArray.tolist()), matrix.rowLength, matrix.columnLength
+    return Matrix.createMatrixFromArray(scipyArray)
@@ -1,9 +1,77 @@
 from __future__ import annotations
-from typing import Union, List, Iterator, NoReturn
+from typing import Union, List, Tuple, Iterator, NoReturn, Callable, TYPE_CHECKING
 from sys import float_info
+from numbers import Complex
+from operator import add, sub, mul, truediv
+from itertools import zip_longest
+from bisect import bisect_left, insort
+from random import randrange
 from calc.MathEntity import MathEntity
 from calc.Quaternion import Quaternion
 from calc.MathFunction import sqrtMath
+from calc.Summary import Summary
+from calc.FrequencyTable import FrequencyTable
+
+if TYPE_CHECKING:
+    from calc.Expression import LazyExpression
+
+
+def _select(values: List[Union[int, float]], rank: int) -> Union[int, float]:
+    """
+    Finds the value that would be at the given index if the given
+    values were sorted, in expected linear time. Each step
+    partitions the remaining values around a random pivot and
+    only keeps the side that contains the index. A NaN is neither
+    less than, greater than nor equal to any pivot, so it would be
+    dropped by every partition. The first step therefore checks
+    that each value fell on one side of the pivot, and if a value
+    did not, the values are sorted instead, as they were before
+    values were selected
+
+    :param values: The values to be searched, which are not
+        modified
+    :param rank: The index of the value in sorted order
+    :return: The value at the given index in sorted order
+    :raises IndexError: Raised if the index is outside the bounds
+        of the values
+    """
+
+    if rank < 0 or rank >= len(values):
+        raise IndexError("Invalid index")
+
+    allValues = values
+    isFirstStep = True
+
+    while True:
+        if len(values) == 0:
+            raise IndexError("Invalid index")
+
+        pivot = values[randrange(len(values))]
+        lower = [value for value in values if value < pivot]
+        (equalCount, higher) = (None, None)
+
+        if isFirstStep:
+            isFirstStep = False
+            equalCount = values.count(pivot)
+            higher = [value for value in values if value > pivot]
+
+            if len(lower) + equalCount + len(higher) != len(values):
+                return sorted(allValues)[rank]
+
+        if rank < len(lower):
+            values = lower
+            continue
+
+        rank -= len(lower)
+
+        if equalCount is None:
+            equalCount = values.count(pivot)
+
+        if rank < equalCount:
+            return pivot
+
+        rank -= equalCount
+        values = higher if higher is not None else [value for value in values if value > pivot]
 
 
 class NumberList(MathEntity):
@@ -18,6 +86,7 @@ class NumberList(MathEntity):
 
         self.__data = data
         self.__sortedData = None
+        self.__hasSelected = False
 
     def __len__(self) -> int:
         """
@@ -62,8 +131,40 @@ class NumberList(MathEntity):
         if index < 0 or index >= len(self):
             raise IndexError("Invalid index")
 
+        if self.__sortedData is not None:
+            self.__updateSortedData(self.__data[index], value)
+
         self.__data[index] = value
-        self.__sortedData = None
+
+    def __updateSortedData(self, oldValue: Union[int, float], newValue: Union[int, float]) -> NoReturn:
+        """
+        Replaces a value in the sorted copy of this list, finding
+        both positions by binary search, so that the copy does not
+        need to be sorted again. The copy is discarded if the new
+        value cannot be ordered with the others, or is a NaN,
+        which would leave the copy out of order
+
+        :param oldValue: The value being replaced
+        :param newValue: The value replacing it
+        :return: None
+        """
+
+        sortedData = self.__sortedData
+
+        if newValue != newValue:
+            self.__sortedData = None
+            return
+
+        try:
+            position = bisect_left(sortedData, oldValue)
+
+            if position == len(sortedData) or sortedData[position] != oldValue:
+                raise ValueError
+
+            del sortedData[position]
+            insort(sortedData, newValue)
+        except (TypeError, ValueError):
+            self.__sortedData = None
 
     def min(self) -> Union[int, float]:
         minValue = float_info.max
@@ -75,7 +176,7 @@ class NumberList(MathEntity):
         return minValue
 
     def max(self) -> Union[int, float]:
-        maxValue = float_info.min
+        maxValue = -float_info.max
 
         for value in self:
             if value > maxValue:
@@ -92,65 +193,153 @@ class NumberList(MathEntity):
 
         return sum(self) / len(self)
 
+    def __orderStatistics(self, *ranks: int) -> List[Union[int, float]]:
+        """
+        Returns the values at the given indices in sorted order.
+        The sorted copy of this list is used if there is one. The
+        first query without it selects the values in linear time,
+        and later queries sort a copy of this list, which is then
+        kept up to date when elements are set. A copy containing
+        a NaN is not kept, since it cannot be kept in order
+
+        :param ranks: The indices of the values in sorted order
+        :return: The values at the given indices in sorted order
+        """
+
+        if self.__sortedData is None and self.__hasSelected:
+            sortedData = sorted(self.__data)
+
+            if any(value != value for value in sortedData):
+                return [sortedData[rank] for rank in ranks]
+
+            self.__sortedData = sortedData
+
+        if self.__sortedData is not None:
+            return [self.__sortedData[rank] for rank in ranks]
+
+        self.__hasSelected = True
+
+        return [_select(self.__data, rank) for rank in ranks]
+
     def median(self) -> Union[int, float]:
         """
-        Returns the median of thsi list of numbers
+        Returns the median of this list of numbers. The middle
+        value is selected without sorting the list
 
         :return: The median of this list of numbers
-        :raises AttributeError: Raised if this list
+        :raises TypeError: Raised if this list
             contains either complex number or
             quaternions
+        :raises ValueError: Raised if this list is empty
         """
 
-        if self.__sortedData is None:
-            self.__sortedData = sorted(self.__data)
+        if len(self) == 0:
+            raise ValueError("Quantiles of an empty NumberList are undefined")
 
-        mid = round(len(self) / 2)
+        mid = len(self) // 2
 
         if len(self) % 2 == 0:
-            return (self.__sortedData[mid] + self.__sortedData[mid + 1]) / 2
+            (lowerValue, upperValue) = self.__orderStatistics(mid - 1, mid)
+
+            return (lowerValue + upperValue) / 2
         else:
-            return self.__sortedData[mid]
+            return self.__orderStatistics(mid)[0]
+
+    def quantile(self, q: Union[int, float]) -> Union[int, float]:
+        """
+        Returns the given quantile of this list of numbers,
+        interpolating linearly between the two closest values
+        when the quantile falls between them
+
+        :param q: The quantile, between 0 and 1
+        :return: The value below which the given fraction of this
+            list lies
+        :raises TypeError: Raised if this list
+            contains either complex number or
+            quaternions
+        :raises ValueError: Raised if this list is empty or if
+            the quantile is not between 0 and 1
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be between 0 and 1")
+        if len(self) == 0:
+            raise ValueError("Quantiles of an empty NumberList are undefined")
+
+        position = (len(self) - 1) * q
+        rank = int(position)
+        fraction = position - rank
+        if fraction == 0:
+            return self.__orderStatistics(rank)[0]
+
+        (lowerValue, upperValue) = self.__orderStatistics(rank, rank + 1)
+
+        return lowerValue + (upperValue - lowerValue) * fraction
+
+    def percentiles(self, percents: List[Union[int, float]]) -> List[Union[int, float]]:
+        """
+        Returns the given percentiles of this list of numbers,
+        interpolating as quantile does. A sorted copy of this
+        list is made if there is not one already, since several
+        values are looked up
+
+        :param percents: The percentiles, each between 0 and 100
+        :return: The value at each of the given percentiles
+        :raises TypeError: Raised if this list
+            contains either complex number or
+            quaternions
+        :raises ValueError: Raised if this list is empty or if a
+            percentile is not between 0 and 100
+        """
+
+        if len(percents) > 1:
+            self.__hasSelected = True
+
+        return [self.quantile(percent / 100) for percent in percents]
+
+    def frequencies(self) -> FrequencyTable:
+        """
+        Counts how many times each number occurs in this list
+
+        :return: The frequency table of this list of numbers
+        """
+
+        return FrequencyTable(self.__data)
 
     def mode(self) -> List[Union[int, float, complex, Quaternion]]:
         """
-        Returns the mode of this list of numbers
+        Returns the mode of this list of numbers, which is every
+        number that occurs the most often
 
         :return: The mode of this list of numbers
         """
 
-        counts = {}
-
-        for value in self:
-            if value in counts:
-                counts[value] += 1
-            else:
-                counts[value] = 1
+        return self.frequencies().mode()
 
-        modes = []
-        countOfModes = -1
+    def topK(self, k: int) -> List[Tuple[Union[int, float, complex, Quaternion], int]]:
+        """
+        Returns the given number of numbers that occur the most
+        often in this list
 
-        for (value, count) in counts.items():
-            if count > countOfModes:
-                modes.clear()
-                modes.append(value)
-                countOfModes = count
-            elif count == countOfModes and count != -1:
-                modes.append(value)
+        :param k: The number of numbers to be returned
+        :return: The most frequent numbers and their counts, from
+            the most frequent to the least frequent
+        :raises ValueError: Raised if k is negative
+        """
 
-        return modes
+        return self.frequencies().topK(k)
 
     def midrange(self) -> Union[int, float]:
         """
         Returns the midrange of this list of numbers
 
         :return: The midrange of this list of numbers
-        :raises AttributeError: Raised if this list
+        :raises TypeError: Raised if this list
             contains complex numbers or quaternions
         """
 
         if self.__sortedData is None:
-            self.__sortedData = sorted(self.__data)
+            return (min(self.__data) + max(self.__data)) / 2
 
         return (self.__sortedData[0] + self.__sortedData[len(self) - 1]) / 2
 
@@ -159,12 +348,12 @@ class NumberList(MathEntity):
         Returns the range of this list of numbers
 
         :return: The range of this list of numbers
-        :raises AttributeError: Raised if this list
+        :raises TypeError: Raised if this list
             contains complex numbers or quaternions
         """
 
         if self.__sortedData is None:
-            self.__sortedData = sorted(self.__data)
+            return max(self.__data) - min(self.__data)
 
         return self.__sortedData[len(self) - 1] - self.__sortedData[0]
 
@@ -194,6 +383,37 @@ class NumberList(MathEntity):
 
         return sqrtMath(self.variance())
 
+    def summary(self) -> Summary:
+        """
+        Computes the descriptive statistics of this list of numbers
+        together. The mean is computed once and shared with the
+        variance, the minimum and maximum are shared with the range
+        and midrange, and nothing is sorted. The median and mode
+        are computed when they are first read from the summary
+
+        :return: The summary of this list of numbers
+        :raises ValueError: Raised if this list is empty
+        """
+
+        data = self.__data
+        count = len(data)
+
+        if count == 0:
+            raise ValueError("An empty NumberList has no summary")
+
+        meanValue = sum(data) / count
+        varianceValue = sum([(value - meanValue) ** 2 for value in data]) / (count - 1) if count > 1 else None
+
+        if self.__sortedData is not None:
+            (minValue, maxValue) = (self.__sortedData[0], self.__sortedData[count - 1])
+        else:
+            try:
+                (minValue, maxValue) = (min(data), max(data))
+            except TypeError:
+                (minValue, maxValue) = (None, None)
+
+        return Summary(count, minValue, maxValue, meanValue, varianceValue, self.median, self.mode)
+
     def __iter__(self) -> Iterator[Union[int, float, complex, Quaternion]]:
         """
         Returns an iterator over the elements of this list of
@@ -205,6 +425,129 @@ class NumberList(MathEntity):
 
         return iter(self.__data)
 
+    def lazy(self) -> LazyExpression:
+        """
+        Returns an expression of this list whose elementwise
+        operations are combined into one pass over the elements
+        when the result is needed, rather than each creating a
+        temporary list
+
+        :return: A lazily evaluated expression of this list
+        """
+
+        from calc.Expression import LazyExpression
+
+        return LazyExpression(self)
+
+    def __updateElements(self, operand: Union[NumberList, int, float, complex, Quaternion],
+                         operation: Callable) -> NoReturn:
+        """
+        Replaces every element of this list with the result of
+        the given operation on it and the corresponding element
+        of another list, or a scalar. A shorter list is padded
+        with zeros, as in the out-of-place operations
+
+        :param operand: A list of numbers or a scalar
+        :param operation: The operation applied to each element
+        :return: None
+        """
+
+        data = self.__data
+
+        if isinstance(operand, NumberList):
+            data[:] = [operation(leftValue, rightValue)
+                       for (leftValue, rightValue)
+                       in zip_longest(data, operand, fillvalue=0)]
+        else:
+            data[:] = [operation(value, operand) for value in data]
+
+        self.__sortedData = None
+        self.__hasSelected = False
+
+    def __iadd__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Adds a number, or the elements of another list of
+        numbers, to the elements of this list in place. Other
+        entities are added as by the addition operator
+
+        :param mathEntity: The entity being added to this list
+        :return: This list, or the sum if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, (NumberList, Complex, Quaternion)):
+            self.__updateElements(mathEntity, add)
+
+            return self
+
+        return self + mathEntity
+
+    def __isub__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Subtracts a number, or the elements of another list of
+        numbers, from the elements of this list in place. Other
+        entities are subtracted as by the subtraction operator
+
+        :param mathEntity: The entity being subtracted from this
+            list
+        :return: This list, or the difference if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, (NumberList, Complex, Quaternion)):
+            self.__updateElements(mathEntity, sub)
+
+            return self
+
+        return self - mathEntity
+
+    def __imul__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Multiplies the elements of this list by a number, or by
+        the elements of another list of numbers, in place. Other
+        entities are multiplied as by the multiplication operator
+
+        :param mathEntity: The entity this list is multiplied by
+        :return: This list, or the product if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, (NumberList, Complex, Quaternion)):
+            self.__updateElements(mathEntity, mul)
+
+            return self
+
+        return self * mathEntity
+
+    def __itruediv__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Divides the elements of this list by a number, or by the
+        elements of another list of numbers, in place. Other
+        entities are divided by as by the division operator
+
+        :param mathEntity: The entity this list is divided by
+        :return: This list, or the quotient if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, (NumberList, Complex, Quaternion)):
+            self.__updateElements(mathEntity, truediv)
+
+            return self
+
+        return self / mathEntity
+
+    def __copy__(self) -> NumberList:
+        """
+        Creates a shallow copy of this list of numbers. The numbers
+        are shared, but the list holding them is not, so that
+        changing either list of numbers does not change the other
+
+        :return: A shallow copy of this list of numbers
+        """
+
+        return NumberList(list(self.__data))
+
     def __hash__(self) -> int:
         """
         Computes a hash code for this list of numbers
@@ -0,0 +1,353 @@
+from __future__ import annotations
+from typing import Union, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import os
+from calc.Quaternion import Quaternion
+from calc.Matrix import Matrix
+from calc.Serialization import serialize, deserialize
+from calc._MatrixKernel import multiplyTables
+
+
+# The number of scalar multiplications below which products are
+# computed serially, since starting the tasks costs more than
+# they would save
+PARALLEL_THRESHOLD = 128 * 128 * 128
+
+# The number of row blocks given to each worker, so that workers
+# that finish early can take blocks from slower ones
+BLOCKS_PER_WORKER = 4
+
+# The multipliers that have been activated and not deactivated, in
+# the order they were activated. The last one is used by products.
+# The stack is shared by every thread of the process
+_activeMultipliers = []
+
+# Each worker keeps the right operand of the product it is working
+# on, so that it is only read from shared memory once per product
+_workerOperand = (None, None)
+
+
+def getActiveMultiplier() -> Optional[ParallelMultiplier]:
+    """
+    Returns the multiplier that matrix products made with the
+    multiplication operator currently use, which is the most
+    recently activated multiplier that is still active
+
+    :return: The active multiplier, or None if products are
+        computed serially
+    """
+
+    return _activeMultipliers[-1] if _activeMultipliers else None
+
+
+def _readEntity(memory: SharedMemory, start: int, length: int) -> Matrix:
+    """
+    Deserializes a matrix stored in a shared memory block
+
+    :param memory: The shared memory block
+    :param start: The offset of the serialized matrix in the block
+    :param length: The length of the serialized matrix
+    :return: The deserialized matrix
+    """
+
+    with memory.buf[start: start + length] as view:
+        return deserialize(view)
+
+
+def _multiplyBlock(name: str, rightLength: int, blockStart: int, blockLength: int) \
+        -> List[Union[int, float, complex, Quaternion]]:
+    """
+    Multiplies a block of rows of the left operand by the right
+    operand of a product. Both operands are read from the shared
+    memory block with the given name, in which the right operand
+    is stored first, followed by each block of rows of the left
+    operand
+
+    :param name: The name of the shared memory block
+    :param rightLength: The length of the serialized right operand
+    :param blockStart: The offset of the serialized rows of the
+        left operand
+    :param blockLength: The length of the serialized rows of the
+        left operand
+    :return: The row-major table of the rows of the product
+    """
+
+    global _workerOperand
+
+    memory = SharedMemory(name=name)
+
+    try:
+        if _workerOperand[0] != name:
+            _workerOperand = (name, _readEntity(memory, 0, rightLength))
+
+        leftMatrix = _readEntity(memory, blockStart, blockLength)
+    finally:
+        memory.close()
+
+    rightMatrix = _workerOperand[1]
+
+    return multiplyTables(list(leftMatrix), list(rightMatrix),
+                          leftMatrix.rowLength, leftMatrix.columnLength, rightMatrix.columnLength)
+
+
+class ParallelMultiplier:
+    """
+    Instances of this class multiply large matrices across several
+    processes. The product is split into blocks of rows of the left
+    matrix, and the operands are serialized once into a shared
+    memory block that every worker reads from, so that they are
+    not pickled for each task. Products smaller than the threshold
+    are computed serially. Matrices backed by numpy arrays on both
+    sides are multiplied by numpy, which already uses every core.
+    Multipliers are opt-in: products made with the multiplication
+    operator only use a multiplier while it is active, such as
+    inside a with statement. Activation applies to the whole
+    process, so a multiplier activated in one thread is also used
+    by products computed in every other thread
+    """
+
+    def __init__(self, workerCount: Optional[int]=None, threshold: int=PARALLEL_THRESHOLD):
+        """
+        Constructs a multiplier. The worker processes are started
+        when the first product large enough to use them is computed
+
+        :param workerCount: The number of worker processes, which
+            is the number of CPUs by default
+        :param threshold: The number of scalar multiplications a
+            product must take before it is split across workers
+        :raises ValueError: Raised if the number of workers is less
+            than one or the threshold is negative
+        """
+
+        if workerCount is None:
+            workerCount = os.cpu_count() or 1
+
+        if workerCount < 1:
+            raise ValueError("At least one worker is needed")
+        if threshold < 0:
+            raise ValueError("The threshold cannot be negative")
+
+        self.__workerCount = workerCount
+        self.__threshold = threshold
+        self.__executor = None
+
+    @property
+    def workerCount(self) -> int:
+        """
+        Returns the number of worker processes of this multiplier
+
+        :return: The number of worker processes
+        """
+
+        return self.__workerCount
+
+    @property
+    def threshold(self) -> int:
+        """
+        Returns the number of scalar multiplications a product must
+        take before this multiplier splits it across workers
+
+        :return: The size threshold of this multiplier
+        """
+
+        return self.__threshold
+
+    def isParallel(self, rowLength: int, sharedLength: int, columnLength: int) -> bool:
+        """
+        Checks if a product of the given dimensions is split across
+        workers
+
+        :param rowLength: The number of rows of the left matrix
+        :param sharedLength: The number of columns of the left
+            matrix and rows of the right matrix
+        :param columnLength: The number of columns of the right
+            matrix
+        :return: True if the product is computed in parallel, False
+            if it is computed serially
+        """
+
+        return self.__workerCount > 1 and rowLength > 1 and \
+            rowLength * sharedLength * columnLength >= self.__threshold
+
+    def multiply(self, leftMatrix: Matrix, rightMatrix: Matrix) -> Matrix:
+        """
+        Multiplies the two given matrices together, across the
+        workers of this multiplier if the product is large enough.
+        Matrices whose elements cannot be serialized, such as ints
+        that do not fit in 64 bits, are multiplied serially
+
+        :param leftMatrix: The matrix on the left side of the
+            multiplication sign
+        :param rightMatrix: The matrix on the right side of the
+            multiplication sign
+        :return: The product of the two given matrices
+        :raises ArithmeticError: Raised if the left matrix does not
+            have the same number of columns as the right matrix
+            has rows
+        """
+
+        if not leftMatrix.multipliable(rightMatrix):
+            raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+        (rowLength, sharedLength, columnLength) = (leftMatrix.rowLength, leftMatrix.columnLength,
+                                                   rightMatrix.columnLength)
+
+        if leftMatrix.isArrayBacked and rightMatrix.isArrayBacked:
+            return Matrix.createMatrixFromArray(leftMatrix.toArray() @ rightMatrix.toArray())
+
+        leftTable = list(leftMatrix)
+
+        if self.isParallel(rowLength, sharedLength, columnLength):
+            try:
+                table = self.__multiplyInParallel(leftTable, rightMatrix, rowLength, sharedLength)
+            except (TypeError, OverflowError):
+                table = None
+
+            if table is not None:
+                return Matrix.createMatrixFrom1DList(table, rowLength, columnLength)
+
+        table = multiplyTables(leftTable, list(rightMatrix), rowLength, sharedLength, columnLength)
+
+        return Matrix.createMatrixFrom1DList(table, rowLength, columnLength)
+
+    def __splitRows(self, leftTable: List[Union[int, float, complex, Quaternion]], rowLength: int,
+                    sharedLength: int) -> List[bytes]:
+        """
+        Splits the left operand of a product into blocks of rows
+        and serializes each block
+
+        :param leftTable: The row-major table of the left operand
+        :param rowLength: The number of rows of the left operand
+        :param sharedLength: The number of columns of the left
+            operand
+        :return: The serialized blocks, in order of their rows
+        :raises TypeError: Raised if an element cannot be serialized
+        :raises OverflowError: Raised if an int does not fit in 64
+            bits
+        """
+
+        blockCount = min(rowLength, self.__workerCount * BLOCKS_PER_WORKER)
+        boundaries = [rowLength * blockIndex // blockCount for blockIndex in range(blockCount + 1)]
+        blocks = []
+
+        for (rowStart, rowEnd) in zip(boundaries, boundaries[1:]):
+            block = leftTable[rowStart * sharedLength: rowEnd * sharedLength]
+            blocks.append(serialize(Matrix.createMatrixFrom1DList(block, rowEnd - rowStart, sharedLength)))
+
+        return blocks
+
+    def __multiplyInParallel(self, leftTable: List[Union[int, float, complex, Quaternion]], rightMatrix: Matrix,
+                             rowLength: int, sharedLength: int) -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Shares the operands of a product with the workers and
+        gathers the blocks of rows of the product they compute
+
+        :param leftTable: The row-major table of the left operand
+        :param rightMatrix: The right operand
+        :param rowLength: The number of rows of the left operand
+        :param sharedLength: The number of columns of the left
+            operand
+        :return: The row-major table of the product
+        :raises TypeError: Raised if an element cannot be serialized
+        :raises OverflowError: Raised if an int does not fit in 64
+            bits
+        """
+
+        right = serialize(rightMatrix)
+        blocks = self.__splitRows(leftTable, rowLength, sharedLength)
+        memory = SharedMemory(create=True, size=len(right) + sum(len(block) for block in blocks))
+
+        try:
+            memory.buf[:len(right)] = right
+            offset = len(right)
+            tasks = []
+
+            for block in blocks:
+                memory.buf[offset: offset + len(block)] = block
+                tasks.append((offset, len(block)))
+                offset += len(block)
+
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.__workerCount)
+
+            futures = [self.__executor.submit(_multiplyBlock, memory.name, len(right), blockStart, blockLength)
+                       for (blockStart, blockLength) in tasks]
+            table = []
+
+            for future in futures:
+                table.extend(future.result())
+
+            return table
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def activate(self) -> None:
+        """
+        Makes matrix products made with the multiplication operator
+        use this multiplier, until it is deactivated or another
+        multiplier is activated. Activation is process-global, not
+        per-thread. Activating a multiplier that is already active
+        makes it the one used
+
+        :return: None
+        """
+
+        if self in _activeMultipliers:
+            _activeMultipliers.remove(self)
+
+        _activeMultipliers.append(self)
+
+    def deactivate(self) -> None:
+        """
+        Stops matrix products made with the multiplication operator
+        from using this multiplier. Products use the most recently
+        activated multiplier that is still active, so multipliers
+        can be deactivated in any order. Does nothing if this
+        multiplier is not active
+
+        :return: None
+        """
+
+        if self in _activeMultipliers:
+            _activeMultipliers.remove(self)
+
+    def close(self) -> None:
+        """
+        Deactivates this multiplier and stops its worker processes.
+        The workers are started again if this multiplier is used
+        afterwards
+
+        :return: None
+        """
+
+        self.deactivate()
+
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __enter__(self) -> ParallelMultiplier:
+        """
+        Activates this multiplier for the body of a with statement
+
+        :return: This multiplier
+        """
+
+        self.activate()
+
+        return self
+
+    def __exit__(self, excType: Optional[type], excValue: Optional[BaseException], traceback: object) -> None:
+        """
+        Closes this multiplier at the end of a with statement
+
+        :param excType: The type of the exception raised in the
+            body, if any
+        :param excValue: The exception raised in the body, if any
+        :param traceback: The traceback of the exception, if any
+        :return: None
+        """
+
+        self.close()
@@ -3,6 +3,8 @@ from typing import Union, List, Tuple, Iterator, NoReturn
 from sys import float_info
 from calc.MathFunction import sqrtMath
 from calc.Quaternion import Quaternion
+from calc.Summary import Summary
+from calc.FrequencyTable import FrequencyTable
 
 
 class ProbabilityDistribution:
@@ -85,7 +87,7 @@ class ProbabilityDistribution:
         """
 
         if self.__sortedData is not None:
-            return self.__sortedData[0]
+            return self.__sortedData[0][0]
         else:
             minValue = float_info.max
 
@@ -104,9 +106,9 @@ class ProbabilityDistribution:
         """
 
         if self.__sortedData is not None:
-            return self.__sortedData[len(self) - 1]
+            return self.__sortedData[len(self) - 1][0]
         else:
-            maxValue = float_info.min
+            maxValue = -float_info.max
 
             for (value, probability) in self:
                 if value > maxValue:
@@ -140,64 +142,50 @@ class ProbabilityDistribution:
         mid = len(self) // 2
 
         if len(self) % 2 == 0:
-            return (self.__sortedData[mid][0] + self.__sortedData[mid + 1][0]) / 2
+            return (self.__sortedData[mid - 1][0] + self.__sortedData[mid][0]) / 2
         else:
-            return self.__sortedData[mid + 1][0]
+            return self.__sortedData[mid][0]
 
-    def mode(self) -> List[int, float, complex, Quaternion]:
+    def frequencies(self) -> FrequencyTable:
         """
-        Computes the mode of this probability distribution
+        Counts how many times each data value occurs in this probability distribution, regardless of its probability
 
-        :return: The mode of this probability distribution
+        :return: The frequency table of the data values
         """
 
-        modes = []
-
-        try:
-            self.__sort()
-
-            countOfMode = 1
-            index = 0
+        return FrequencyTable([value for (value, probability) in self])
 
-            while index < len(self):
-                current = self.__sortedData[index]
-                countOfCurrent = 0
+    def mode(self) -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Computes the mode of this probability distribution, which is every data value that occurs the most often.
+        There is no mode if no data value occurs more than once. The modes are sorted if they can be ordered
 
-                while current[0] == self.__sortedData[index][0]:
-                    countOfCurrent += 1
-                    index += 1
+        :return: The mode of this probability distribution
+        """
 
-                    if index >= len(self):
-                        break
+        table = self.frequencies()
+        modes = table.mode()
 
-                if countOfCurrent == countOfMode and countOfMode != 1:
-                    modes.append(current[0])
-                elif countOfCurrent > countOfMode:
-                    countOfMode = countOfCurrent
+        if len(modes) == 0 or table.count(modes[0]) == 1:
+            return []
 
-                    modes.clear()
-                    modes.append(current[0])
+        try:
+            modes.sort()
         except TypeError:
-            counts = {}
-
-            for (value, probability) in self:
-                if value in counts:
-                    counts[value] += 1
-                else:
-                    counts[value] = 1
+            pass
 
-            countOfMode = None
+        return modes
 
-            for (value, count) in counts.items():
-                if count > countOfMode:
-                    modes.clear()
-                    modes.append(value)
+    def topK(self, k: int) -> List[Tuple[Union[int, float, complex, Quaternion], int]]:
+        """
+        Returns the given number of data values that occur the most often in this probability distribution
 
-                    countOfMode = count
-                elif count == countOfMode and count != -1:
-                    modes.append(value)
+        :param k: The number of data values to be returned
+        :return: The most frequent data values and their counts, from the most frequent to the least frequent
+        :raises ValueError: Raised if k is negative
+        """
 
-        return modes
+        return self.frequencies().topK(k)
 
     def midrange(self) -> Union[int, float]:
         """
@@ -248,6 +236,34 @@ class ProbabilityDistribution:
 
         return sqrtMath(self.variance())
 
+    def summary(self) -> Summary:
+        """
+        Computes the descriptive statistics of this probability distribution together. The mean is computed once and
+        shared with the variance, the minimum and maximum are shared with the range and midrange, and nothing is
+        sorted. The median and mode are computed when they are first read from the summary. The variance is the
+        variance of the distribution, as in variance
+
+        :return: The summary of this probability distribution
+        :raises ValueError: Raised if this probability distribution is empty
+        """
+
+        if len(self) == 0:
+            raise ValueError("An empty ProbabilityDistribution has no summary")
+
+        values = [value for (value, probability) in self]
+        meanValue = sum([value * probability for (value, probability) in self])
+        varianceValue = sum([value * value * probability for (value, probability) in self]) - meanValue ** 2
+
+        if self.__sortedData is not None:
+            (minValue, maxValue) = (self.__sortedData[0][0], self.__sortedData[len(self) - 1][0])
+        else:
+            try:
+                (minValue, maxValue) = (min(values), max(values))
+            except TypeError:
+                (minValue, maxValue) = (None, None)
+
+        return Summary(len(self), minValue, maxValue, meanValue, varianceValue, self.median, self.mode)
+
     def __iter__(self) -> Iterator[Tuple[Union[int, float, complex, Quaternion], float]]:
         """
         Returns an iterator over the values and their corresponding probabilities
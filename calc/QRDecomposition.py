@@ -0,0 +1,202 @@
+from __future__ import annotations
+from typing import Union, List
+from math import sqrt
+from calc.Quaternion import Quaternion
+
+
+class QRDecomposition:
+    """
+    Instances of this class represent the QR factorization of a
+    matrix with at least as many rows as columns, computed with
+    Householder reflections, such that A = Q * R. Only matrices
+    of real and complex numbers can be factored
+    """
+
+    def __init__(self, matrix: "Matrix"):
+        """
+        Factors the given matrix
+
+        :param matrix: The matrix to be factored
+        :raises ArithmeticError: Raised if the given matrix has
+            fewer rows than columns or contains quaternions
+        """
+
+        if matrix.rowLength < matrix.columnLength:
+            raise ArithmeticError("Only matrices with at least as many rows as columns have QR decompositions")
+
+        table = list(matrix)
+
+        if any(type(value) is Quaternion for value in table):
+            raise ArithmeticError("Matrices containing Quaternions do not have QR decompositions")
+
+        self.__rowLength = matrix.rowLength
+        self.__columnLength = matrix.columnLength
+        self.__reflectors = []
+        self.__rankDeficient = False
+        self.__factor(table)
+        self.__table = table
+
+    def __factor(self, table: List[Union[int, float, complex]]) -> None:
+        """
+        Reduces the given table to upper triangular form in place,
+        recording each Householder reflection that is applied
+
+        :param table: The row-major table to be factored
+        :return: None
+        """
+
+        rowLength = self.__rowLength
+        columnLength = self.__columnLength
+
+        for pivotIndex in range(min(rowLength - 1, columnLength)):
+            column = [table[rowIndex * columnLength + pivotIndex] for rowIndex in range(pivotIndex, rowLength)]
+            norm = sqrt(sum(abs(value) ** 2 for value in column))
+
+            if norm == 0:
+                self.__rankDeficient = True
+                self.__reflectors.append(None)
+                continue
+
+            head = column[0]
+            phase = head / abs(head) if head != 0 else 1
+            column[0] = head + phase * norm
+            reflectorNorm = sum(abs(value) ** 2 for value in column)
+
+            self.__reflectors.append((column, reflectorNorm))
+
+            for columnIndex in range(pivotIndex, columnLength):
+                QRDecomposition.__reflect(table, column, reflectorNorm, pivotIndex, columnIndex, columnLength)
+
+        for index in range(columnLength):
+            if table[index * columnLength + index] == 0:
+                self.__rankDeficient = True
+
+    @staticmethod
+    def __reflect(table: List[Union[int, float, complex]], reflector: List[Union[float, complex]],
+                  reflectorNorm: float, start: int, columnIndex: int, columnLength: int) -> None:
+        """
+        Applies the reflection I - 2 * v * v^H / (v^H * v) to one
+        column of the given table, starting at the given row
+
+        :param table: The row-major table to be updated in place
+        :param reflector: The Householder vector v
+        :param reflectorNorm: The value of v^H * v
+        :param start: The row that v begins at
+        :param columnIndex: The column being reflected
+        :param columnLength: The number of columns in the table
+        :return: None
+        """
+
+        projection = 0
+
+        for (offset, value) in enumerate(reflector):
+            projection += value.conjugate() * table[(start + offset) * columnLength + columnIndex]
+
+        scale = 2 * projection / reflectorNorm
+
+        for (offset, value) in enumerate(reflector):
+            table[(start + offset) * columnLength + columnIndex] -= scale * value
+
+    @property
+    def isRankDeficient(self) -> bool:
+        """
+        Checks if the factored matrix has linearly
+        dependent columns
+
+        :return: True if the columns of the factored
+            matrix are linearly dependent, False otherwise
+        """
+
+        return self.__rankDeficient
+
+    @property
+    def upper(self) -> "Matrix":
+        """
+        Returns the upper triangular factor R, which has
+        as many rows and columns as the factored matrix
+        has columns
+
+        :return: The upper triangular factor R
+        """
+
+        from calc.Matrix import Matrix
+
+        columnLength = self.__columnLength
+        table = []
+
+        for rowIndex in range(columnLength):
+            for columnIndex in range(columnLength):
+                if columnIndex < rowIndex:
+                    table.append(0)
+                else:
+                    table.append(self.__table[rowIndex * columnLength + columnIndex])
+
+        return Matrix.createMatrixFrom1DList(table, columnLength, columnLength)
+
+    @property
+    def orthogonal(self) -> "Matrix":
+        """
+        Returns the factor Q, which has orthonormal columns
+        and the same dimensions as the factored matrix
+
+        :return: The factor Q
+        """
+
+        from calc.Matrix import Matrix
+
+        rowLength = self.__rowLength
+        columnLength = self.__columnLength
+        table = [0] * (rowLength * columnLength)
+
+        for index in range(columnLength):
+            table[index * columnLength + index] = 1
+
+        for pivotIndex in range(len(self.__reflectors) - 1, -1, -1):
+            reflection = self.__reflectors[pivotIndex]
+
+            if reflection is not None:
+                for columnIndex in range(columnLength):
+                    QRDecomposition.__reflect(table, reflection[0], reflection[1], pivotIndex, columnIndex, columnLength)
+
+        return Matrix.createMatrixFrom1DList(table, rowLength, columnLength)
+
+    def solve(self, values: List[Union[int, float, complex]]) -> List[Union[float, complex]]:
+        """
+        Finds the x that minimizes ||A * x - b||, where A is the
+        factored matrix and b is the given list of values. If A
+        is square, this is the exact solution of A * x = b
+
+        :param values: The right-hand side of the equation
+        :return: The least-squares solution of the equation
+        :raises ArithmeticError: Raised if the number of values
+            does not match the number of rows of the factored
+            matrix or if its columns are linearly dependent
+        """
+
+        rowLength = self.__rowLength
+        columnLength = self.__columnLength
+
+        if len(values) != rowLength:
+            raise ArithmeticError("The number of values must match the row length of the Matrix")
+
+        if self.__rankDeficient:
+            raise ArithmeticError("Rank deficient matrices cannot be solved against")
+
+        solution = list(values)
+
+        for (pivotIndex, reflection) in enumerate(self.__reflectors):
+            if reflection is not None:
+                QRDecomposition.__reflect(solution, reflection[0], reflection[1], pivotIndex, 0, 1)
+
+        table = self.__table
+
+        for rowIndex in range(columnLength - 1, -1, -1):
+            rowStart = rowIndex * columnLength
+            value = solution[rowIndex]
+
+            for columnIndex in range(rowIndex + 1, columnLength):
+                value -= table[rowStart + columnIndex] * solution[columnIndex]
+
+            solution[rowIndex] = value / table[rowStart + rowIndex]
+
+        return solution[:columnLength]
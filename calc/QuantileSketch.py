@@ -0,0 +1,387 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Iterable, NoReturn
+from numbers import Real
+from itertools import accumulate
+from bisect import bisect_left
+from random import random
+
+
+# The number of items kept at the top level of a sketch by default,
+# which bounds the rank error of its quantiles to about 1.7% of the
+# number of values pushed
+DEFAULT_CAPACITY = 200
+
+# The factor by which the capacity of each level shrinks going down
+# from the top level
+CAPACITY_DECAY = 2 / 3
+
+
+class QuantileSketch:
+    """
+    Instances of this class estimate the quantiles of a stream of
+    real numbers in bounded memory, using the KLL sketch of Karnin,
+    Lang and Liberty. Values are kept in levels, where each value at
+    level h stands for 2^h values of the stream. When a level is
+    full, it is sorted and every other value, starting at random at
+    the first or second, is promoted to the next level, which halves
+    the number of values kept. A sketch keeps about three times its
+    capacity in values no matter how many are pushed, and sketches
+    of separate parts of a stream can be merged.
+
+    Compared to the exact results of NumberList on the same values,
+    the minimum and maximum are exact, and the rank of an estimated
+    quantile is within about 1.7% of the number of values of the
+    rank of the exact quantile, with high probability, for the
+    default capacity of 200. The rank error shrinks in proportion
+    to the capacity. Unlike NumberList, quantiles are not
+    interpolated, so each estimate is one of the values pushed.
+    NaN is rejected, since it has no rank among the other values
+    """
+
+    def __init__(self, values: Iterable[Union[int, float]]=(), capacity: int=DEFAULT_CAPACITY):
+        """
+        Constructs a sketch of the given numbers
+
+        :param values: The numbers to be pushed first, such as a
+            NumberList
+        :param capacity: The number of values kept at the top level
+            of the sketch. Larger capacities give smaller errors
+            and use proportionally more memory
+        :raises ValueError: Raised if the capacity is less than 2
+            or a value is NaN
+        :raises TypeError: Raised if a value is not a real number
+        """
+
+        if capacity < 2:
+            raise ValueError("The capacity of a QuantileSketch must be at least 2")
+
+        self.__capacity = capacity
+        self.__levels = [[]]
+        self.__count = 0
+        self.__size = 0
+        self.__maxSize = self.__levelCapacity(0)
+        self.__minValue = float("nan")
+        self.__maxValue = float("nan")
+
+        self.extend(values)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the number of values kept at the top level of this
+        sketch
+
+        :return: The capacity of this sketch
+        """
+
+        return self.__capacity
+
+    def __levelCapacity(self, height: int) -> int:
+        """
+        Returns the number of values the given level can hold
+        before it is compacted. Lower levels hold fewer values,
+        since their errors are weighted less
+
+        :param height: The index of the level
+        :return: The capacity of the level
+        """
+
+        depth = len(self.__levels) - height - 1
+
+        return int(self.__capacity * CAPACITY_DECAY ** depth) + 2
+
+    def __grow(self) -> NoReturn:
+        """
+        Adds a level above the current top level
+
+        :return: None
+        """
+
+        self.__levels.append([])
+        self.__maxSize = sum(self.__levelCapacity(height) for height in range(len(self.__levels)))
+
+    def __compress(self) -> NoReturn:
+        """
+        Compacts the lowest level that is full, promoting half of
+        its values to the level above it
+
+        :return: None
+        """
+
+        for (height, level) in enumerate(self.__levels):
+            if len(level) >= self.__levelCapacity(height):
+                if height + 1 == len(self.__levels):
+                    self.__grow()
+
+                level.sort()
+
+                # An odd value out stays behind, and the others are
+                # paired, with one value of each pair promoted
+                kept = level[-1:] if len(level) % 2 == 1 else []
+                pairedEnd = len(level) - len(kept)
+                self.__levels[height + 1].extend(level[int(random() < 0.5): pairedEnd: 2])
+                level[:] = kept
+
+                self.__size = sum(len(otherLevel) for otherLevel in self.__levels)
+
+                return
+
+    def push(self, value: Union[int, float]) -> NoReturn:
+        """
+        Adds a number to this sketch
+
+        :param value: The number to be added
+        :return: None
+        :raises TypeError: Raised if the value is not a real number
+        :raises ValueError: Raised if the value is NaN, which
+            cannot be ordered with the other values
+        """
+
+        if not isinstance(value, Real):
+            raise TypeError("Only real numbers can be sketched")
+
+        value = float(value)
+
+        if value != value:
+            raise ValueError("NaN cannot be sketched")
+
+        if self.__count == 0:
+            (self.__minValue, self.__maxValue) = (value, value)
+        elif value < self.__minValue:
+            self.__minValue = value
+        elif value > self.__maxValue:
+            self.__maxValue = value
+
+        self.__levels[0].append(value)
+        self.__count += 1
+        self.__size += 1
+
+        if self.__size >= self.__maxSize:
+            self.__compress()
+
+    def extend(self, values: Iterable[Union[int, float]]) -> NoReturn:
+        """
+        Adds each of the given numbers to this sketch
+
+        :param values: The numbers to be added
+        :return: None
+        :raises TypeError: Raised if a value is not a real number
+        :raises ValueError: Raised if a value is NaN
+        """
+
+        for value in values:
+            self.push(value)
+
+    def merge(self, sketch: QuantileSketch) -> QuantileSketch:
+        """
+        Combines this sketch with another, as if every number of
+        both had been pushed to one sketch. Neither sketch is
+        changed
+
+        :param sketch: The sketch of another part of the stream
+        :return: A sketch of the numbers of both sketches, with
+            the larger of their capacities
+        """
+
+        merged = QuantileSketch(capacity=max(self.__capacity, sketch.__capacity))
+
+        for source in (self, sketch):
+            while len(merged.__levels) < len(source.__levels):
+                merged.__grow()
+
+            for (height, level) in enumerate(source.__levels):
+                merged.__levels[height].extend(level)
+
+        merged.__count = self.__count + sketch.__count
+        merged.__size = sum(len(level) for level in merged.__levels)
+        extremes = [source for source in (self, sketch) if source.__count > 0]
+
+        if extremes:
+            merged.__minValue = min(source.__minValue for source in extremes)
+            merged.__maxValue = max(source.__maxValue for source in extremes)
+
+        while merged.__size >= merged.__maxSize:
+            merged.__compress()
+
+        return merged
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values pushed to this sketch,
+        including the values of merged sketches
+
+        :return: The number of values this sketch describes
+        """
+
+        return self.__count
+
+    def __checkNotEmpty(self) -> NoReturn:
+        """
+        Checks that values have been pushed to this sketch
+
+        :return: None
+        :raises ValueError: Raised if this sketch is empty
+        """
+
+        if self.__count == 0:
+            raise ValueError("Quantiles of an empty QuantileSketch are undefined")
+
+    def min(self) -> float:
+        """
+        Returns the smallest number pushed to this sketch
+
+        :return: The exact minimum of the numbers
+        :raises ValueError: Raised if this sketch is empty
+        """
+
+        self.__checkNotEmpty()
+
+        return self.__minValue
+
+    def max(self) -> float:
+        """
+        Returns the largest number pushed to this sketch
+
+        :return: The exact maximum of the numbers
+        :raises ValueError: Raised if this sketch is empty
+        """
+
+        self.__checkNotEmpty()
+
+        return self.__maxValue
+
+    def __weightedValues(self) -> Tuple[List[float], List[int]]:
+        """
+        Sorts the values kept by this sketch along with the running
+        total of the number of stream values each stands for
+
+        :return: The sorted values and the cumulative weight up to
+            and including each of them
+        """
+
+        pairs = sorted((value, 1 << height) for (height, level) in enumerate(self.__levels) for value in level)
+
+        return ([value for (value, _) in pairs], list(accumulate(weight for (_, weight) in pairs)))
+
+    def __estimate(self, quantiles: List[Union[int, float]]) -> List[float]:
+        """
+        Estimates the given quantiles, sorting the values kept by
+        this sketch once
+
+        :param quantiles: The quantiles, each between 0 and 1
+        :return: The estimated value at each of the quantiles
+        :raises ValueError: Raised if this sketch is empty
+        """
+
+        self.__checkNotEmpty()
+
+        (values, weights) = self.__weightedValues()
+        results = []
+
+        for q in quantiles:
+            if q == 0:
+                results.append(self.__minValue)
+            elif q == 1:
+                results.append(self.__maxValue)
+            else:
+                # The estimate is the first value whose cumulative
+                # weight reaches the rank of the quantile
+                rank = (self.__count - 1) * q + 1
+                results.append(values[min(bisect_left(weights, rank), len(values) - 1)])
+
+        return results
+
+    def quantile(self, q: Union[int, float]) -> float:
+        """
+        Estimates the given quantile of the numbers pushed to this
+        sketch. The 0 and 1 quantiles are the exact minimum and
+        maximum
+
+        :param q: The quantile, between 0 and 1
+        :return: The value below which about the given fraction of
+            the numbers lies
+        :raises ValueError: Raised if this sketch is empty or if
+            the quantile is not between 0 and 1
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be between 0 and 1")
+
+        return self.__estimate([q])[0]
+
+    def median(self) -> float:
+        """
+        Estimates the median of the numbers pushed to this sketch
+
+        :return: The estimated median
+        :raises ValueError: Raised if this sketch is empty
+        """
+
+        return self.__estimate([0.5])[0]
+
+    def percentiles(self, percents: List[Union[int, float]]) -> List[float]:
+        """
+        Estimates the given percentiles of the numbers pushed to
+        this sketch
+
+        :param percents: The percentiles, each between 0 and 100
+        :return: The estimated value at each of the given
+            percentiles
+        :raises ValueError: Raised if this sketch is empty or if a
+            percentile is not between 0 and 100
+        """
+
+        if any(not 0 <= percent <= 100 for percent in percents):
+            raise ValueError("Percentiles must be between 0 and 100")
+
+        return self.__estimate([percent / 100 for percent in percents])
+
+    def _state(self) -> Tuple[float, float, List[List[float]]]:
+        """
+        Returns the state of this sketch that is needed to
+        serialize it
+
+        :return: The minimum, the maximum and the values kept at
+            each level
+        """
+
+        return (self.__minValue, self.__maxValue, [list(level) for level in self.__levels])
+
+    @staticmethod
+    def _createFromState(capacity: int, count: int, minValue: float, maxValue: float,
+                         levels: List[List[float]]) -> QuantileSketch:
+        """
+        Creates a sketch from a state returned by _state
+
+        :param capacity: The capacity of the sketch
+        :param count: The number of values the sketch describes
+        :param minValue: The minimum of the values
+        :param maxValue: The maximum of the values
+        :param levels: The values kept at each level
+        :return: The sketch with the given state
+        """
+
+        sketch = QuantileSketch(capacity=capacity)
+
+        while len(sketch.__levels) < len(levels):
+            sketch.__grow()
+
+        for (height, level) in enumerate(levels):
+            sketch.__levels[height].extend(level)
+
+        sketch.__count = count
+        sketch.__size = sum(len(level) for level in levels)
+        sketch.__minValue = minValue
+        sketch.__maxValue = maxValue
+
+        return sketch
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of this sketch
+
+        :return: A string representation of this sketch
+        """
+
+        return "QuantileSketch(count=" + str(self.__count) + ", capacity=" + str(self.__capacity) + \
+            ", kept=" + str(self.__size) + ")"
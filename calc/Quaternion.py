@@ -6,9 +6,14 @@ from typing import Union, Iterator
 
 class Quaternion(MathEntity):
     """
-    Instances of this class represent quaternions
+    Instances of this class represent quaternions. Quaternions
+    are immutable and store their components in slots rather
+    than in a per-instance dictionary. The absolute value and
+    hash code of a quaternion are computed once and then cached
     """
 
+    __slots__ = ("__real", "__imag0", "__imag1", "__imag2", "__absoluteValue", "__hashCode")
+
     def __init__(self, real: Union[int, float], imag0: Union[int, float], imag1: Union[int, float], imag2: Union[int, float]):
         """
         Constructs a quaternion with the given real and
@@ -27,6 +32,8 @@ class Quaternion(MathEntity):
         self.__imag0 = imag0
         self.__imag1 = imag1
         self.__imag2 = imag2
+        self.__absoluteValue = None
+        self.__hashCode = None
 
     @property
     def real(self) -> Union[int, float]:
@@ -81,7 +88,11 @@ class Quaternion(MathEntity):
         :return: The absolute value of this quaternion
         """
 
-        return sqrt((self.real ** 2) + (self.imag0 ** 2) + (self.imag1 ** 2) + (self.imag2 ** 2))
+        if self.__absoluteValue is None:
+            self.__absoluteValue = sqrt(self.__real * self.__real + self.__imag0 * self.__imag0 +
+                                        self.__imag1 * self.__imag1 + self.__imag2 * self.__imag2)
+
+        return self.__absoluteValue
 
     def conjugate(self) -> Quaternion:
         """
@@ -90,7 +101,7 @@ class Quaternion(MathEntity):
         :return: The conjugate of this quaternion
         """
 
-        return Quaternion(self.real, -self.imag0, -self.imag1, -self.imag2)
+        return Quaternion(self.__real, -self.__imag0, -self.__imag1, -self.__imag2)
 
     def normalize(self) -> Quaternion:
         """
@@ -108,7 +119,7 @@ class Quaternion(MathEntity):
         :return: An iterator over the components of this quaternion
         """
 
-        return iter([self.real, self.imag0, self.imag1, self.imag2])
+        return iter((self.__real, self.__imag0, self.__imag1, self.__imag2))
 
     def __hash__(self) -> int:
         """
@@ -117,12 +128,15 @@ class Quaternion(MathEntity):
         :return: A hash code for this quaternion
         """
 
-        MODIFIER = 31
+        if self.__hashCode is None:
+            MODIFIER = 31
+
+            self.__hashCode = MODIFIER * hash(self.__real) + \
+                              MODIFIER * hash(self.__imag0) + \
+                              MODIFIER * hash(self.__imag1) + \
+                              MODIFIER * hash(self.__imag2)
 
-        return MODIFIER * hash(self.real) + \
-               MODIFIER * hash(self.imag0) + \
-               MODIFIER * hash(self.imag1) + \
-               MODIFIER * hash(self.imag2)
+        return self.__hashCode
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,374 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Iterator
+from math import e, log
+import numpy
+from calc.MathEntity import MathEntity
+from calc.Quaternion import Quaternion
+from calc.Vector import Vector
+from calc.VectorSet import VectorSet
+
+
+Component = Union[numpy.ndarray, int, float]
+
+
+class QuaternionArray(MathEntity):
+    """
+    Instances of this class represent a sequence of quaternions
+    stored as four parallel float64 arrays, one per component.
+    Operations on a quaternion array are applied to every
+    quaternion at once instead of creating a Quaternion object
+    per element
+    """
+
+    def __init__(self, quaternions: List[Quaternion]):
+        """
+        Constructs a quaternion array containing the given
+        quaternions
+
+        :param quaternions: The quaternions to be contained in
+            this array
+        """
+
+        self.__real = numpy.array([quaternion.real for quaternion in quaternions], dtype=numpy.float64)
+        self.__imag0 = numpy.array([quaternion.imag0 for quaternion in quaternions], dtype=numpy.float64)
+        self.__imag1 = numpy.array([quaternion.imag1 for quaternion in quaternions], dtype=numpy.float64)
+        self.__imag2 = numpy.array([quaternion.imag2 for quaternion in quaternions], dtype=numpy.float64)
+
+    @staticmethod
+    def createQuaternionArrayFromArrays(real: numpy.ndarray, imag0: numpy.ndarray,
+                                        imag1: numpy.ndarray, imag2: numpy.ndarray) -> QuaternionArray:
+        """
+        Creates a quaternion array from the arrays of each of
+        its components. Arrays that are already float64 are used
+        without being copied
+
+        :param real: The real components
+        :param imag0: The first imaginary components
+        :param imag1: The second imaginary components
+        :param imag2: The third imaginary components
+        :return: A quaternion array with the given components
+        :raises ValueError: Raised if the given arrays do not
+            all have the same length
+        """
+
+        if not len(real) == len(imag0) == len(imag1) == len(imag2):
+            raise ValueError("Component arrays must all have the same length")
+
+        quaternions = QuaternionArray([])
+        quaternions.__real = numpy.asarray(real, dtype=numpy.float64)
+        quaternions.__imag0 = numpy.asarray(imag0, dtype=numpy.float64)
+        quaternions.__imag1 = numpy.asarray(imag1, dtype=numpy.float64)
+        quaternions.__imag2 = numpy.asarray(imag2, dtype=numpy.float64)
+
+        return quaternions
+
+    @property
+    def real(self) -> numpy.ndarray:
+        """
+        Returns the real components of the quaternions
+        in this array
+
+        :return: The real components of the quaternions
+            in this array
+        """
+
+        return self.__real
+
+    @property
+    def imag0(self) -> numpy.ndarray:
+        """
+        Returns the first imaginary components of the
+        quaternions in this array
+
+        :return: The first imaginary components of the
+            quaternions in this array
+        """
+
+        return self.__imag0
+
+    @property
+    def imag1(self) -> numpy.ndarray:
+        """
+        Returns the second imaginary components of the
+        quaternions in this array
+
+        :return: The second imaginary components of the
+            quaternions in this array
+        """
+
+        return self.__imag1
+
+    @property
+    def imag2(self) -> numpy.ndarray:
+        """
+        Returns the third imaginary components of the
+        quaternions in this array
+
+        :return: The third imaginary components of the
+            quaternions in this array
+        """
+
+        return self.__imag2
+
+    def __len__(self) -> int:
+        """
+        Returns the number of quaternions in this array
+
+        :return: The number of quaternions in this array
+        """
+
+        return len(self.__real)
+
+    def __getitem__(self, index: int) -> Quaternion:
+        """
+        Returns the quaternion at the given index
+
+        :param index: The index of the quaternion to be
+            returned
+        :return: The quaternion at the given index
+        """
+
+        return Quaternion(float(self.__real[index]), float(self.__imag0[index]),
+                          float(self.__imag1[index]), float(self.__imag2[index]))
+
+    def __iter__(self) -> Iterator[Quaternion]:
+        """
+        Returns an iterator over the quaternions in this array
+
+        :return: An iterator over the quaternions in this array
+        """
+
+        return iter(self.toList())
+
+    def toList(self) -> List[Quaternion]:
+        """
+        Converts this array to a list of quaternions
+
+        :return: A list with the same quaternions as this
+            array
+        """
+
+        return [Quaternion(real, imag0, imag1, imag2) for (real, imag0, imag1, imag2)
+                in zip(self.__real.tolist(), self.__imag0.tolist(), self.__imag1.tolist(), self.__imag2.tolist())]
+
+    def multiply(self, quaternions: Union[QuaternionArray, Quaternion, int, float, complex]) -> QuaternionArray:
+        """
+        Computes the Hamilton product of every quaternion in
+        this array, on the left, with the corresponding given
+        quaternion, on the right. A single quaternion is
+        multiplied with every element of this array
+
+        :param quaternions: A quaternion array of the same
+            length as this array, or a single quaternion
+        :return: The elementwise Hamilton product
+        :raises ArithmeticError: Raised if the given quaternion
+            array is not the same length as this array
+        """
+
+        if isinstance(quaternions, QuaternionArray) and len(quaternions) != len(self):
+            raise ArithmeticError("Quaternion arrays must be of equal length")
+
+        return QuaternionArray.__hamilton(QuaternionArray.__components(self),
+                                          QuaternionArray.__components(quaternions))
+
+    def multiplyOnLeft(self, quaternion: Union[int, float, complex, Quaternion]) -> QuaternionArray:
+        """
+        Computes the Hamilton product of the given quaternion,
+        on the left, with every quaternion in this array, on the
+        right
+
+        :param quaternion: The quaternion on the left side of
+            every product
+        :return: The elementwise Hamilton product
+        """
+
+        return QuaternionArray.__hamilton(QuaternionArray.__components(quaternion),
+                                          QuaternionArray.__components(self))
+
+    @staticmethod
+    def __components(quaternions: Union[QuaternionArray, Quaternion, int, float, complex]) -> Tuple[Component, ...]:
+        """
+        Returns the four components of the given quaternions
+
+        :param quaternions: A quaternion array, a single
+            quaternion or a real or complex number
+        :return: A tuple of the real component and the three
+            imaginary components
+        """
+
+        if isinstance(quaternions, QuaternionArray):
+            return (quaternions.__real, quaternions.__imag0, quaternions.__imag1, quaternions.__imag2)
+        elif isinstance(quaternions, Quaternion):
+            return (quaternions.real, quaternions.imag0, quaternions.imag1, quaternions.imag2)
+        elif isinstance(quaternions, complex):
+            return (quaternions.real, quaternions.imag, 0, 0)
+        else:
+            return (quaternions, 0, 0, 0)
+
+    @staticmethod
+    def __hamilton(left: Tuple[Component, ...], right: Tuple[Component, ...]) -> QuaternionArray:
+        """
+        Computes the Hamilton product of the quaternions with
+        the given components
+
+        :param left: The components of the quaternions on the
+            left side of the products
+        :param right: The components of the quaternions on the
+            right side of the products
+        :return: The elementwise Hamilton product
+        """
+
+        (leftReal, leftImag0, leftImag1, leftImag2) = left
+        (rightReal, rightImag0, rightImag1, rightImag2) = right
+
+        return QuaternionArray.createQuaternionArrayFromArrays(
+            leftReal * rightReal - leftImag0 * rightImag0 - leftImag1 * rightImag1 - leftImag2 * rightImag2,
+            leftReal * rightImag0 + leftImag0 * rightReal + leftImag1 * rightImag2 - leftImag2 * rightImag1,
+            leftReal * rightImag1 - leftImag0 * rightImag2 + leftImag1 * rightReal + leftImag2 * rightImag0,
+            leftReal * rightImag2 + leftImag0 * rightImag1 - leftImag1 * rightImag0 + leftImag2 * rightReal)
+
+    def __abs__(self) -> numpy.ndarray:
+        """
+        Returns the absolute value of every quaternion
+        in this array
+
+        :return: The absolute values of the quaternions
+            in this array
+        """
+
+        return numpy.sqrt(self.__real ** 2 + self.__imag0 ** 2 + self.__imag1 ** 2 + self.__imag2 ** 2)
+
+    def conjugate(self) -> QuaternionArray:
+        """
+        Returns the conjugate of every quaternion in this
+        array
+
+        :return: The conjugates of the quaternions in this
+            array
+        """
+
+        return QuaternionArray.createQuaternionArrayFromArrays(self.__real, -self.__imag0, -self.__imag1, -self.__imag2)
+
+    def normalize(self) -> QuaternionArray:
+        """
+        Returns the normalized value of every quaternion
+        in this array
+
+        :return: The normalized quaternions
+        """
+
+        magnitudes = abs(self)
+
+        return QuaternionArray.createQuaternionArrayFromArrays(self.__real / magnitudes, self.__imag0 / magnitudes,
+                                                               self.__imag1 / magnitudes, self.__imag2 / magnitudes)
+
+    def exp(self) -> QuaternionArray:
+        """
+        Returns the exponential of every quaternion in this
+        array. Each element is equal to the result of
+        expQuaternion on the corresponding quaternion
+
+        :return: The exponentials of the quaternions in
+            this array
+        """
+
+        vectorMagnitudes = numpy.sqrt(self.__imag0 ** 2 + self.__imag1 ** 2 + self.__imag2 ** 2)
+        scale = numpy.exp(self.__real)
+
+        # sin(|v|) / |v| tends to 1 as |v| tends to 0, which keeps
+        # quaternions with no vector part finite
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            vectorScale = numpy.where(vectorMagnitudes == 0, 1.0, numpy.sin(vectorMagnitudes) / vectorMagnitudes)
+
+        return QuaternionArray.createQuaternionArrayFromArrays(scale * numpy.cos(vectorMagnitudes),
+                                                               scale * vectorScale * self.__imag0,
+                                                               scale * vectorScale * self.__imag1,
+                                                               scale * vectorScale * self.__imag2)
+
+    def log(self, base: Union[int, float]=e) -> QuaternionArray:
+        """
+        Returns the logarithm of every quaternion in this
+        array with the given base. Each element is equal
+        to the result of logQuaternion on the corresponding
+        quaternion
+
+        :param base: The base of the logarithm being computed
+        :return: The logarithms of the quaternions in this
+            array
+        """
+
+        magnitudes = abs(self)
+        vectorMagnitudes = numpy.sqrt(self.__imag0 ** 2 + self.__imag1 ** 2 + self.__imag2 ** 2)
+        logOfBase = log(base)
+
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            angles = numpy.arccos(numpy.clip(self.__real / magnitudes, -1.0, 1.0))
+            vectorScale = numpy.where(vectorMagnitudes == 0, 0.0, angles / (vectorMagnitudes * logOfBase))
+
+        return QuaternionArray.createQuaternionArrayFromArrays(numpy.log(magnitudes) / logOfBase,
+                                                               vectorScale * self.__imag0,
+                                                               vectorScale * self.__imag1,
+                                                               vectorScale * self.__imag2)
+
+    def rotate(self, vectors: Union[Vector, VectorSet]) -> VectorSet:
+        """
+        Rotates three-dimensional vectors by the quaternions in
+        this array, computing q * v * q^-1 for each quaternion q.
+        A single vector is rotated by every quaternion. A set of
+        vectors must have one vector per quaternion
+
+        :param vectors: A three-dimensional vector, or a set of
+            three-dimensional vectors of the same length as this
+            array
+        :return: A set of the rotated vectors
+        :raises ArithmeticError: Raised if the vectors are not
+            three-dimensional or if a set of vectors is not the
+            same length as this array
+        """
+
+        if isinstance(vectors, Vector):
+            if len(vectors) != 3:
+                raise ArithmeticError("Only 3-dimensional Vectors can be rotated")
+
+            block = numpy.array([vectors.toList()], dtype=numpy.float64)
+        else:
+            if vectors.dimensions != 3 or len(vectors) != len(self):
+                raise ArithmeticError("There must be one 3-dimensional Vector per Quaternion")
+
+            block = vectors.toArray()
+
+        unit = self.normalize()
+        real = unit.__real[:, numpy.newaxis]
+        axis = numpy.stack((unit.__imag0, unit.__imag1, unit.__imag2), axis=1)
+
+        # v' = v + 2r(u x v) + 2u x (u x v) for a unit quaternion r + u
+        twiceCross = 2 * numpy.cross(axis, block)
+        rotated = block + real * twiceCross + numpy.cross(axis, twiceCross)
+
+        return VectorSet.createVectorSetFromArray(rotated)
+
+    def __hash__(self) -> int:
+        """
+        Computes a hash code for this quaternion array
+
+        :return: A hash code for this quaternion array
+        """
+
+        hashCode = 0
+        MODIFIER = 31
+
+        for value in self:
+            hashCode += MODIFIER * hash(value)
+
+        return hashCode
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of this quaternion
+        array
+
+        :return: A string representation of this quaternion
+            array
+        """
+
+        return "[" + ", ".join(str(quaternion) for quaternion in self) + "]"
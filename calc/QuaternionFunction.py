@@ -78,9 +78,10 @@ def logQuaternion(quaternion: Quaternion, base: Union[int, float]=math.e) -> Qua
     """
 
     vectorPart = Quaternion(0, quaternion.imag0, quaternion.imag1, quaternion.imag2)
+    magnitude = abs(quaternion)
 
-    return math.log(abs(quaternion), base) * \
-           (vectorPart / abs(vectorPart)) * math.acos(quaternion.real / abs(quaternion))
+    return math.log(magnitude, base) + \
+           vectorPart.normalize() * (math.acos(quaternion.real / magnitude) / math.log(base))
 
 
 def log10Quaternion(quaternion: Quaternion) -> Quaternion:
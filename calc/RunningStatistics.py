@@ -0,0 +1,282 @@
+from __future__ import annotations
+from typing import Union, Iterable, NoReturn
+from numbers import Real
+from math import isfinite
+from calc.MathFunction import sqrtMath
+from calc.Quaternion import Quaternion
+
+
+class RunningStatistics:
+    """
+    Instances of this class accumulate descriptive statistics of a
+    stream of numbers without keeping the numbers. Each number
+    updates the count, sum, mean, variance, minimum and maximum in
+    constant time. The sum of floats is compensated as in Kahan and
+    Neumaier's algorithm, and the variance is accumulated with
+    Welford's algorithm, so long streams do not lose precision.
+    Accumulators of separate parts of a stream can be merged, which
+    gives the same statistics as accumulating the whole stream. The
+    statistics are those of NumberList: the variance is the sample
+    variance, and the minimum and maximum are only available while
+    every number is real
+    """
+
+    def __init__(self, values: Iterable[Union[int, float, complex, Quaternion]]=()):
+        """
+        Constructs an accumulator of the given numbers
+
+        :param values: The numbers to be accumulated first, such as
+            a NumberList
+        """
+
+        self.__count = 0
+        self.__total = 0
+        self.__compensation = 0.0
+        self.__mean = 0
+        self.__squaredDeviations = 0
+        self.__minValue = None
+        self.__maxValue = None
+        self.__isOrdered = True
+
+        self.extend(values)
+
+    def __addToTotal(self, value: Union[int, float, complex, Quaternion]) -> NoReturn:
+        """
+        Adds a number to the sum, keeping the rounding error of
+        each addition of floats in a separate compensation term.
+        Once the sum is infinite or NaN, the compensation is no
+        longer updated, since subtracting infinities would turn it
+        into NaN
+
+        :param value: The number to be added
+        :return: None
+        """
+
+        total = self.__total
+        newTotal = total + value
+
+        if type(newTotal) is float and isfinite(newTotal):
+            if abs(total) >= abs(value):
+                self.__compensation += (total - newTotal) + value
+            else:
+                self.__compensation += (value - newTotal) + total
+
+        self.__total = newTotal
+
+    def push(self, value: Union[int, float, complex, Quaternion]) -> NoReturn:
+        """
+        Adds a number to the accumulated statistics
+
+        :param value: The number to be accumulated
+        :return: None
+        """
+
+        self.__count += 1
+        self.__addToTotal(value)
+
+        deviation = value - self.__mean
+        self.__mean = self.__mean + deviation / self.__count
+        self.__squaredDeviations = self.__squaredDeviations + \
+            deviation * deviation * ((self.__count - 1) / self.__count)
+
+        if not isinstance(value, Real):
+            self.__isOrdered = False
+        elif self.__isOrdered:
+            if self.__minValue is None or value < self.__minValue:
+                self.__minValue = value
+            if self.__maxValue is None or value > self.__maxValue:
+                self.__maxValue = value
+
+    def extend(self, values: Iterable[Union[int, float, complex, Quaternion]]) -> NoReturn:
+        """
+        Adds each of the given numbers to the accumulated statistics
+
+        :param values: The numbers to be accumulated
+        :return: None
+        """
+
+        for value in values:
+            self.push(value)
+
+    def merge(self, statistics: RunningStatistics) -> RunningStatistics:
+        """
+        Combines the statistics of this accumulator with those of
+        another, as if every number of both had been pushed to one
+        accumulator. Neither accumulator is changed
+
+        :param statistics: The accumulator of another part of the
+            stream
+        :return: An accumulator of the numbers of both accumulators
+        """
+
+        merged = RunningStatistics()
+        merged.__count = self.__count + statistics.__count
+
+        if self.__count == 0 or statistics.__count == 0:
+            source = statistics if self.__count == 0 else self
+            merged.__mean = source.__mean
+            merged.__squaredDeviations = source.__squaredDeviations
+        else:
+            # The deviations of each part are measured from its own
+            # mean, so the squared distance between the means is
+            # added once for each pair of numbers from both parts
+            difference = statistics.__mean - self.__mean
+            merged.__mean = self.__mean + difference * (statistics.__count / merged.__count)
+            merged.__squaredDeviations = self.__squaredDeviations + statistics.__squaredDeviations + \
+                difference * difference * (self.__count * statistics.__count / merged.__count)
+
+        merged.__total = self.__total
+        merged.__compensation = self.__compensation + statistics.__compensation
+        merged.__addToTotal(statistics.__total)
+
+        merged.__isOrdered = self.__isOrdered and statistics.__isOrdered
+
+        if merged.__isOrdered:
+            merged.__minValue = min((value for value in (self.__minValue, statistics.__minValue) if value is not None),
+                                    default=None)
+            merged.__maxValue = max((value for value in (self.__maxValue, statistics.__maxValue) if value is not None),
+                                    default=None)
+
+        return merged
+
+    def __len__(self) -> int:
+        """
+        Returns the number of numbers accumulated
+
+        :return: The number of numbers accumulated
+        """
+
+        return self.__count
+
+    def sum(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the sum of the accumulated numbers
+
+        :return: The compensated sum of the accumulated numbers
+        """
+
+        if self.__compensation == 0.0 or (type(self.__total) is float and not isfinite(self.__total)):
+            return self.__total
+
+        return self.__total + self.__compensation
+
+    def mean(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the mean of the accumulated numbers
+
+        :return: The mean of the accumulated numbers
+        :raises ZeroDivisionError: Raised if no numbers have been
+            accumulated
+        """
+
+        return self.sum() / self.__count
+
+    def variance(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the sample variance of the accumulated numbers
+
+        :return: The variance of the accumulated numbers
+        :raises ZeroDivisionError: Raised if fewer than two numbers
+            have been accumulated
+        """
+
+        return self.__squaredDeviations / (self.__count - 1)
+
+    def standardDeviation(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the sample standard deviation of the accumulated
+        numbers
+
+        :return: The standard deviation of the accumulated numbers
+        :raises ZeroDivisionError: Raised if fewer than two numbers
+            have been accumulated
+        """
+
+        return sqrtMath(self.variance())
+
+    def __checkOrdered(self) -> NoReturn:
+        """
+        Checks that the minimum and maximum of the accumulated
+        numbers are known
+
+        :return: None
+        :raises TypeError: Raised if a complex number or quaternion
+            has been accumulated
+        :raises ValueError: Raised if no numbers have been
+            accumulated
+        """
+
+        if not self.__isOrdered:
+            raise TypeError("Only real numbers have a minimum and maximum")
+        if self.__count == 0:
+            raise ValueError("No numbers have been accumulated")
+
+    def min(self) -> Union[int, float]:
+        """
+        Returns the smallest accumulated number
+
+        :return: The minimum of the accumulated numbers
+        :raises TypeError: Raised if a complex number or quaternion
+            has been accumulated
+        :raises ValueError: Raised if no numbers have been
+            accumulated
+        """
+
+        self.__checkOrdered()
+
+        return self.__minValue
+
+    def max(self) -> Union[int, float]:
+        """
+        Returns the largest accumulated number
+
+        :return: The maximum of the accumulated numbers
+        :raises TypeError: Raised if a complex number or quaternion
+            has been accumulated
+        :raises ValueError: Raised if no numbers have been
+            accumulated
+        """
+
+        self.__checkOrdered()
+
+        return self.__maxValue
+
+    def range(self) -> Union[int, float]:
+        """
+        Returns the range of the accumulated numbers
+
+        :return: The range of the accumulated numbers
+        :raises TypeError: Raised if a complex number or quaternion
+            has been accumulated
+        :raises ValueError: Raised if no numbers have been
+            accumulated
+        """
+
+        self.__checkOrdered()
+
+        return self.__maxValue - self.__minValue
+
+    def midrange(self) -> Union[int, float]:
+        """
+        Returns the midrange of the accumulated numbers
+
+        :return: The midrange of the accumulated numbers
+        :raises TypeError: Raised if a complex number or quaternion
+            has been accumulated
+        :raises ValueError: Raised if no numbers have been
+            accumulated
+        """
+
+        self.__checkOrdered()
+
+        return (self.__minValue + self.__maxValue) / 2
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of this accumulator
+
+        :return: A string representation of this accumulator
+        """
+
+        return "RunningStatistics(count=" + str(self.__count) + ", mean=" + \
+            str(self.mean() if self.__count > 0 else None) + ")"
@@ -0,0 +1,427 @@
+from typing import Union, List, Tuple, BinaryIO
+from array import array
+from numbers import Integral, Real, Complex
+from struct import Struct
+import sys
+import numpy
+from calc.MathEntity import MathEntity
+from calc.Quaternion import Quaternion
+from calc.Vector import Vector
+from calc.Matrix import Matrix
+from calc.NumberList import NumberList
+from calc.QuaternionArray import QuaternionArray
+from calc.QuantileSketch import QuantileSketch
+
+
+# Every serialized entity starts with a header holding the magic
+# bytes, the format version, the type of entity, the type of its
+# elements, flags, its number of rows and columns and the length
+# of the payload that follows. Everything is little-endian
+_HEADER = Struct("<4sBBBBQQQ")
+_MAGIC = b"CALC"
+_VERSION = 1
+HEADER_SIZE = _HEADER.size
+
+_QUATERNION = 1
+_VECTOR = 2
+_MATRIX = 3
+_NUMBER_LIST = 4
+_QUATERNION_ARRAY = 5
+_QUANTILE_SKETCH = 6
+
+# Quantile sketches store their capacity in place of the number of
+# columns. Their payload holds the number of levels and the number
+# of values at each level as 64-bit ints, followed by the minimum,
+# the maximum and the values of each level as floats
+#
+# Homogeneous payloads are stored as one packed array. Mixed
+# payloads start with one tag per element, followed by a packed
+# section for each of the element types, in the order of the tags
+_INT64 = 1
+_FLOAT64 = 2
+_COMPLEX128 = 3
+_QUATERNION256 = 4
+_MIXED = 5
+
+_ARRAY_BACKED = 1
+
+_TAGS = {int: _INT64, bool: _INT64, float: _FLOAT64, complex: _COMPLEX128, Quaternion: _QUATERNION256}
+_SWAP_BYTES = sys.byteorder == "big"
+
+
+def __tagOf(value: Union[int, float, complex, Quaternion]) -> int:
+    """
+    Returns the element type tag of the given value
+
+    :param value: An element of an entity
+    :return: The tag of the type of the given value
+    :raises TypeError: Raised if the value is not a number
+        that can be serialized
+    """
+
+    tag = _TAGS.get(type(value))
+
+    if tag is not None:
+        return tag
+    elif isinstance(value, Integral):
+        return _INT64
+    elif isinstance(value, Real):
+        return _FLOAT64
+    elif isinstance(value, Complex):
+        return _COMPLEX128
+
+    raise TypeError("Values of type " + type(value).__name__ + " cannot be serialized")
+
+
+def __packArray(values: array) -> bytes:
+    """
+    Returns the little-endian bytes of the given array
+
+    :param values: The array to be packed
+    :return: The bytes of the array in little-endian order
+    """
+
+    if _SWAP_BYTES:
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def __packElements(tag: int, values: List[Union[int, float, complex, Quaternion]]) -> bytes:
+    """
+    Packs values that all have the given element type
+
+    :param tag: The element type of the values
+    :param values: The values to be packed
+    :return: The packed values
+    :raises OverflowError: Raised if an int does not fit in
+        64 bits
+    """
+
+    if tag == _INT64:
+        packed = array("q", values)
+    elif tag == _FLOAT64:
+        packed = array("d", values)
+    elif tag == _COMPLEX128:
+        packed = array("d", [component for value in values for component in (value.real, value.imag)])
+    else:
+        packed = array("d", [component for value in values for component in value])
+
+    return __packArray(packed)
+
+
+def __packTable(values: List[Union[int, float, complex, Quaternion]]) -> Tuple[int, bytes]:
+    """
+    Packs the given values, using a single packed array if
+    they all have the same type
+
+    :param values: The values to be packed
+    :return: The element type of the payload and the payload
+    """
+
+    tags = bytes(__tagOf(value) for value in values)
+
+    if len(tags) == 0:
+        return (_FLOAT64, b"")
+
+    firstTag = tags[0]
+
+    if tags.count(firstTag) == len(tags):
+        return (firstTag, __packElements(firstTag, values))
+
+    sections = [tags]
+
+    for tag in (_INT64, _FLOAT64, _COMPLEX128, _QUATERNION256):
+        if tag in tags:
+            sections.append(__packElements(tag, [value for (value, valueTag) in zip(values, tags) if valueTag == tag]))
+
+    return (_MIXED, b"".join(sections))
+
+
+def serialize(entity: Union[MathEntity, QuantileSketch]) -> bytes:
+    """
+    Converts the given entity to its binary representation.
+    The representation holds a header describing the type and
+    shape of the entity and the type of its elements, followed
+    by the elements packed as little-endian 64-bit ints and
+    floats. Complex numbers and quaternions take two and four
+    floats. Tables with more than one type of element keep the
+    type of each element. Bools are stored as ints
+
+    :param entity: A Quaternion, Vector, Matrix, NumberList,
+        QuaternionArray or QuantileSketch
+    :return: The binary representation of the entity
+    :raises TypeError: Raised if the entity, or one of its
+        elements, cannot be serialized
+    :raises OverflowError: Raised if an int element does not
+        fit in 64 bits
+    """
+
+    flags = 0
+
+    if isinstance(entity, Quaternion):
+        (kind, tag, rowLength, columnLength) = (_QUATERNION, _QUATERNION256, 1, 1)
+        payload = __packElements(_QUATERNION256, [entity])
+    elif isinstance(entity, Matrix):
+        (kind, rowLength, columnLength) = (_MATRIX, entity.rowLength, entity.columnLength)
+
+        if entity.isArrayBacked:
+            values = numpy.ascontiguousarray(entity.toArray())
+            flags = _ARRAY_BACKED
+            tag = _COMPLEX128 if values.dtype == numpy.complex128 else _FLOAT64
+            payload = values.astype("<c16" if tag == _COMPLEX128 else "<f8", copy=False).tobytes()
+        else:
+            (tag, payload) = __packTable(list(entity))
+    elif isinstance(entity, QuaternionArray):
+        (kind, tag, rowLength, columnLength) = (_QUATERNION_ARRAY, _QUATERNION256, len(entity), 1)
+        payload = b"".join(numpy.ascontiguousarray(component, dtype="<f8").tobytes()
+                           for component in (entity.real, entity.imag0, entity.imag1, entity.imag2))
+    elif isinstance(entity, (Vector, NumberList)):
+        (kind, rowLength, columnLength) = (_VECTOR if isinstance(entity, Vector) else _NUMBER_LIST, len(entity), 1)
+        (tag, payload) = __packTable(list(entity))
+    elif isinstance(entity, QuantileSketch):
+        (kind, tag, rowLength, columnLength) = (_QUANTILE_SKETCH, _FLOAT64, len(entity), entity.capacity)
+        (minValue, maxValue, levels) = entity._state()
+        payload = __packArray(array("q", [len(levels)] + [len(level) for level in levels])) + \
+            __packArray(array("d", [minValue, maxValue] + [value for level in levels for value in level]))
+    else:
+        raise TypeError(type(entity).__name__ + " cannot be serialized")
+
+    return _HEADER.pack(_MAGIC, _VERSION, kind, tag, flags, rowLength, columnLength, len(payload)) + payload
+
+
+def _packMatrixHeader(rowLength: int, columnLength: int, isComplex: bool) -> bytes:
+    """
+    Creates the header of an array-backed matrix whose packed
+    float64 or complex128 elements follow the header
+
+    :param rowLength: The number of rows of the matrix
+    :param columnLength: The number of columns of the matrix
+    :param isComplex: True if the elements are complex128, False
+        if they are float64
+    :return: The header of the matrix
+    """
+
+    (tag, itemSize) = (_COMPLEX128, 16) if isComplex else (_FLOAT64, 8)
+
+    return _HEADER.pack(_MAGIC, _VERSION, _MATRIX, tag, _ARRAY_BACKED, rowLength, columnLength,
+                        rowLength * columnLength * itemSize)
+
+
+def _unpackMatrixHeader(header: bytes) -> Tuple[int, int, bool]:
+    """
+    Reads the header of a matrix whose elements are packed
+    float64 or complex128 values, so that the elements can be
+    used directly from the bytes that follow the header
+
+    :param header: The header of a serialized matrix
+    :return: The number of rows, the number of columns and
+        whether the elements are complex128
+    :raises ValueError: Raised if the header does not describe
+        a matrix of float64 or complex128 elements
+    """
+
+    (kind, tag, flags, rowLength, columnLength, payloadLength) = __readHeader(memoryview(header))
+
+    if kind != _MATRIX or (tag != _FLOAT64 and tag != _COMPLEX128):
+        raise ValueError("Only matrices of floats or complex numbers can be read in place")
+
+    return (rowLength, columnLength, tag == _COMPLEX128)
+
+
+def __readHeader(view: memoryview) -> Tuple[int, int, int, int, int, int]:
+    """
+    Reads and checks the header at the start of the given view
+
+    :param view: A view of a binary representation
+    :return: The entity type, element type, flags, number of rows,
+        number of columns and payload length
+    :raises ValueError: Raised if the view does not start with a
+        valid header
+    """
+
+    if len(view) < HEADER_SIZE:
+        raise ValueError("Data is too short to contain a header")
+
+    (magic, version, kind, tag, flags, rowLength, columnLength, payloadLength) = _HEADER.unpack_from(view)
+
+    if magic != _MAGIC:
+        raise ValueError("Data is not a serialized entity")
+    if version != _VERSION:
+        raise ValueError("Unsupported format version " + str(version))
+    if not _QUATERNION <= kind <= _QUANTILE_SKETCH or not _INT64 <= tag <= _MIXED:
+        raise ValueError("Unknown entity or element type")
+
+    return (kind, tag, flags, rowLength, columnLength, payloadLength)
+
+
+def __unpackArray(view: memoryview, typecode: str) -> array:
+    """
+    Copies the little-endian values in the given view into an
+    array
+
+    :param view: A view of packed values
+    :param typecode: The typecode of the values
+    :return: The array of values
+    """
+
+    values = array(typecode)
+    values.frombytes(view)
+
+    if _SWAP_BYTES:
+        values.byteswap()
+
+    return values
+
+
+def __unpackElements(view: memoryview, tag: int, count: int) -> Tuple[List[Union[int, float, complex, Quaternion]], int]:
+    """
+    Unpacks the given number of values of one element type from
+    the start of the given view
+
+    :param view: A view of packed values
+    :param tag: The element type of the values
+    :param count: The number of values to unpack
+    :return: The unpacked values and the number of bytes read
+    """
+
+    if tag == _INT64:
+        size = 8 * count
+        return (__unpackArray(view[:size], "q").tolist(), size)
+    elif tag == _FLOAT64:
+        size = 8 * count
+        return (__unpackArray(view[:size], "d").tolist(), size)
+    elif tag == _COMPLEX128:
+        size = 16 * count
+        components = __unpackArray(view[:size], "d")
+        return (list(map(complex, components[0::2], components[1::2])), size)
+    else:
+        size = 32 * count
+        components = __unpackArray(view[:size], "d")
+        return (list(map(Quaternion, components[0::4], components[1::4], components[2::4], components[3::4])), size)
+
+
+def __unpackTable(view: memoryview, tag: int, count: int) -> List[Union[int, float, complex, Quaternion]]:
+    """
+    Unpacks a payload written by __packTable
+
+    :param view: A view of the payload
+    :param tag: The element type of the payload
+    :param count: The number of elements in the payload
+    :return: The unpacked elements
+    """
+
+    if tag != _MIXED:
+        return __unpackElements(view, tag, count)[0]
+
+    tags = bytes(view[:count])
+    offset = count
+    sections = [None] * _MIXED
+
+    for sectionTag in (_INT64, _FLOAT64, _COMPLEX128, _QUATERNION256):
+        sectionCount = tags.count(sectionTag)
+
+        if sectionCount > 0:
+            (values, size) = __unpackElements(view[offset:], sectionTag, sectionCount)
+            sections[sectionTag] = iter(values)
+            offset += size
+
+    return [next(sections[valueTag]) for valueTag in tags]
+
+
+def __unpackSketch(view: memoryview, count: int, capacity: int) -> QuantileSketch:
+    """
+    Unpacks the payload of a quantile sketch
+
+    :param view: A view of the payload
+    :param count: The number of values the sketch describes
+    :param capacity: The capacity of the sketch
+    :return: The unpacked sketch
+    """
+
+    levelCount = __unpackArray(view[:8], "q")[0]
+    offset = 8 * (levelCount + 1)
+    levelSizes = __unpackArray(view[8: offset], "q")
+    values = __unpackArray(view[offset:], "d").tolist()
+    (minValue, maxValue) = values[:2]
+    levels = []
+    start = 2
+
+    for levelSize in levelSizes:
+        levels.append(values[start: start + levelSize])
+        start += levelSize
+
+    return QuantileSketch._createFromState(capacity, count, minValue, maxValue, levels)
+
+
+def deserialize(data: Union[bytes, bytearray, memoryview]) -> Union[MathEntity, QuantileSketch]:
+    """
+    Converts a binary representation created by serialize back
+    into the entity it represents. Elements are copied out of the
+    data in bulk, without being converted to or from strings
+
+    :param data: The binary representation of an entity
+    :return: The entity represented by the data
+    :raises ValueError: Raised if the data is not a valid
+        binary representation
+    """
+
+    view = memoryview(data).cast("B")
+    (kind, tag, flags, rowLength, columnLength, payloadLength) = __readHeader(view)
+    payload = view[HEADER_SIZE: HEADER_SIZE + payloadLength]
+
+    if len(payload) != payloadLength:
+        raise ValueError("Data is shorter than its header describes")
+
+    if kind == _QUATERNION:
+        return __unpackElements(payload, _QUATERNION256, 1)[0][0]
+    elif kind == _MATRIX:
+        if flags & _ARRAY_BACKED:
+            dtype = "<c16" if tag == _COMPLEX128 else "<f8"
+            values = numpy.frombuffer(payload, dtype=dtype).reshape(rowLength, columnLength)
+            return Matrix.createMatrixFromArray(values.astype(dtype[1:], copy=True))
+
+        return Matrix.createMatrixFrom1DList(__unpackTable(payload, tag, rowLength * columnLength),
+                                             rowLength, columnLength)
+    elif kind == _QUATERNION_ARRAY:
+        components = numpy.frombuffer(payload, dtype="<f8").astype(numpy.float64).reshape(4, rowLength)
+        return QuaternionArray.createQuaternionArrayFromArrays(components[0], components[1],
+                                                               components[2], components[3])
+    elif kind == _QUANTILE_SKETCH:
+        return __unpackSketch(payload, rowLength, columnLength)
+    elif kind == _VECTOR:
+        return Vector(__unpackTable(payload, tag, rowLength))
+    else:
+        return NumberList(__unpackTable(payload, tag, rowLength))
+
+
+def writeEntity(entity: Union[MathEntity, QuantileSketch], file: BinaryIO) -> None:
+    """
+    Writes the binary representation of the given entity to the
+    given binary file. Several entities can be written to the same
+    file and read back in order with readEntity
+
+    :param entity: The entity to be written
+    :param file: A file opened for writing bytes
+    :return: None
+    :raises TypeError: Raised if the entity cannot be serialized
+    """
+
+    file.write(serialize(entity))
+
+
+def readEntity(file: BinaryIO) -> Union[MathEntity, QuantileSketch]:
+    """
+    Reads the next entity written by writeEntity from the given
+    binary file
+
+    :param file: A file opened for reading bytes
+    :return: The entity that was read
+    :raises ValueError: Raised if the file does not contain a
+        valid binary representation at its current position
+    """
+
+    header = file.read(HEADER_SIZE)
+    payloadLength = __readHeader(memoryview(header))[5]
+
+    return deserialize(header + file.read(payloadLength))
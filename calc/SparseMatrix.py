@@ -0,0 +1,831 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Iterator, Mapping, Optional, Callable
+from array import array
+from bisect import bisect_left
+from operator import add, sub
+import numpy
+from calc.MathEntity import MathEntity
+from calc.Quaternion import Quaternion
+from calc.Matrix import Matrix
+from calc.Vector import Vector
+
+
+class SparseMatrix(MathEntity):
+    """
+    Instances of this class represent matrices whose elements are
+    mostly zeros. Only the non-zero elements are stored, in
+    compressed sparse row (CSR) form: the non-zero values of each
+    row in order of their columns, the column of each value, and
+    the position in those lists at which each row starts. Addition,
+    multiplication and transposition take time proportional to
+    the number of non-zero elements rather than to the number of
+    rows times the number of columns. Like dense matrices, sparse
+    matrices may contain real numbers, complex numbers and
+    quaternions
+    """
+
+    def __init__(self, rowLength: int, columnLength: int,
+                 elements: Optional[Mapping[Tuple[int, int], Union[int, float, complex, Quaternion]]]=None):
+        """
+        Constructs a sparse matrix of the given size whose elements
+        are zero, except for the given elements
+
+        :param rowLength: The number of rows of the matrix
+        :param columnLength: The number of columns of the matrix
+        :param elements: A mapping from the row and column indices
+            of elements to their values. Zeros are not stored
+        :raises IndexError: Raised if the indices of an element are
+            outside the bounds of the matrix
+        """
+
+        rows = [[] for _ in range(rowLength)]
+
+        if elements is not None:
+            for ((rowIndex, columnIndex), value) in elements.items():
+                if rowIndex < 0 or rowIndex >= rowLength or columnIndex < 0 or columnIndex >= columnLength:
+                    raise IndexError("Invalid indices")
+
+                if value != 0:
+                    rows[rowIndex].append((columnIndex, value))
+
+        self.__rowLength = rowLength
+        self.__columnLength = columnLength
+        self.__values = []
+        self.__columnIndices = array("q")
+        self.__rowPointers = array("q", [0])
+
+        for row in rows:
+            row.sort(key=lambda element: element[0])
+
+            for (columnIndex, value) in row:
+                self.__columnIndices.append(columnIndex)
+                self.__values.append(value)
+
+            self.__rowPointers.append(len(self.__values))
+
+    @staticmethod
+    def __createFromStorage(values: List[Union[int, float, complex, Quaternion]], columnIndices: array,
+                            rowPointers: array, rowLength: int, columnLength: int) -> SparseMatrix:
+        """
+        Creates a sparse matrix that uses the given CSR storage
+        directly
+
+        :param values: The non-zero values, row by row
+        :param columnIndices: The column of each value
+        :param rowPointers: The index in the values at which each
+            row starts, followed by the number of values
+        :param rowLength: The number of rows of the matrix
+        :param columnLength: The number of columns of the matrix
+        :return: A sparse matrix backed by the given storage
+        """
+
+        matrix = SparseMatrix(0, 0)
+        matrix.__values = values
+        matrix.__columnIndices = columnIndices
+        matrix.__rowPointers = rowPointers
+        matrix.__rowLength = rowLength
+        matrix.__columnLength = columnLength
+
+        return matrix
+
+    @staticmethod
+    def createSparseMatrixFromMatrix(matrix: Matrix) -> SparseMatrix:
+        """
+        Creates a sparse matrix with the non-zero elements of the
+        given dense matrix
+
+        :param matrix: A dense matrix
+        :return: A sparse matrix with the same elements as the
+            given matrix
+        """
+
+        rowLength = matrix.rowLength
+        columnLength = matrix.columnLength
+
+        if matrix.isArrayBacked:
+            table = matrix.toArray()
+            (rowIndices, columnIndices) = numpy.nonzero(table)
+            rowPointers = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(rowIndices, minlength=rowLength))))
+
+            return SparseMatrix.__createFromStorage(table[rowIndices, columnIndices].tolist(),
+                                                    array("q", columnIndices.tolist()),
+                                                    array("q", rowPointers.tolist()),
+                                                    rowLength, columnLength)
+
+        table = list(matrix)
+        values = []
+        columnIndices = array("q")
+        rowPointers = array("q", [0])
+
+        for rowStart in range(0, rowLength * columnLength, columnLength):
+            for columnIndex in range(columnLength):
+                value = table[rowStart + columnIndex]
+
+                if value != 0:
+                    columnIndices.append(columnIndex)
+                    values.append(value)
+
+            rowPointers.append(len(values))
+
+        return SparseMatrix.__createFromStorage(values, columnIndices, rowPointers, rowLength, columnLength)
+
+    @staticmethod
+    def identity(size: int) -> SparseMatrix:
+        """
+        Returns a square sparse identity matrix of the given size
+
+        :param size: The number of rows and columns of the matrix
+        :return: A sparse identity matrix
+        """
+
+        return SparseMatrix.__createFromStorage([1] * size, array("q", range(size)), array("q", range(size + 1)),
+                                                size, size)
+
+    @property
+    def rowLength(self) -> int:
+        """
+        Returns the number of rows that this matrix
+        has
+
+        :return: The number of rows that this matrix
+            has
+        """
+
+        return self.__rowLength
+
+    @property
+    def columnLength(self) -> int:
+        """
+        Returns the number of columns that this
+        matrix has
+
+        :return: The number of columns that this
+            matrix has
+        """
+
+        return self.__columnLength
+
+    @property
+    def nonZeroCount(self) -> int:
+        """
+        Returns the number of non-zero elements stored in
+        this matrix
+
+        :return: The number of non-zero elements
+        """
+
+        return len(self.__values)
+
+    @property
+    def isSquare(self) -> bool:
+        """
+        Checks if the number of rows that this matrix has is equal
+        to the number of columns it has
+
+        :return: True if the number of rows that this matrix has is
+            equal to the number of columns it has
+        """
+
+        return self.__rowLength == self.__columnLength
+
+    def equalDimensions(self, matrix: Union[SparseMatrix, Matrix]) -> bool:
+        """
+        Checks if two matrices have the same number
+        of rows and the same number of columns
+
+        :param matrix: The matrix to be compared with
+            this matrix
+        :return: True if this matrix has the same dimensions
+            as the given matrix, False otherwise
+        """
+
+        return self.__rowLength == matrix.rowLength and self.__columnLength == matrix.columnLength
+
+    def multipliable(self, matrix: Union[SparseMatrix, Matrix]) -> bool:
+        """
+        Checks if this matrix can be multiplied by another
+        matrix with this matrix on the left side of the
+        multiplication operator
+
+        :param matrix: The matrix on the right side of the
+            multiplication operator
+        :return: True if (self * matrix) is possible, False
+            otherwise
+        """
+
+        return self.__columnLength == matrix.rowLength
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements contained in this matrix,
+        including the zeros
+
+        :return: The number of elements contained in this matrix
+        """
+
+        return self.__rowLength * self.__columnLength
+
+    def __find(self, coordinates: Tuple[int, int]) -> Tuple[int, bool]:
+        """
+        Finds where the element at the given row and column indices
+        is, or would be, stored
+
+        :param coordinates: A tuple containing the row and column
+            indices of an element
+        :return: The index of the element in the stored values, and
+            whether the element is stored there
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        """
+
+        (rowIndex, columnIndex) = coordinates
+
+        if rowIndex < 0 or rowIndex >= self.__rowLength or columnIndex < 0 or columnIndex >= self.__columnLength:
+            raise IndexError("Invalid indices")
+
+        rowEnd = self.__rowPointers[rowIndex + 1]
+        index = bisect_left(self.__columnIndices, columnIndex, self.__rowPointers[rowIndex], rowEnd)
+
+        return (index, index < rowEnd and self.__columnIndices[index] == columnIndex)
+
+    def __getitem__(self, coordinates: Tuple[int, int]) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be returned
+        :return: The element at the given row and column indices
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        """
+
+        (index, isStored) = self.__find(coordinates)
+
+        return self.__values[index] if isStored else 0
+
+    def __setitem__(self, coordinates: Tuple[int, int], value: Union[int, float, complex, Quaternion]) -> None:
+        """
+        Sets the element at the given row and column indices.
+        Adding or removing a non-zero element moves every element
+        stored after it, so matrices should rather be built from
+        all of their elements at once
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be set
+        :param value: The new value of the element
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        """
+
+        (index, isStored) = self.__find(coordinates)
+
+        if isStored and value != 0:
+            self.__values[index] = value
+
+            return
+
+        if isStored:
+            del self.__values[index]
+            del self.__columnIndices[index]
+            change = -1
+        elif value != 0:
+            self.__values.insert(index, value)
+            self.__columnIndices.insert(index, coordinates[1])
+            change = 1
+        else:
+            return
+
+        rowPointers = self.__rowPointers
+
+        for rowIndex in range(coordinates[0] + 1, self.__rowLength + 1):
+            rowPointers[rowIndex] += change
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Union[int, float, complex, Quaternion]]]:
+        """
+        Returns an iterator over the non-zero elements of this
+        matrix, row by row
+
+        :return: An iterator over the row and column indices and
+            the value of each non-zero element
+        """
+
+        values = self.__values
+        columnIndices = self.__columnIndices
+        rowPointers = self.__rowPointers
+
+        for rowIndex in range(self.__rowLength):
+            for index in range(rowPointers[rowIndex], rowPointers[rowIndex + 1]):
+                yield ((rowIndex, columnIndices[index]), values[index])
+
+    def __iter__(self) -> Iterator[Union[int, float, complex, Quaternion]]:
+        """
+        Returns a row-by-row iterator over the elements of this
+        matrix, including the zeros
+
+        :return: A row-by-row iterator over the elements of this
+            matrix
+        """
+
+        values = self.__values
+        columnIndices = self.__columnIndices
+        rowPointers = self.__rowPointers
+
+        for rowIndex in range(self.__rowLength):
+            row = [0] * self.__columnLength
+
+            for index in range(rowPointers[rowIndex], rowPointers[rowIndex + 1]):
+                row[columnIndices[index]] = values[index]
+
+            yield from row
+
+    def toMatrix(self) -> Matrix:
+        """
+        Creates a dense matrix with the elements of this matrix
+
+        :return: A dense matrix with the same elements as this
+            matrix
+        """
+
+        return Matrix.createMatrixFrom1DList(list(self), self.__rowLength, self.__columnLength)
+
+    def transpose(self) -> SparseMatrix:
+        """
+        Returns the transpose of this matrix. The values are
+        moved directly to their rows in the transpose, which takes
+        time proportional to the number of non-zero elements
+
+        :return: The transpose of this matrix
+        """
+
+        values = self.__values
+        columnIndices = self.__columnIndices
+        rowPointers = self.__rowPointers
+        count = len(values)
+
+        transposedPointers = array("q", [0]) * (self.__columnLength + 1)
+
+        for columnIndex in columnIndices:
+            transposedPointers[columnIndex + 1] += 1
+
+        for columnIndex in range(self.__columnLength):
+            transposedPointers[columnIndex + 1] += transposedPointers[columnIndex]
+
+        positions = transposedPointers[:-1]
+        transposedValues = [0] * count
+        transposedColumns = array("q", [0]) * count
+
+        for rowIndex in range(self.__rowLength):
+            for index in range(rowPointers[rowIndex], rowPointers[rowIndex + 1]):
+                columnIndex = columnIndices[index]
+                position = positions[columnIndex]
+                transposedValues[position] = values[index]
+                transposedColumns[position] = rowIndex
+                positions[columnIndex] = position + 1
+
+        return SparseMatrix.__createFromStorage(transposedValues, transposedColumns, transposedPointers,
+                                                self.__columnLength, self.__rowLength)
+
+    def __hasQuaternions(self) -> bool:
+        """
+        Checks if any element of this matrix is a quaternion
+
+        :return: True if this matrix contains a quaternion, False
+            otherwise
+        """
+
+        return any(type(value) is Quaternion for value in self.__values)
+
+    def __valueArray(self) -> numpy.ndarray:
+        """
+        Returns the non-zero values of this matrix as a numpy
+        array. This matrix must not contain quaternions
+
+        :return: A 1D array of the non-zero values
+        """
+
+        if not self.__values:
+            return numpy.zeros(0)
+
+        return numpy.asarray(self.__values)
+
+    def __combineSparse(self, matrix: SparseMatrix, operation: Callable) -> SparseMatrix:
+        """
+        Applies an elementwise operation to this matrix and
+        another sparse matrix by merging their rows
+
+        :param matrix: The sparse matrix on the right side
+        :param operation: The elementwise operation
+        :return: The sparse result
+        """
+
+        (leftValues, leftColumns, leftPointers) = (self.__values, self.__columnIndices, self.__rowPointers)
+        (rightValues, rightColumns, rightPointers) = (matrix.__values, matrix.__columnIndices, matrix.__rowPointers)
+        values = []
+        columnIndices = array("q")
+        rowPointers = array("q", [0])
+
+        for rowIndex in range(self.__rowLength):
+            (leftIndex, leftEnd) = (leftPointers[rowIndex], leftPointers[rowIndex + 1])
+            (rightIndex, rightEnd) = (rightPointers[rowIndex], rightPointers[rowIndex + 1])
+
+            while leftIndex < leftEnd or rightIndex < rightEnd:
+                leftColumn = leftColumns[leftIndex] if leftIndex < leftEnd else self.__columnLength
+                rightColumn = rightColumns[rightIndex] if rightIndex < rightEnd else self.__columnLength
+
+                if leftColumn == rightColumn:
+                    value = operation(leftValues[leftIndex], rightValues[rightIndex])
+                    (columnIndex, leftIndex, rightIndex) = (leftColumn, leftIndex + 1, rightIndex + 1)
+                elif leftColumn < rightColumn:
+                    value = operation(leftValues[leftIndex], 0)
+                    (columnIndex, leftIndex) = (leftColumn, leftIndex + 1)
+                else:
+                    value = operation(0, rightValues[rightIndex])
+                    (columnIndex, rightIndex) = (rightColumn, rightIndex + 1)
+
+                if value != 0:
+                    columnIndices.append(columnIndex)
+                    values.append(value)
+
+            rowPointers.append(len(values))
+
+        return SparseMatrix.__createFromStorage(values, columnIndices, rowPointers,
+                                                self.__rowLength, self.__columnLength)
+
+    def __combineDense(self, matrix: Matrix, operation: Callable, isLeft: bool) -> Matrix:
+        """
+        Applies an elementwise operation to this matrix and a
+        dense matrix. Only the elements stored in this matrix are
+        combined with the dense elements; the rest of the result
+        is the dense matrix combined with zero
+
+        :param matrix: The dense matrix
+        :param operation: The elementwise operation
+        :param isLeft: True if this matrix is the left operand,
+            False if it is the right operand
+        :return: The dense result
+        """
+
+        columnLength = self.__columnLength
+
+        if matrix.isArrayBacked and not self.__hasQuaternions():
+            dense = matrix.toArray()
+            result = operation(0, dense) if isLeft else operation(dense, 0)
+
+            if numpy.iscomplexobj(self.__valueArray()) and not numpy.iscomplexobj(result):
+                result = result.astype(numpy.complex128)
+
+            for ((rowIndex, columnIndex), value) in self.items():
+                denseValue = dense[rowIndex, columnIndex]
+                result[rowIndex, columnIndex] = operation(value, denseValue) if isLeft else operation(denseValue, value)
+
+            return Matrix.createMatrixFromArray(result)
+
+        dense = list(matrix)
+        table = [operation(0, value) for value in dense] if isLeft else [operation(value, 0) for value in dense]
+
+        for ((rowIndex, columnIndex), value) in self.items():
+            index = rowIndex * columnLength + columnIndex
+            table[index] = operation(value, dense[index]) if isLeft else operation(dense[index], value)
+
+        return Matrix.createMatrixFrom1DList(table, self.__rowLength, columnLength)
+
+    def add(self, matrix: Union[SparseMatrix, Matrix]) -> Union[SparseMatrix, Matrix]:
+        """
+        Adds the given matrix to this matrix
+
+        :param matrix: A sparse or dense matrix
+        :return: The sum, which is sparse if both matrices are
+            sparse and dense otherwise
+        :raises ArithmeticError: Raised if the two matrices do not
+            have the same dimensions
+        """
+
+        if not self.equalDimensions(matrix):
+            raise ArithmeticError("Matrices must be of equal dimensions to be added together")
+
+        if isinstance(matrix, SparseMatrix):
+            return self.__combineSparse(matrix, add)
+
+        return self.__combineDense(matrix, add, True)
+
+    def subtract(self, matrix: Union[SparseMatrix, Matrix]) -> Union[SparseMatrix, Matrix]:
+        """
+        Subtracts the given matrix from this matrix
+
+        :param matrix: A sparse or dense matrix
+        :return: The difference, which is sparse if both matrices
+            are sparse and dense otherwise
+        :raises ArithmeticError: Raised if the two matrices do not
+            have the same dimensions
+        """
+
+        if not self.equalDimensions(matrix):
+            raise ArithmeticError("Matrices must be of equal dimensions to be subtracted from each other")
+
+        if isinstance(matrix, SparseMatrix):
+            return self.__combineSparse(matrix, sub)
+
+        return self.__combineDense(matrix, sub, True)
+
+    def subtractFrom(self, matrix: Matrix) -> Matrix:
+        """
+        Subtracts this matrix from the given dense matrix
+
+        :param matrix: The dense matrix on the left side of the
+            subtraction
+        :return: The dense difference
+        :raises ArithmeticError: Raised if the two matrices do not
+            have the same dimensions
+        """
+
+        if not self.equalDimensions(matrix):
+            raise ArithmeticError("Matrices must be of equal dimensions to be subtracted from each other")
+
+        return self.__combineDense(matrix, sub, False)
+
+    def __scale(self, scalar: Union[int, float, complex, Quaternion], isLeft: bool) -> SparseMatrix:
+        """
+        Multiplies every element of this matrix by a scalar
+
+        :param scalar: The scalar
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The sparse product
+        """
+
+        if isLeft:
+            products = [value * scalar for value in self.__values]
+        else:
+            products = [scalar * value for value in self.__values]
+
+        if all(product != 0 for product in products):
+            return SparseMatrix.__createFromStorage(products, array("q", self.__columnIndices),
+                                                    array("q", self.__rowPointers),
+                                                    self.__rowLength, self.__columnLength)
+
+        return SparseMatrix(self.__rowLength, self.__columnLength,
+                            {coordinates: product for ((coordinates, _), product) in zip(self.items(), products)})
+
+    def __multiplySparse(self, matrix: SparseMatrix) -> SparseMatrix:
+        """
+        Multiplies this matrix by another sparse matrix, one row of
+        the product at a time. Each non-zero element of a row of this
+        matrix scales the matching row of the other matrix into an
+        accumulator for the row of the product
+
+        :param matrix: The sparse matrix on the right side
+        :return: The sparse product
+        """
+
+        (leftValues, leftColumns, leftPointers) = (self.__values, self.__columnIndices, self.__rowPointers)
+        (rightValues, rightColumns, rightPointers) = (matrix.__values, matrix.__columnIndices, matrix.__rowPointers)
+        values = []
+        columnIndices = array("q")
+        rowPointers = array("q", [0])
+
+        for rowIndex in range(self.__rowLength):
+            accumulator = {}
+
+            for leftIndex in range(leftPointers[rowIndex], leftPointers[rowIndex + 1]):
+                leftValue = leftValues[leftIndex]
+                sharedIndex = leftColumns[leftIndex]
+
+                for rightIndex in range(rightPointers[sharedIndex], rightPointers[sharedIndex + 1]):
+                    columnIndex = rightColumns[rightIndex]
+                    product = leftValue * rightValues[rightIndex]
+
+                    if columnIndex in accumulator:
+                        accumulator[columnIndex] = accumulator[columnIndex] + product
+                    else:
+                        accumulator[columnIndex] = product
+
+            for columnIndex in sorted(accumulator):
+                value = accumulator[columnIndex]
+
+                if value != 0:
+                    columnIndices.append(columnIndex)
+                    values.append(value)
+
+            rowPointers.append(len(values))
+
+        return SparseMatrix.__createFromStorage(values, columnIndices, rowPointers,
+                                                self.__rowLength, matrix.__columnLength)
+
+    def __multiplyDense(self, matrix: Matrix) -> Matrix:
+        """
+        Multiplies this matrix by a dense matrix. Each row of the
+        product sums the rows of the dense matrix selected by the
+        non-zero elements of the matching row of this matrix
+
+        :param matrix: The dense matrix on the right side
+        :return: The dense product
+        """
+
+        (values, columnIndices, rowPointers) = (self.__values, self.__columnIndices, self.__rowPointers)
+        columnLength = matrix.columnLength
+
+        if matrix.isArrayBacked and not self.__hasQuaternions():
+            dense = matrix.toArray()
+            valueArray = self.__valueArray()
+            columnArray = numpy.frombuffer(columnIndices, dtype=numpy.int64)
+            result = numpy.zeros((self.__rowLength, columnLength), dtype=numpy.result_type(valueArray, dense))
+
+            for rowIndex in range(self.__rowLength):
+                (rowStart, rowEnd) = (rowPointers[rowIndex], rowPointers[rowIndex + 1])
+
+                if rowStart < rowEnd:
+                    result[rowIndex] = valueArray[rowStart: rowEnd] @ dense[columnArray[rowStart: rowEnd]]
+
+            return Matrix.createMatrixFromArray(result)
+
+        dense = list(matrix)
+        table = []
+
+        for rowIndex in range(self.__rowLength):
+            row = [0] * columnLength
+
+            for index in range(rowPointers[rowIndex], rowPointers[rowIndex + 1]):
+                value = values[index]
+                denseStart = columnIndices[index] * columnLength
+                row = [total + value * denseValue
+                       for (total, denseValue) in zip(row, dense[denseStart: denseStart + columnLength])]
+
+            table.extend(row)
+
+        return Matrix.createMatrixFrom1DList(table, self.__rowLength, columnLength)
+
+    def __multiplyDenseOnLeft(self, matrix: Matrix) -> Matrix:
+        """
+        Multiplies a dense matrix, on the left, by this matrix.
+        Each element of the dense matrix scales the non-zero
+        elements of the matching row of this matrix into a row of
+        the product
+
+        :param matrix: The dense matrix on the left side
+        :return: The dense product
+        """
+
+        (values, columnIndices, rowPointers) = (self.__values, self.__columnIndices, self.__rowPointers)
+        (rowLength, sharedLength) = (matrix.rowLength, matrix.columnLength)
+        columnLength = self.__columnLength
+
+        if matrix.isArrayBacked and not self.__hasQuaternions():
+            dense = matrix.toArray()
+            valueArray = self.__valueArray()
+            columnArray = numpy.frombuffer(columnIndices, dtype=numpy.int64)
+            result = numpy.zeros((rowLength, columnLength), dtype=numpy.result_type(valueArray, dense))
+
+            for sharedIndex in range(sharedLength):
+                (rowStart, rowEnd) = (rowPointers[sharedIndex], rowPointers[sharedIndex + 1])
+
+                if rowStart < rowEnd:
+                    result[:, columnArray[rowStart: rowEnd]] += numpy.outer(dense[:, sharedIndex],
+                                                                             valueArray[rowStart: rowEnd])
+
+            return Matrix.createMatrixFromArray(result)
+
+        dense = list(matrix)
+        table = []
+
+        for rowStart in range(0, rowLength * sharedLength, sharedLength):
+            row = [0] * columnLength
+
+            for sharedIndex in range(sharedLength):
+                denseValue = dense[rowStart + sharedIndex]
+
+                for index in range(rowPointers[sharedIndex], rowPointers[sharedIndex + 1]):
+                    columnIndex = columnIndices[index]
+                    row[columnIndex] = row[columnIndex] + denseValue * values[index]
+
+            table.extend(row)
+
+        return Matrix.createMatrixFrom1DList(table, rowLength, columnLength)
+
+    def multiply(self, value: Union[SparseMatrix, Matrix, Vector, int, float, complex, Quaternion]) \
+            -> Union[SparseMatrix, Matrix]:
+        """
+        Multiplies this matrix, on the left, by the given matrix,
+        vector or scalar
+
+        :param value: A sparse or dense matrix, a vector or a
+            scalar
+        :return: The product. The product of two sparse matrices,
+            or of a sparse matrix and a scalar, is sparse. The
+            product with a dense matrix is dense, and the product
+            with a vector is a dense matrix with a single column
+        :raises ArithmeticError: Raised if the dimensions of the
+            given matrix or vector do not match the number of
+            columns of this matrix
+        """
+
+        if isinstance(value, SparseMatrix):
+            if not self.multipliable(value):
+                raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+            return self.__multiplySparse(value)
+
+        if isinstance(value, Matrix):
+            if not self.multipliable(value):
+                raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+            return self.__multiplyDense(value)
+
+        if isinstance(value, Vector):
+            if self.__columnLength != len(value):
+                raise ArithmeticError("The Matrix must have the same column length as the Vector's dimensions")
+
+            (values, columnIndices, rowPointers) = (self.__values, self.__columnIndices, self.__rowPointers)
+            table = []
+
+            for rowIndex in range(self.__rowLength):
+                total = 0
+
+                for index in range(rowPointers[rowIndex], rowPointers[rowIndex + 1]):
+                    total = total + values[index] * value[columnIndices[index]]
+
+                table.append(total)
+
+            return Matrix.createMatrixFrom1DList(table, self.__rowLength, 1)
+
+        return self.__scale(value, True)
+
+    def multiplyOnLeft(self, value: Union[Matrix, Vector, int, float, complex, Quaternion]) -> Union[SparseMatrix, Matrix]:
+        """
+        Multiplies the given dense matrix, vector or scalar, on the
+        left, by this matrix, on the right
+
+        :param value: A dense matrix, a vector or a scalar
+        :return: The product. The product with a scalar is sparse,
+            the product with a dense matrix is dense, and the
+            product with a vector is a dense matrix with a single
+            row
+        :raises ArithmeticError: Raised if the dimensions of the
+            given matrix or vector do not match the number of rows
+            of this matrix
+        """
+
+        if isinstance(value, Matrix):
+            if not value.multipliable(self):
+                raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+            return self.__multiplyDenseOnLeft(value)
+
+        if isinstance(value, Vector):
+            if len(value) != self.__rowLength:
+                raise ArithmeticError("Dimensions of the Vector must be the same as the row length of the Matrix")
+
+            return self.__multiplyDenseOnLeft(Matrix.createMatrixFrom1DList(value.toList(), 1, len(value)))
+
+        return self.__scale(value, False)
+
+    def __copy__(self) -> SparseMatrix:
+        """
+        Creates a copy of this matrix
+
+        :return: A copy of this matrix
+        """
+
+        return SparseMatrix.__createFromStorage(list(self.__values), array("q", self.__columnIndices),
+                                                array("q", self.__rowPointers),
+                                                self.__rowLength, self.__columnLength)
+
+    def __deepcopy__(self, memodict: dict={}) -> SparseMatrix:
+        """
+        Creates a deep copy of this matrix. The elements are
+        numbers, so this is the same as a shallow copy
+
+        :param memodict: N/A
+        :return: A deep copy of this matrix
+        """
+
+        return self.__copy__()
+
+    def __hash__(self) -> int:
+        """
+        Computes a hash code for this matrix from its non-zero
+        elements. The hash code is the same as that of a Matrix
+        with the same elements, since zeros add nothing to the
+        hash code of a Matrix, so equal matrices hash equally
+
+        :return: A hash code for this matrix
+        """
+
+        hashCode = 0
+        MODIFIER = 31
+
+        for value in self.__values:
+            hashCode += MODIFIER * hash(value)
+
+        return hashCode
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of this matrix that lists
+        its non-zero elements
+
+        :return: A string representation of this matrix
+        """
+
+        elements = ", ".join(str(coordinates) + ": " + str(value) for (coordinates, value) in self.items())
+
+        return "SparseMatrix(" + str(self.__rowLength) + "x" + str(self.__columnLength) + ", {" + elements + "})"
@@ -0,0 +1,689 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Iterator, Optional, Callable
+from operator import add, sub
+from abc import ABCMeta, abstractmethod
+import numpy
+from calc.MathEntity import MathEntity
+from calc.Quaternion import Quaternion
+from calc.Matrix import Matrix
+from calc.Vector import Vector
+
+
+def _inverseOf(value: Union[int, float, complex, Quaternion]) -> Union[float, complex, Quaternion]:
+    """
+    Computes the multiplicative inverse of the given value
+
+    :param value: The value to be inverted
+    :return: The multiplicative inverse of the given value
+    """
+
+    if type(value) is Quaternion:
+        return value.conjugate() * (1 / (abs(value) ** 2))
+
+    return 1 / value
+
+
+def _leftDivide(denominator: Union[int, float, complex, Quaternion],
+                numerator: Union[int, float, complex, Quaternion]) -> Union[int, float, complex, Quaternion]:
+    """
+    Computes denominator^-1 * numerator without assuming that
+    multiplication is commutative
+
+    :param denominator: The value being divided by
+    :param numerator: The value being divided
+    :return: The numerator multiplied on the left by the inverse
+        of the denominator
+    """
+
+    if type(denominator) is Quaternion or type(numerator) is Quaternion:
+        return _inverseOf(denominator) * numerator
+
+    return numerator / denominator
+
+
+def _rightDivide(numerator: Union[int, float, complex, Quaternion],
+                 denominator: Union[int, float, complex, Quaternion]) -> Union[int, float, complex, Quaternion]:
+    """
+    Computes numerator * denominator^-1 without assuming that
+    multiplication is commutative
+
+    :param numerator: The value being divided
+    :param denominator: The value being divided by
+    :return: The numerator multiplied on the right by the inverse
+        of the denominator
+    """
+
+    if type(denominator) is Quaternion or type(numerator) is Quaternion:
+        return numerator * _inverseOf(denominator)
+
+    return numerator / denominator
+
+
+class StructuredMatrix(MathEntity, metaclass=ABCMeta):
+    """
+    Superclass for square matrices whose elements are zero outside
+    of a known pattern, such as diagonal, triangular and banded
+    matrices. Only the elements inside the pattern are stored, and
+    products with dense matrices and vectors only visit those
+    elements. Subclasses keep the result in their own structure
+    where it has one and fall back to a dense matrix otherwise.
+    This class cannot be instantiated itself, since each subclass
+    defines how its elements are stored
+    """
+
+    def __init__(self, size: int):
+        """
+        Constructs a structured matrix with the given number of
+        rows and columns
+
+        :param size: The number of rows and columns of the matrix
+        """
+
+        self.__size = size
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of rows and columns of this matrix
+
+        :return: The number of rows and columns of this matrix
+        """
+
+        return self.__size
+
+    @property
+    def rowLength(self) -> int:
+        """
+        Returns the number of rows that this matrix
+        has
+
+        :return: The number of rows that this matrix
+            has
+        """
+
+        return self.__size
+
+    @property
+    def columnLength(self) -> int:
+        """
+        Returns the number of columns that this
+        matrix has
+
+        :return: The number of columns that this
+            matrix has
+        """
+
+        return self.__size
+
+    @property
+    def isSquare(self) -> bool:
+        """
+        Checks if the number of rows that this matrix has is equal
+        to the number of columns it has, which is always the case
+        for structured matrices
+
+        :return: True
+        """
+
+        return True
+
+    def equalDimensions(self, matrix: Union[StructuredMatrix, Matrix]) -> bool:
+        """
+        Checks if two matrices have the same number
+        of rows and the same number of columns
+
+        :param matrix: The matrix to be compared with
+            this matrix
+        :return: True if this matrix has the same dimensions
+            as the given matrix, False otherwise
+        """
+
+        return self.__size == matrix.rowLength and self.__size == matrix.columnLength
+
+    def multipliable(self, matrix: Union[StructuredMatrix, Matrix]) -> bool:
+        """
+        Checks if this matrix can be multiplied by another
+        matrix with this matrix on the left side of the
+        multiplication operator
+
+        :param matrix: The matrix on the right side of the
+            multiplication operator
+        :return: True if (self * matrix) is possible, False
+            otherwise
+        """
+
+        return self.__size == matrix.rowLength
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements contained in this matrix,
+        including the zeros outside of its structure
+
+        :return: The number of elements contained in this matrix
+        """
+
+        return self.__size * self.__size
+
+    def _checkIndices(self, coordinates: Tuple[int, int]) -> None:
+        """
+        Checks that the given row and column indices are inside
+        the bounds of this matrix
+
+        :param coordinates: A tuple containing the row and column
+            indices of an element
+        :return: None
+        :raises IndexError: Raised if the indices are outside the
+            bounds of this matrix
+        """
+
+        if coordinates[0] < 0 or coordinates[0] >= self.__size or coordinates[1] < 0 or coordinates[1] >= self.__size:
+            raise IndexError("Invalid indices")
+
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Union[int, float, complex, Quaternion]]]:
+        """
+        Returns an iterator over the elements stored in this
+        matrix, row by row and in order of their columns
+
+        :return: An iterator over the row and column indices and
+            the value of each stored element
+        """
+
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def determinant(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the determinant of this matrix
+
+        :return: The determinant of this matrix
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def transpose(self) -> StructuredMatrix:
+        """
+        Returns the transpose of this matrix
+
+        :return: The transpose of this matrix
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def _solveValues(self, values: List[Union[int, float, complex, Quaternion]]) \
+            -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Solves this matrix times x equals the given values for x
+
+        :param values: The right-hand side of the equation
+        :return: The solution of the equation
+        :raises ArithmeticError: Raised if this matrix is singular
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def _scale(self, scalar: Union[int, float, complex, Quaternion], isLeft: bool) -> StructuredMatrix:
+        """
+        Multiplies every element of this matrix by a scalar
+
+        :param scalar: The scalar
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The product, with the structure of this matrix
+        """
+
+        raise NotImplementedError
+
+    def _combine(self, matrix: StructuredMatrix, operation: Callable, isLeft: bool) -> Optional[StructuredMatrix]:
+        """
+        Applies an elementwise operation to this matrix and another
+        structured matrix, keeping the structure of this matrix
+
+        :param matrix: The other structured matrix
+        :param operation: The elementwise operation
+        :param isLeft: True if this matrix is the left operand,
+            False if it is the right operand
+        :return: The structured result, or None if the result
+            does not have the structure of this matrix
+        """
+
+        return None
+
+    def _multiply(self, matrix: StructuredMatrix, isLeft: bool) -> Optional[StructuredMatrix]:
+        """
+        Multiplies this matrix and another structured matrix,
+        keeping the structure of this matrix
+
+        :param matrix: The other structured matrix
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The structured product, or None if the product
+            does not have the structure of this matrix
+        """
+
+        return None
+
+    def __rowEntries(self) -> List[List[Tuple[int, Union[int, float, complex, Quaternion]]]]:
+        """
+        Groups the stored elements of this matrix by row
+
+        :return: The column and value of each stored element of
+            each row
+        """
+
+        rows = [[] for _ in range(self.__size)]
+
+        for ((rowIndex, columnIndex), value) in self.items():
+            rows[rowIndex].append((columnIndex, value))
+
+        return rows
+
+    def __hasQuaternions(self) -> bool:
+        """
+        Checks if any element of this matrix is a quaternion
+
+        :return: True if this matrix contains a quaternion, False
+            otherwise
+        """
+
+        return any(type(value) is Quaternion for (_, value) in self.items())
+
+    def __iter__(self) -> Iterator[Union[int, float, complex, Quaternion]]:
+        """
+        Returns a row-by-row iterator over the elements of this
+        matrix, including the zeros outside of its structure
+
+        :return: A row-by-row iterator over the elements of this
+            matrix
+        """
+
+        for entries in self.__rowEntries():
+            row = [0] * self.__size
+
+            for (columnIndex, value) in entries:
+                row[columnIndex] = value
+
+            yield from row
+
+    def toMatrix(self) -> Matrix:
+        """
+        Creates a dense matrix with the elements of this matrix
+
+        :return: A dense matrix with the same elements as this
+            matrix
+        """
+
+        return Matrix.createMatrixFrom1DList(list(self), self.__size, self.__size)
+
+    def toArray(self) -> numpy.ndarray:
+        """
+        Returns the elements of this matrix as a 2D numpy array
+
+        :return: A 2D array with the same elements as this matrix
+        :raises TypeError: Raised if this matrix contains
+            quaternions
+        """
+
+        if self.__hasQuaternions():
+            raise TypeError("Matrices containing Quaternions cannot be converted to arrays")
+
+        return numpy.array(list(self)).reshape(self.__size, self.__size)
+
+    def solve(self, rhs: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        """
+        Solves this matrix times x equals the given vector or
+        matrix for x, using the structure of this matrix
+
+        :param rhs: A vector or a matrix whose columns are each
+            a right-hand side of the equation
+        :return: The solution of the equation, of the same type
+            as the given right-hand side
+        :raises ArithmeticError: Raised if this matrix is singular
+            or if the right-hand side does not have as many rows
+            as this matrix
+        """
+
+        if isinstance(rhs, Vector):
+            if len(rhs) != self.__size:
+                raise ArithmeticError("The number of values must match the size of the Matrix")
+
+            return Vector(self._solveValues(rhs.toList()))
+
+        if rhs.rowLength != self.__size:
+            raise ArithmeticError("The right-hand side must have the same row length as the Matrix")
+
+        rhsColumns = rhs.columnLength
+        rhsTable = list(rhs)
+        table = [0] * (self.__size * rhsColumns)
+
+        for columnIndex in range(rhsColumns):
+            for (rowIndex, value) in enumerate(self._solveValues(rhsTable[columnIndex::rhsColumns])):
+                table[rowIndex * rhsColumns + columnIndex] = value
+
+        return Matrix.createMatrixFrom1DList(table, self.__size, rhsColumns)
+
+    def inverse(self) -> Union[StructuredMatrix, Matrix]:
+        """
+        Returns the inverse of this matrix, as a dense matrix
+        unless a subclass keeps its structure
+
+        :return: The inverse of this matrix
+        :raises ArithmeticError: Raised if this matrix is singular
+        """
+
+        size = self.__size
+        table = [0] * (size * size)
+
+        for columnIndex in range(size):
+            unitColumn = [0] * size
+            unitColumn[columnIndex] = 1
+
+            try:
+                column = self._solveValues(unitColumn)
+            except ArithmeticError:
+                raise ArithmeticError("Singular Matrices do not have inverses")
+
+            for (rowIndex, value) in enumerate(column):
+                table[rowIndex * size + columnIndex] = value
+
+        return Matrix.createMatrixFrom1DList(table, size, size)
+
+    def __combineDense(self, matrix: Matrix, operation: Callable, isLeft: bool) -> Matrix:
+        """
+        Applies an elementwise operation to this matrix and a
+        dense matrix
+
+        :param matrix: The dense matrix
+        :param operation: The elementwise operation
+        :param isLeft: True if this matrix is the left operand,
+            False if it is the right operand
+        :return: The dense result
+        """
+
+        dense = list(matrix)
+        table = [operation(0, value) for value in dense] if isLeft else [operation(value, 0) for value in dense]
+
+        for ((rowIndex, columnIndex), value) in self.items():
+            index = rowIndex * self.__size + columnIndex
+            table[index] = operation(value, dense[index]) if isLeft else operation(dense[index], value)
+
+        return Matrix.createMatrixFrom1DList(table, self.__size, self.__size)
+
+    def __combineWith(self, matrix: Union[StructuredMatrix, Matrix], operation: Callable) -> Union[StructuredMatrix, Matrix]:
+        """
+        Applies an elementwise operation to this matrix, on the
+        left, and another matrix, on the right
+
+        :param matrix: A structured or dense matrix
+        :param operation: The elementwise operation
+        :return: The result, which is structured if both matrices
+            share a structure and dense otherwise
+        """
+
+        if isinstance(matrix, Matrix):
+            return self.__combineDense(matrix, operation, True)
+
+        result = self._combine(matrix, operation, True)
+
+        if result is None:
+            result = matrix._combine(self, operation, False)
+
+        if result is None:
+            result = operation(self.toMatrix(), matrix.toMatrix())
+
+        return result
+
+    def add(self, matrix: Union[StructuredMatrix, Matrix]) -> Union[StructuredMatrix, Matrix]:
+        """
+        Adds the given matrix to this matrix
+
+        :param matrix: A structured or dense matrix
+        :return: The sum, which is structured if both matrices
+            share a structure and dense otherwise
+        :raises ArithmeticError: Raised if the two matrices do not
+            have the same dimensions
+        """
+
+        if not self.equalDimensions(matrix):
+            raise ArithmeticError("Matrices must be of equal dimensions to be added together")
+
+        return self.__combineWith(matrix, add)
+
+    def subtract(self, matrix: Union[StructuredMatrix, Matrix]) -> Union[StructuredMatrix, Matrix]:
+        """
+        Subtracts the given matrix from this matrix
+
+        :param matrix: A structured or dense matrix
+        :return: The difference, which is structured if both
+            matrices share a structure and dense otherwise
+        :raises ArithmeticError: Raised if the two matrices do not
+            have the same dimensions
+        """
+
+        if not self.equalDimensions(matrix):
+            raise ArithmeticError("Matrices must be of equal dimensions to be subtracted from each other")
+
+        return self.__combineWith(matrix, sub)
+
+    def subtractFrom(self, matrix: Matrix) -> Matrix:
+        """
+        Subtracts this matrix from the given dense matrix
+
+        :param matrix: The dense matrix on the left side of the
+            subtraction
+        :return: The dense difference
+        :raises ArithmeticError: Raised if the two matrices do not
+            have the same dimensions
+        """
+
+        if not self.equalDimensions(matrix):
+            raise ArithmeticError("Matrices must be of equal dimensions to be subtracted from each other")
+
+        return self.__combineDense(matrix, sub, False)
+
+    def __multiplyDense(self, matrix: Matrix) -> Matrix:
+        """
+        Multiplies this matrix by a dense matrix. Each row of the
+        product only sums the rows of the dense matrix selected
+        by the stored elements of the matching row of this matrix
+
+        :param matrix: The dense matrix on the right side
+        :return: The dense product
+        """
+
+        columnLength = matrix.columnLength
+        rows = self.__rowEntries()
+
+        if matrix.isArrayBacked and not self.__hasQuaternions():
+            dense = matrix.toArray()
+            result = numpy.zeros((self.__size, columnLength), dtype=dense.dtype)
+
+            for (rowIndex, entries) in enumerate(rows):
+                if entries:
+                    (columnIndices, values) = zip(*entries)
+                    values = numpy.asarray(values)
+
+                    if numpy.iscomplexobj(values) and not numpy.iscomplexobj(result):
+                        result = result.astype(numpy.complex128)
+
+                    result[rowIndex] = values @ dense[list(columnIndices)]
+
+            return Matrix.createMatrixFromArray(result)
+
+        dense = list(matrix)
+        table = []
+
+        for entries in rows:
+            row = [0] * columnLength
+
+            for (columnIndex, value) in entries:
+                denseStart = columnIndex * columnLength
+                row = [total + value * denseValue
+                       for (total, denseValue) in zip(row, dense[denseStart: denseStart + columnLength])]
+
+            table.extend(row)
+
+        return Matrix.createMatrixFrom1DList(table, self.__size, columnLength)
+
+    def __multiplyDenseOnLeft(self, matrix: Matrix) -> Matrix:
+        """
+        Multiplies a dense matrix, on the left, by this matrix.
+        Each element of the dense matrix only scales the stored
+        elements of the matching row of this matrix
+
+        :param matrix: The dense matrix on the left side
+        :return: The dense product
+        """
+
+        rowLength = matrix.rowLength
+        size = self.__size
+        rows = self.__rowEntries()
+
+        if matrix.isArrayBacked and not self.__hasQuaternions():
+            dense = matrix.toArray()
+            result = numpy.zeros((rowLength, size), dtype=dense.dtype)
+
+            for (sharedIndex, entries) in enumerate(rows):
+                if entries:
+                    (columnIndices, values) = zip(*entries)
+                    product = numpy.outer(dense[:, sharedIndex], numpy.asarray(values))
+
+                    if numpy.iscomplexobj(product) and not numpy.iscomplexobj(result):
+                        result = result.astype(numpy.complex128)
+
+                    result[:, list(columnIndices)] += product
+
+            return Matrix.createMatrixFromArray(result)
+
+        dense = list(matrix)
+        table = []
+
+        for rowStart in range(0, rowLength * size, size):
+            row = [0] * size
+
+            for (sharedIndex, entries) in enumerate(rows):
+                denseValue = dense[rowStart + sharedIndex]
+
+                for (columnIndex, value) in entries:
+                    row[columnIndex] = row[columnIndex] + denseValue * value
+
+            table.extend(row)
+
+        return Matrix.createMatrixFrom1DList(table, rowLength, size)
+
+    def multiply(self, value: Union[StructuredMatrix, Matrix, Vector, int, float, complex, Quaternion]) \
+            -> Union[StructuredMatrix, Matrix]:
+        """
+        Multiplies this matrix, on the left, by the given matrix,
+        vector or scalar
+
+        :param value: A structured or dense matrix, a vector or a
+            scalar
+        :return: The product. Products with a scalar keep the
+            structure of this matrix, as do products with a
+            structured matrix where possible. Products with a
+            dense matrix are dense, and products with a vector
+            are a dense matrix with a single column
+        :raises ArithmeticError: Raised if the dimensions of the
+            given matrix or vector do not match the size of this
+            matrix
+        """
+
+        if isinstance(value, (StructuredMatrix, Matrix)):
+            if not self.multipliable(value):
+                raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+            if isinstance(value, Matrix):
+                return self.__multiplyDense(value)
+
+            result = self._multiply(value, True)
+
+            if result is None:
+                result = value._multiply(self, False)
+
+            if result is None:
+                result = self.toMatrix() * value.toMatrix()
+
+            return result
+
+        if isinstance(value, Vector):
+            if self.__size != len(value):
+                raise ArithmeticError("The Matrix must have the same column length as the Vector's dimensions")
+
+            table = [0] * self.__size
+
+            for ((rowIndex, columnIndex), element) in self.items():
+                table[rowIndex] = table[rowIndex] + element * value[columnIndex]
+
+            return Matrix.createMatrixFrom1DList(table, self.__size, 1)
+
+        return self._scale(value, True)
+
+    def multiplyOnLeft(self, value: Union[Matrix, Vector, int, float, complex, Quaternion]) \
+            -> Union[StructuredMatrix, Matrix]:
+        """
+        Multiplies the given dense matrix, vector or scalar, on the
+        left, by this matrix, on the right
+
+        :param value: A dense matrix, a vector or a scalar
+        :return: The product. Products with a scalar keep the
+            structure of this matrix, products with a dense matrix
+            are dense, and products with a vector are a dense matrix
+            with a single row
+        :raises ArithmeticError: Raised if the dimensions of the
+            given matrix or vector do not match the size of this
+            matrix
+        """
+
+        if isinstance(value, Matrix):
+            if not value.multipliable(self):
+                raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
+
+            return self.__multiplyDenseOnLeft(value)
+
+        if isinstance(value, Vector):
+            if len(value) != self.__size:
+                raise ArithmeticError("Dimensions of the Vector must be the same as the row length of the Matrix")
+
+            table = [0] * self.__size
+
+            for ((rowIndex, columnIndex), element) in self.items():
+                table[columnIndex] = table[columnIndex] + value[rowIndex] * element
+
+            return Matrix.createMatrixFrom1DList(table, 1, self.__size)
+
+        return self._scale(value, False)
+
+    def __hash__(self) -> int:
+        """
+        Computes a hash code for this matrix from its stored
+        elements. The hash code is the same as that of a Matrix
+        with the same elements, since zeros add nothing to the
+        hash code of a Matrix, so equal matrices hash equally
+
+        :return: A hash code for this matrix
+        """
+
+        hashCode = 0
+        MODIFIER = 31
+
+        for value in (value for (_, value) in self.items()):
+            hashCode += MODIFIER * hash(value)
+
+        return hashCode
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of this matrix that lists
+        its stored elements
+
+        :return: A string representation of this matrix
+        """
+
+        elements = ", ".join(str(coordinates) + ": " + str(value) for (coordinates, value) in self.items())
+
+        return type(self).__name__ + "(" + str(self.__size) + "x" + str(self.__size) + ", {" + elements + "})"
@@ -0,0 +1,192 @@
+from __future__ import annotations
+from typing import Union, List, Optional, Callable
+from calc.MathFunction import sqrtMath
+from calc.Quaternion import Quaternion
+
+
+class Summary:
+    """
+    Instances of this class hold the descriptive statistics of a
+    list of numbers or a probability distribution. The statistics
+    that only need a pass over the data are computed when the
+    summary is created. The median and the mode, which are more
+    expensive, are each computed the first time they are read and
+    kept from then on, so they describe the data as it is at that
+    time
+    """
+
+    def __init__(self, count: int, minValue: Optional[Union[int, float]], maxValue: Optional[Union[int, float]],
+                 mean: Union[int, float, complex, Quaternion],
+                 variance: Optional[Union[int, float, complex, Quaternion]],
+                 median: Callable[[], Union[int, float]],
+                 mode: Callable[[], List[Union[int, float, complex, Quaternion]]]):
+        """
+        Constructs a summary from statistics that have already been
+        computed and functions that compute the others
+
+        :param count: The number of values
+        :param minValue: The smallest value, or None if the values
+            cannot be ordered
+        :param maxValue: The largest value, or None if the values
+            cannot be ordered
+        :param mean: The mean of the values
+        :param variance: The variance of the values, or None if it
+            is undefined
+        :param median: A function computing the median
+        :param mode: A function computing the mode
+        """
+
+        self.__count = count
+        self.__minValue = minValue
+        self.__maxValue = maxValue
+        self.__mean = mean
+        self.__variance = variance
+        self.__medianFunction = median
+        self.__modeFunction = mode
+        self.__median = None
+        self.__mode = None
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of values summarized
+
+        :return: The number of values
+        """
+
+        return self.__count
+
+    @property
+    def min(self) -> Optional[Union[int, float]]:
+        """
+        Returns the smallest value
+
+        :return: The minimum, or None if the values include complex
+            numbers or quaternions
+        """
+
+        return self.__minValue
+
+    @property
+    def max(self) -> Optional[Union[int, float]]:
+        """
+        Returns the largest value
+
+        :return: The maximum, or None if the values include complex
+            numbers or quaternions
+        """
+
+        return self.__maxValue
+
+    @property
+    def range(self) -> Optional[Union[int, float]]:
+        """
+        Returns the range of the values
+
+        :return: The range, or None if the values include complex
+            numbers or quaternions
+        """
+
+        if self.__minValue is None:
+            return None
+
+        return self.__maxValue - self.__minValue
+
+    @property
+    def midrange(self) -> Optional[Union[int, float]]:
+        """
+        Returns the midrange of the values
+
+        :return: The midrange, or None if the values include
+            complex numbers or quaternions
+        """
+
+        if self.__minValue is None:
+            return None
+
+        return (self.__minValue + self.__maxValue) / 2
+
+    @property
+    def mean(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the mean of the values
+
+        :return: The mean
+        """
+
+        return self.__mean
+
+    @property
+    def variance(self) -> Optional[Union[int, float, complex, Quaternion]]:
+        """
+        Returns the variance of the values
+
+        :return: The variance, or None if it is undefined, such as
+            for a single number
+        """
+
+        return self.__variance
+
+    @property
+    def standardDeviation(self) -> Optional[Union[int, float, complex, Quaternion]]:
+        """
+        Returns the standard deviation of the values
+
+        :return: The standard deviation, or None if the variance is
+            undefined
+        """
+
+        if self.__variance is None:
+            return None
+
+        return sqrtMath(self.__variance)
+
+    @property
+    def median(self) -> Union[int, float]:
+        """
+        Returns the median of the values, computing it the first
+        time it is read
+
+        :return: The median
+        :raises TypeError: Raised if the values include complex
+            numbers or quaternions
+        """
+
+        if self.__medianFunction is not None:
+            self.__median = self.__medianFunction()
+            self.__medianFunction = None
+
+        return self.__median
+
+    @property
+    def mode(self) -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Returns the mode of the values, computing it the first time
+        it is read
+
+        :return: The most frequent values
+        """
+
+        if self.__modeFunction is not None:
+            self.__mode = self.__modeFunction()
+            self.__modeFunction = None
+
+        return list(self.__mode)
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the statistics of this
+        summary that have been computed
+
+        :return: A string representation of this summary
+        """
+
+        fields = [("count", self.__count), ("min", self.__minValue), ("max", self.__maxValue),
+                  ("mean", self.__mean), ("variance", self.__variance)]
+
+        if self.__medianFunction is None:
+            fields.append(("median", self.__median))
+        if self.__modeFunction is None:
+            fields.append(("mode", self.__mode))
+
+        return "Summary(" + ", ".join(name + "=" + str(value) for (name, value) in fields) + ")"
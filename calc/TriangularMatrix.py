@@ -0,0 +1,418 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Iterator, Optional, Callable
+from operator import mul
+from calc.Quaternion import Quaternion
+from calc.Matrix import Matrix
+from calc.StructuredMatrix import StructuredMatrix, _leftDivide
+from calc.DiagonalMatrix import DiagonalMatrix
+
+
+class TriangularMatrix(StructuredMatrix):
+    """
+    Instances of this class represent square matrices whose
+    elements are zero on one side of the diagonal. An upper
+    triangular matrix stores the elements on and above the
+    diagonal, and a lower triangular matrix stores the elements on
+    and below it, packed row by row. The determinant is the product
+    of the diagonal, and solving takes a single forward or backward
+    substitution, which costs time proportional to the size of
+    the matrix squared
+    """
+
+    def __init__(self, rows: List[List[Union[int, float, complex, Quaternion]]], isUpper: bool=True):
+        """
+        Constructs a triangular matrix from the stored part of
+        each of its rows
+
+        :param rows: The rows of the matrix. For an upper
+            triangular matrix, each row holds the elements from
+            the diagonal to the last column. For a lower triangular
+            matrix, each row holds the elements from the first
+            column to the diagonal
+        :param isUpper: True for an upper triangular matrix, False
+            for a lower triangular matrix
+        :raises ValueError: Raised if a row does not hold the
+            number of elements on its side of the diagonal
+        """
+
+        size = len(rows)
+
+        for (rowIndex, row) in enumerate(rows):
+            if len(row) != (size - rowIndex if isUpper else rowIndex + 1):
+                raise ValueError("Each row must hold the elements on its side of the diagonal")
+
+        super().__init__(size)
+
+        self.__isUpper = isUpper
+        self.__values = [value for row in rows for value in row]
+
+    @staticmethod
+    def __createFromValues(values: List[Union[int, float, complex, Quaternion]], size: int,
+                           isUpper: bool) -> TriangularMatrix:
+        """
+        Creates a triangular matrix that uses the given packed
+        rows directly
+
+        :param values: The stored elements, row by row
+        :param size: The number of rows and columns of the matrix
+        :param isUpper: True for an upper triangular matrix, False
+            for a lower triangular matrix
+        :return: A triangular matrix backed by the given values
+        """
+
+        matrix = TriangularMatrix([], isUpper)
+        StructuredMatrix.__init__(matrix, size)
+        matrix.__values = values
+
+        return matrix
+
+    @staticmethod
+    def createTriangularMatrixFromMatrix(matrix: Matrix, isUpper: bool=True) -> TriangularMatrix:
+        """
+        Creates a triangular matrix from one side of the diagonal
+        of the given dense matrix. The elements on the other side
+        are ignored
+
+        :param matrix: A square dense matrix
+        :param isUpper: True to keep the elements on and above the
+            diagonal, False to keep those on and below it
+        :return: A triangular matrix with the elements of the
+            given matrix on the chosen side of the diagonal
+        :raises ArithmeticError: Raised if the given matrix is not
+            square
+        """
+
+        if not matrix.isSquare:
+            raise ArithmeticError("Only square Matrices can be triangular")
+
+        size = matrix.rowLength
+        table = list(matrix)
+
+        if isUpper:
+            rows = [table[rowIndex * size + rowIndex: (rowIndex + 1) * size] for rowIndex in range(size)]
+        else:
+            rows = [table[rowIndex * size: rowIndex * size + rowIndex + 1] for rowIndex in range(size)]
+
+        return TriangularMatrix(rows, isUpper)
+
+    @property
+    def isUpper(self) -> bool:
+        """
+        Checks if this matrix is upper triangular
+
+        :return: True if the elements below the diagonal are
+            zero, False if the elements above it are
+        """
+
+        return self.__isUpper
+
+    def __rowStart(self, rowIndex: int) -> int:
+        """
+        Returns the position of the first stored element of a row
+
+        :param rowIndex: The index of the row
+        :return: The index in the stored values at which the row
+            starts
+        """
+
+        if self.__isUpper:
+            return rowIndex * self.size - rowIndex * (rowIndex - 1) // 2
+
+        return rowIndex * (rowIndex + 1) // 2
+
+    def __columnRange(self, rowIndex: int) -> range:
+        """
+        Returns the columns of a row whose elements are stored
+
+        :param rowIndex: The index of the row
+        :return: The range of the stored columns of the row
+        """
+
+        return range(rowIndex, self.size) if self.__isUpper else range(rowIndex + 1)
+
+    def __isStored(self, coordinates: Tuple[int, int]) -> bool:
+        """
+        Checks if the element at the given indices is on the
+        stored side of the diagonal
+
+        :param coordinates: A tuple containing the row and column
+            indices of an element
+        :return: True if the element is stored, False if it is
+            always zero
+        """
+
+        return coordinates[1] >= coordinates[0] if self.__isUpper else coordinates[1] <= coordinates[0]
+
+    def __indexOf(self, coordinates: Tuple[int, int]) -> int:
+        """
+        Returns the position of a stored element
+
+        :param coordinates: A tuple containing the row and column
+            indices of a stored element
+        :return: The index of the element in the stored values
+        """
+
+        columnOffset = coordinates[1] - coordinates[0] if self.__isUpper else coordinates[1]
+
+        return self.__rowStart(coordinates[0]) + columnOffset
+
+    def __getitem__(self, coordinates: Tuple[int, int]) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be returned
+        :return: The element at the given row and column indices
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        """
+
+        self._checkIndices(coordinates)
+
+        return self.__values[self.__indexOf(coordinates)] if self.__isStored(coordinates) else 0
+
+    def __setitem__(self, coordinates: Tuple[int, int], value: Union[int, float, complex, Quaternion]) -> None:
+        """
+        Sets the element at the given row and column indices
+
+        :param coordinates: A tuple containing the row and column
+            indices of the element to be set
+        :param value: The new value of the element
+        :raises IndexError: Raised if the given row and column
+            indices are outside the bounds of this matrix
+        :raises ValueError: Raised if a non-zero value is placed
+            on the side of the diagonal that is always zero
+        """
+
+        self._checkIndices(coordinates)
+
+        if self.__isStored(coordinates):
+            self.__values[self.__indexOf(coordinates)] = value
+        elif value != 0:
+            raise ValueError("Elements on this side of the diagonal of a TriangularMatrix must be zero")
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Union[int, float, complex, Quaternion]]]:
+        """
+        Returns an iterator over the elements stored in this
+        matrix, row by row
+
+        :return: An iterator over the row and column indices and
+            the value of each stored element
+        """
+
+        values = iter(self.__values)
+
+        for rowIndex in range(self.size):
+            for columnIndex in self.__columnRange(rowIndex):
+                yield ((rowIndex, columnIndex), next(values))
+
+    def __diagonal(self) -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Returns the elements of the diagonal of this matrix
+
+        :return: A list of the elements of the diagonal
+        """
+
+        return [self.__values[self.__indexOf((index, index))] for index in range(self.size)]
+
+    @property
+    def determinant(self) -> Union[int, float, complex, Quaternion]:
+        """
+        Returns the determinant of this matrix, which is the
+        product of its diagonal. For matrices containing
+        quaternions, the product is taken from the top left to
+        the bottom right
+
+        :return: The determinant of this matrix
+        """
+
+        det = 1
+
+        for value in self.__diagonal():
+            det = det * value
+
+        return det
+
+    def transpose(self) -> TriangularMatrix:
+        """
+        Returns the transpose of this matrix, which is triangular
+        on the other side of the diagonal
+
+        :return: The transpose of this matrix
+        """
+
+        size = self.size
+
+        # Each column of this matrix holds its elements on the
+        # other side of the diagonal from its matching row
+        rows = [[self.__values[self.__indexOf((rowIndex, columnIndex))]
+                 for rowIndex in (range(columnIndex + 1) if self.__isUpper else range(columnIndex, size))]
+                for columnIndex in range(size)]
+
+        return TriangularMatrix(rows, not self.__isUpper)
+
+    def _solveValues(self, values: List[Union[int, float, complex, Quaternion]]) \
+            -> List[Union[int, float, complex, Quaternion]]:
+        """
+        Solves this matrix times x equals the given values for x
+        by backward substitution for an upper triangular matrix,
+        or forward substitution for a lower triangular matrix
+
+        :param values: The right-hand side of the equation
+        :return: The solution of the equation
+        :raises ArithmeticError: Raised if this matrix is singular
+        """
+
+        size = self.size
+        stored = self.__values
+        solution = list(values)
+
+        if any(value == 0 for value in self.__diagonal()):
+            raise ArithmeticError("Singular matrices cannot be solved against")
+
+        if self.__isUpper:
+            for rowIndex in range(size - 1, -1, -1):
+                rowStart = self.__rowStart(rowIndex)
+                rowEnd = rowStart + size - rowIndex
+                value = solution[rowIndex] - sum(map(mul, stored[rowStart + 1: rowEnd], solution[rowIndex + 1:]))
+                solution[rowIndex] = _leftDivide(stored[rowStart], value)
+        else:
+            for rowIndex in range(size):
+                rowStart = self.__rowStart(rowIndex)
+                value = solution[rowIndex] - sum(map(mul, stored[rowStart: rowStart + rowIndex], solution[:rowIndex]))
+                solution[rowIndex] = _leftDivide(stored[rowStart + rowIndex], value)
+
+        return solution
+
+    def inverse(self) -> TriangularMatrix:
+        """
+        Returns the inverse of this matrix, which is triangular on
+        the same side of the diagonal
+
+        :return: The inverse of this matrix
+        :raises ArithmeticError: Raised if this matrix is singular
+        """
+
+        if any(value == 0 for value in self.__diagonal()):
+            raise ArithmeticError("Singular Matrices do not have inverses")
+
+        size = self.size
+        columns = []
+
+        for columnIndex in range(size):
+            unitColumn = [0] * size
+            unitColumn[columnIndex] = 1
+            columns.append(self._solveValues(unitColumn))
+
+        rows = [[columns[columnIndex][rowIndex] for columnIndex in self.__columnRange(rowIndex)]
+                for rowIndex in range(size)]
+
+        return TriangularMatrix(rows, self.__isUpper)
+
+    def _scale(self, scalar: Union[int, float, complex, Quaternion], isLeft: bool) -> TriangularMatrix:
+        """
+        Multiplies the stored elements of this matrix by a scalar
+
+        :param scalar: The scalar
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The triangular product
+        """
+
+        if isLeft:
+            values = [value * scalar for value in self.__values]
+        else:
+            values = [scalar * value for value in self.__values]
+
+        return TriangularMatrix.__createFromValues(values, self.size, self.__isUpper)
+
+    def _combine(self, matrix: StructuredMatrix, operation: Callable, isLeft: bool) -> Optional[TriangularMatrix]:
+        """
+        Applies an elementwise operation to this matrix and a
+        triangular matrix on the same side of the diagonal, or a
+        diagonal matrix
+
+        :param matrix: The other structured matrix
+        :param operation: The elementwise operation
+        :param isLeft: True if this matrix is the left operand,
+            False if it is the right operand
+        :return: The triangular result, or None if the other
+            matrix does not have the structure of this matrix
+        """
+
+        if isinstance(matrix, TriangularMatrix) and matrix.__isUpper == self.__isUpper:
+            if isLeft:
+                values = list(map(operation, self.__values, matrix.__values))
+            else:
+                values = list(map(operation, matrix.__values, self.__values))
+        elif isinstance(matrix, DiagonalMatrix):
+            if isLeft:
+                values = [operation(value, 0) for value in self.__values]
+            else:
+                values = [operation(0, value) for value in self.__values]
+
+            for (index, diagonalValue) in enumerate(matrix.diagonal):
+                position = self.__indexOf((index, index))
+                value = self.__values[position]
+                values[position] = operation(value, diagonalValue) if isLeft else operation(diagonalValue, value)
+        else:
+            return None
+
+        return TriangularMatrix.__createFromValues(values, self.size, self.__isUpper)
+
+    def _multiply(self, matrix: StructuredMatrix, isLeft: bool) -> Optional[TriangularMatrix]:
+        """
+        Multiplies this matrix and a triangular matrix on the same
+        side of the diagonal, or a diagonal matrix. Only the
+        products of stored elements are computed
+
+        :param matrix: The other structured matrix
+        :param isLeft: True if this matrix is on the left side of
+            the product, False if it is on the right side
+        :return: The triangular product, or None if the other
+            matrix does not have the structure of this matrix
+        """
+
+        size = self.size
+
+        if isinstance(matrix, DiagonalMatrix):
+            diagonal = matrix.diagonal
+
+            # A diagonal matrix on the right scales the columns and
+            # one on the left scales the rows
+            if isLeft:
+                values = [value * diagonal[columnIndex] for ((_, columnIndex), value) in self.items()]
+            else:
+                values = [diagonal[rowIndex] * value for ((rowIndex, _), value) in self.items()]
+
+            return TriangularMatrix.__createFromValues(values, size, self.__isUpper)
+
+        if not isinstance(matrix, TriangularMatrix) or matrix.__isUpper != self.__isUpper:
+            return None
+
+        (left, right) = (self, matrix) if isLeft else (matrix, self)
+        (leftValues, rightValues) = (left.__values, right.__values)
+        values = []
+
+        for rowIndex in range(size):
+            leftStart = left.__rowStart(rowIndex)
+
+            for columnIndex in self.__columnRange(rowIndex):
+                total = 0
+
+                # Only the shared indices between the row and the
+                # column can have two non-zero elements
+                if self.__isUpper:
+                    sharedIndices = range(rowIndex, columnIndex + 1)
+                    leftOffset = leftStart - rowIndex
+                else:
+                    sharedIndices = range(columnIndex, rowIndex + 1)
+                    leftOffset = leftStart
+
+                for sharedIndex in sharedIndices:
+                    total = total + leftValues[leftOffset + sharedIndex] * \
+                            rightValues[right.__indexOf((sharedIndex, columnIndex))]
+
+                values.append(total)
+
+        return TriangularMatrix.__createFromValues(values, size, self.__isUpper)
@@ -1,5 +1,5 @@
-from typing import Optional, Union
-from re import fullmatch, split
+from typing import Optional, Union, List, Iterable, Iterator, Tuple, TextIO
+from re import compile as compilePattern, split, Match, DOTALL
 from calc.MathEntity import MathEntity
 from calc.Quaternion import Quaternion
 from calc.Vector import Vector
@@ -7,6 +7,116 @@ from calc.Matrix import Matrix
 from calc.NumberList import NumberList
 
 
+# Every pattern is compiled once when this module is imported. The
+# element grammar matches a real number optionally followed by the
+# imaginary parts of a complex number or a quaternion
+_REAL = r"(?:\-?\d+(?:\.\d+)?)(?:e[\+|\-]?\d+)?"
+_UNSIGNED = r"(?:\d+(?:\.\d+)?)(?:e[\+|\-]?\d+)?"
+_ELEMENT = _REAL + r"(?:[\+|\-]" + _UNSIGNED + r"[i|j](?:[\+|\-]" + _UNSIGNED + r"j[\+|\-]" + _UNSIGNED + r"k)?)?"
+
+_INT_PATTERN = compilePattern(r"\s*(\-?\d+)\s*")
+_FLOAT_PATTERN = compilePattern(r"\s*((\-?\d+\.\d+)(e[\+|\-]?\d+)?)\s*")
+_COMPLEX_PATTERN = compilePattern(r"\s*\(?(" + _REAL + r"[\+|\-]" + _UNSIGNED + r"[i|j])\)?\s*")
+_QUATERNION_PATTERN = compilePattern(r"\s*(" + _REAL + r"[\+|\-]" + _UNSIGNED + r"i[\+|\-]" + _UNSIGNED +
+                                     r"j[\+|\-]" + _UNSIGNED + r"k)\s*")
+_SCALAR_PATTERN = compilePattern(r"\s*(?:(?P<int>\-?\d+)|(?P<float>\-?\d+\.\d+(?:e[\+|\-]?\d+)?)|"
+                                 r"(?P<complex>\(?" + _REAL + r"[\+|\-]" + _UNSIGNED + r"[i|j]\)?)|"
+                                 r"(?P<quaternion>" + _REAL + r"[\+|\-]" + _UNSIGNED + r"i[\+|\-]" + _UNSIGNED +
+                                 r"j[\+|\-]" + _UNSIGNED + r"k))\s*")
+_NUMBER_LIST_PATTERN = compilePattern(r"\s*{(" + _ELEMENT + r"\s*\,\s*)*(" + _ELEMENT + r")?}\s*")
+_VECTOR_PATTERN = compilePattern(r"\s*<(" + _REAL + r"\s*\,\s*)*(" + _REAL + r")?>\s*")
+_ROW = r"\[(" + _ELEMENT + r"\s*\,\s*)*(" + _ELEMENT + r")?\]"
+_MATRIX_PATTERN = compilePattern(r"\s*(\[(" + _ROW + r"\s*\,\s*)*(" + _ROW + r")?\])\s*")
+_TRUE_PATTERN = compilePattern(r"\s*[t|T][r|R][u|U][e|E]\s*")
+_FALSE_PATTERN = compilePattern(r"\s*[f|F][a|A][l|L][s|S][e|E]\s*")
+
+# Matches one element of a list or matrix, capturing its real part,
+# the letter after its first imaginary part and its quaternion tail
+_ELEMENT_PATTERN = compilePattern(r"(?P<real>" + _REAL + r")(?:[\+|\-]" + _UNSIGNED + r"(?P<letter>[i|j])(?P<tail>" +
+                                  r"[\+|\-]" + _UNSIGNED + r"j[\+|\-]" + _UNSIGNED + r"k)?)?")
+_MATRIX_TOKEN_PATTERN = compilePattern(r"(?P<separator>\]\s*\,\s*\[)|" + _ELEMENT_PATTERN.pattern)
+_REAL_PATTERN = compilePattern(_REAL)
+
+# Splits streamed text into whitespace, structural symbols and
+# elements. Any other character is matched by the error group
+_STREAM_TOKEN_PATTERN = compilePattern(r"(?P<space>\s+)|(?P<symbol>[\[\]{},])|(?P<element>" +
+                                       _ELEMENT_PATTERN.pattern + r")|(?P<error>.)", DOTALL)
+_STREAM_SYMBOLS = "[]{},"
+STREAM_CHUNK_SIZE = 1 << 20
+
+# States of the streaming parsers
+_START = 0
+_OPENED = 1
+_IN_ROW = 2
+_AFTER_ELEMENT = 3
+_AFTER_COMMA = 4
+_AFTER_ROW = 5
+_AFTER_ROW_COMMA = 6
+_FINISHED = 7
+
+
+def __toComplex(valueString: str) -> complex:
+    """
+    Converts a string that matches the complex number grammar
+    to a complex number
+
+    :param valueString: The string to be converted
+    :return: The complex number represented by the string
+    """
+
+    return complex(valueString.replace("i", "j").strip(" \t\n\r"))
+
+
+def __toQuaternion(valueString: str) -> Quaternion:
+    """
+    Converts a string that matches the quaternion grammar to
+    a quaternion
+
+    :param valueString: The string to be converted
+    :return: The quaternion represented by the string
+    """
+
+    nums = split("[ijk]", valueString.strip(" \t\n\r"))
+    com = complex(nums[0] + "j")
+
+    return Quaternion(com.real, com.imag, float(nums[1]), float(nums[2]))
+
+
+def __appendElement(listOfNums: List[Union[int, float, complex, Quaternion]], match: Match) -> bool:
+    """
+    Converts one element matched by the element pattern and
+    appends it to the given list. Elements that the int, float,
+    Complex and Quaternion parsers would all reject, such as an
+    exponent without a fractional part, are skipped
+
+    :param listOfNums: The list the element is appended to
+    :param match: The match of the element
+    :return: True if the element was appended or skipped, False
+        if it matches the grammar but cannot be converted, such
+        as a complex number written with | in place of i or j
+    """
+
+    text = match.group(0)
+    imaginaryLetter = match.group("letter")
+
+    if imaginaryLetter is None:
+        real = match.group("real")
+
+        if "." in real:
+            listOfNums.append(float(text))
+        elif "e" not in real:
+            listOfNums.append(int(text))
+    elif match.group("tail") is None:
+        try:
+            listOfNums.append(__toComplex(text))
+        except ValueError:
+            return False
+    elif imaginaryLetter == "i":
+        listOfNums.append(__toQuaternion(text))
+
+    return True
+
+
 def parseInt(valueString: str) -> Optional[int]:
     """
     Checks if the given string represents a valid int.
@@ -19,7 +129,7 @@ def parseInt(valueString: str) -> Optional[int]:
         None
     """
 
-    if fullmatch("\s*(\-?\d+)\s*", valueString) is not None:
+    if _INT_PATTERN.fullmatch(valueString) is not None:
         return int(valueString.strip(" \t\n\r"))
     else:
         return None
@@ -37,7 +147,7 @@ def parseFloat(valueString: str) -> Optional[float]:
         None
     """
 
-    if fullmatch("\s*((\-?\d+\.\d+)(e[\+|\-]?\d+)?)\s*", valueString) is not None:
+    if _FLOAT_PATTERN.fullmatch(valueString) is not None:
         return float(valueString.strip(" \t\n\r"))
     else:
         return None
@@ -55,10 +165,8 @@ def parseComplex(valueString: str) -> Optional[complex]:
         returns None
     """
 
-    if fullmatch("\s*\(?((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?[\+|\-](\d+(\.\d+)?)(e[\+|\-]?\d+)?[i|j])\)?\s*", valueString) is not None:
-        strValue = valueString.replace("i", "j").strip(" \t\n\r")
-
-        return complex(strValue)
+    if _COMPLEX_PATTERN.fullmatch(valueString) is not None:
+        return __toComplex(valueString)
     else:
         return None
 
@@ -75,13 +183,10 @@ def parseQuaternion(valueString: str) -> Optional[Quaternion]:
         None
     """
 
-    if fullmatch("\s*((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?[\+|\-](\d+(\.\d+)?)(e[\+|\-]?\d+)?i"
-                 "[\+|\-](\d+(\.\d+)?)(e[\+|\-]?\d+)?j[\+|\-](\d+(\.\d+)?)(e[\+|\-]?\d+)?k)\s*",
-            valueString) is not None:
-        nums = split("[ijk]", valueString.strip(" \t\n\r"))
-        com = complex(nums[0] + "j")
-
-        return Quaternion(com.real, com.imag, float(nums[1]), float(nums[2]))
+    if _QUATERNION_PATTERN.fullmatch(valueString) is not None:
+        return __toQuaternion(valueString)
+    else:
+        return None
 
 
 def parseNumberList(valueString: str) -> Optional[NumberList]:
@@ -96,25 +201,12 @@ def parseNumberList(valueString: str) -> Optional[NumberList]:
         returns None
     """
 
-    if fullmatch("\s*"
-                 "{((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?[i|j])"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?j)([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?k)))?)?"
-                 "\s*\,\s*)*"
-                 "((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?[i|j])"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?j)([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?k)))?)?)?}"
-                 "\s*", valueString) is not None:
-        strValue = valueString.strip(" \t\n\r")
-        nums = split("\s*\,\s*", strValue[1: len(strValue) - 1])
+    if _NUMBER_LIST_PATTERN.fullmatch(valueString) is not None:
         listOfNums = []
 
-        for numStr in nums:
-            for func in [parseInt, parseFloat, parseComplex, parseQuaternion]:
-                result = func(numStr)
-
-                if result is not None:
-                    listOfNums.append(result)
+        for match in _ELEMENT_PATTERN.finditer(valueString):
+            if not __appendElement(listOfNums, match):
+                return None
 
         return NumberList(listOfNums)
     else:
@@ -131,17 +223,17 @@ def parseVector(valueString: str) -> Optional[Vector]:
     :return: The Vector value represented by the given string.
         If the string does not represent a valid Vector, returns
         None
+    :raises ValueError: Raised if the string matches the Vector
+        grammar but its last element is followed by a comma
     """
 
-    if fullmatch("\s*<((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?\s*\,\s*)*((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?)?>\s*", valueString) is not None:
-        strValue = valueString.strip(" \t\n\r")
-        nums = split("\s*\,\s*", strValue[1 : len(strValue) - 1])
-        listOfNums = []
-
-        for numStr in nums:
-            listOfNums.append(float(numStr.replace(" ", "")))
+    if _VECTOR_PATTERN.fullmatch(valueString) is not None:
+        # The grammar allows a comma before the closing bracket, but
+        # a Vector cannot have an empty last element
+        if valueString.rstrip(" \t\n\r")[:-1].rstrip(" \t\n\r").endswith(","):
+            raise ValueError("A Vector cannot end with a comma: " + valueString.strip(" \t\n\r"))
 
-        return Vector(listOfNums)
+        return Vector([float(numStr) for numStr in _REAL_PATTERN.findall(valueString)])
     else:
         return None
 
@@ -150,7 +242,8 @@ def parseMatrix(valueString: str) -> Optional[Matrix]:
     """
     Checks if the given string represents a valid Matrix.
     If it does, returns the Matrix value that it corresponds
-    to. Otherwise, returns None
+    to. Otherwise, returns None. A comma after the last row
+    is ignored, so [[1, 2], [3, 4],] is a 2x2 Matrix
 
     :param valueString: The string to be parsed to a Matrix
     :return: The Matrix value represented by the given string.
@@ -158,39 +251,30 @@ def parseMatrix(valueString: str) -> Optional[Matrix]:
         None
     """
 
-    if fullmatch("\s*(\["
-                 "(\["
-                 "((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?[i|j])"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?j)([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?k)))?)?"
-                 "\s*\,\s*)*"
-                 "((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?[i|j])"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?j)([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?k)))?)?)?"
-                 "\]\s*\,\s*)*"
-                 "(\["
-                 "((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?[i|j])"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?j)([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?k)))?)?"
-                 "\s*\,\s*)*"
-                 "((\-?\d+(\.\d+)?)(e[\+|\-]?\d+)?"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?[i|j])"
-                 "([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?j)([\+|\-]((\d+(\.\d+)?)(e[\+|\-]?\d+)?k)))?)?)?"
-                 "\])?\])\s*", valueString) is not None:
-        rows = list(filter(lambda string: string != "", split("\[\[|\]\]|\]\s*\,\s*\[", valueString.strip(" \t\n\r"))))
+    if _MATRIX_PATTERN.fullmatch(valueString) is not None:
+        # A matrix without any rows is written as [], which is
+        # read as a single row with no elements
+        if "[[" not in valueString:
+            return Matrix([[]])
+
         table = []
+        newRow = []
+        rowIsEmpty = True
 
-        for row in rows:
-            newRow = []
-            listOfNums = split("\s*\,\s*", row)
+        for match in _MATRIX_TOKEN_PATTERN.finditer(valueString):
+            if match.group("separator") is not None:
+                if not rowIsEmpty:
+                    table.append(newRow)
 
-            for numStr in listOfNums:
-                for func in [parseInt, parseFloat, parseComplex, parseQuaternion]:
-                    value = func(numStr)
+                newRow = []
+                rowIsEmpty = True
+            else:
+                if not __appendElement(newRow, match):
+                    return None
 
-                    if value is not None:
-                        newRow.append(value)
+                rowIsEmpty = False
 
+        if not rowIsEmpty:
             table.append(newRow)
 
         return Matrix(table)
@@ -210,21 +294,50 @@ def parseBool(valueString: str) -> Optional[bool]:
         valid Bool, returns None
     """
 
-    if fullmatch("\s*[t|T][r|R][u|U][e|E]\s*", valueString) is not None:
+    if _TRUE_PATTERN.fullmatch(valueString) is not None:
         return True
-    elif fullmatch("\s*[f|F][a|A][l|L][s|S][e|E]\s*", valueString) is not None:
+    elif _FALSE_PATTERN.fullmatch(valueString) is not None:
         return False
     else:
         return None
 
 
+def __parseScalar(valueString: str) -> Union[int, float, complex, Quaternion, None]:
+    """
+    Parses an int, float, Complex number or Quaternion with
+    a single match against the combined scalar pattern
+
+    :param valueString: The string to be parsed
+    :return: The scalar represented by the given string, or
+        None if it does not represent a scalar
+    """
+
+    match = _SCALAR_PATTERN.fullmatch(valueString)
+
+    if match is None:
+        return None
+
+    kind = match.lastgroup
+
+    if kind == "int":
+        return int(valueString.strip(" \t\n\r"))
+    elif kind == "float":
+        return float(valueString.strip(" \t\n\r"))
+    elif kind == "complex":
+        return __toComplex(valueString)
+    else:
+        return __toQuaternion(valueString)
+
+
 def parseVariableValue(valueString: str) -> Union[MathEntity, int, float, bool, None]:
     """
     Checks if the given string represents a valid
     mathematical entity. If it does, returns the
     given mathematical entity with the given value
     represented by the string. If it does not, returns
-    None
+    None. The kind of value is decided by the first
+    character that is not whitespace, so only one
+    parser is run
 
     :param valueString: The string to be parsed into
         a mathematical entity
@@ -232,10 +345,253 @@ def parseVariableValue(valueString: str) -> Union[MathEntity, int, float, bool,
         by the given string
     """
 
-    for func in [parseInt, parseFloat, parseComplex, parseQuaternion, parseNumberList, parseVector, parseMatrix, parseBool]:
-        value = func(valueString)
+    stripped = valueString.lstrip()
+
+    if len(stripped) == 0:
+        return None
+
+    first = stripped[0]
+
+    if first == "{":
+        return parseNumberList(valueString)
+    elif first == "<":
+        return parseVector(valueString)
+    elif first == "[":
+        return parseMatrix(valueString)
+    elif first in "tTfF|":
+        return parseBool(valueString)
+    elif first in "(-" or first.isdecimal():
+        return __parseScalar(valueString)
+    else:
+        return None
+
+
+def __streamChunks(source: Union[TextIO, Iterable[str]]) -> Iterator[str]:
+    """
+    Returns the chunks of text in the given source
+
+    :param source: A text file object, which is read
+        STREAM_CHUNK_SIZE characters at a time, or an iterable
+        of strings
+    :return: An iterator over the chunks of text in the source
+    """
+
+    if hasattr(source, "read"):
+        chunk = source.read(STREAM_CHUNK_SIZE)
+
+        while len(chunk) > 0:
+            yield chunk
+            chunk = source.read(STREAM_CHUNK_SIZE)
+    else:
+        yield from source
+
+
+def __streamTokens(source: Union[TextIO, Iterable[str]]) -> Iterator[Tuple[int, Match]]:
+    """
+    Splits the text of the given source into tokens. Each chunk
+    is only tokenized up to its last structural symbol, and the
+    rest is carried over to the next chunk, so that elements that
+    are split across chunks are read whole. Only that remainder is
+    kept in memory between chunks
+
+    :param source: A text file object or an iterable of strings
+    :return: An iterator over pairs of the offset of the chunk
+        that a token was found in and the match of the token
+    """
+
+    offset = 0
+    remainder = ""
+
+    for chunk in __streamChunks(source):
+        text = remainder + chunk
+        end = max(text.rfind(symbol) for symbol in _STREAM_SYMBOLS) + 1
+
+        for match in _STREAM_TOKEN_PATTERN.finditer(text, 0, end):
+            yield (offset, match)
+
+        offset += end
+        remainder = text[end:]
+
+    for match in _STREAM_TOKEN_PATTERN.finditer(remainder):
+        yield (offset, match)
+
+
+def __streamError(kind: str, offset: int, match: Optional[Match]) -> ValueError:
+    """
+    Creates the error raised when streamed text is not a valid
+    literal
+
+    :param kind: The kind of value being parsed
+    :param offset: The offset of the chunk the invalid token was
+        found in
+    :param match: The invalid token, or None if the text ended
+        before the value was closed
+    :return: The error to be raised
+    """
+
+    if match is None:
+        return ValueError("Text ended before the " + kind + " was closed")
+
+    return ValueError("Invalid " + kind + " at position " + str(offset + match.start()) +
+                      ": " + repr(match.group(0)))
+
+
+def iterateMatrixRows(source: Union[TextIO, Iterable[str]]) -> Iterator[List[Union[int, float, complex, Quaternion]]]:
+    """
+    Reads a Matrix literal incrementally from the given source and
+    returns its rows as each of them is completed. Only the current
+    row and a small part of the text are held in memory. Rows are
+    read exactly as parseMatrix reads them, except that whitespace
+    is also allowed next to brackets. A Matrix written as [] is read
+    as a single row with no elements
+
+    :param source: A text file object, which is read
+        STREAM_CHUNK_SIZE characters at a time, or an iterable of
+        strings that together form the Matrix literal
+    :return: An iterator over the rows of the Matrix
+    :raises ValueError: Raised when the text is found not to be a
+        valid Matrix. Rows before the invalid text have already
+        been returned at that point
+    """
+
+    state = _START
+    row = []
+
+    for (offset, match) in __streamTokens(source):
+        kind = match.lastgroup
+
+        if kind == "space":
+            continue
+        elif kind == "element":
+            if state != _IN_ROW and state != _AFTER_COMMA:
+                raise __streamError("Matrix", offset, match)
+
+            if not __appendElement(row, match):
+                raise __streamError("Matrix", offset, match)
+
+            state = _AFTER_ELEMENT
+        elif kind == "symbol":
+            symbol = match.group(0)
+
+            if symbol == "[":
+                if state == _START:
+                    state = _OPENED
+                elif state == _OPENED or state == _AFTER_ROW_COMMA:
+                    row = []
+                    state = _IN_ROW
+                else:
+                    raise __streamError("Matrix", offset, match)
+            elif symbol == "]":
+                if state == _OPENED:
+                    yield []
+                    state = _FINISHED
+                elif state == _IN_ROW:
+                    # Rows without any elements are skipped, as in parseMatrix
+                    state = _AFTER_ROW
+                elif state == _AFTER_ELEMENT or state == _AFTER_COMMA:
+                    yield row
+                    row = []
+                    state = _AFTER_ROW
+                elif state == _AFTER_ROW or state == _AFTER_ROW_COMMA:
+                    state = _FINISHED
+                else:
+                    raise __streamError("Matrix", offset, match)
+            elif symbol == ",":
+                if state == _AFTER_ELEMENT:
+                    state = _AFTER_COMMA
+                elif state == _AFTER_ROW:
+                    state = _AFTER_ROW_COMMA
+                else:
+                    raise __streamError("Matrix", offset, match)
+            else:
+                raise __streamError("Matrix", offset, match)
+        else:
+            raise __streamError("Matrix", offset, match)
+
+    if state != _FINISHED:
+        raise __streamError("Matrix", 0, None)
+
+
+def parseMatrixStream(source: Union[TextIO, Iterable[str]]) -> Matrix:
+    """
+    Reads a Matrix literal incrementally from the given source,
+    placing each row into the table of the Matrix as soon as it
+    is completed. Unlike parseMatrix, the whole literal never
+    has to be held in memory as a string, so very large files
+    can be read in memory proportional to the Matrix itself.
+    The result is the same as that of parseMatrix
+
+    :param source: A text file object, which is read
+        STREAM_CHUNK_SIZE characters at a time, or an iterable of
+        strings that together form the Matrix literal
+    :return: The Matrix represented by the text of the source
+    :raises ValueError: Raised if the text is not a valid Matrix.
+        Since the text is read incrementally, it cannot be
+        checked before the Matrix is built, so None is not
+        returned as it is by parseMatrix
+    """
+
+    table = []
+    rowLength = 0
+    columnLength = 0
+
+    for row in iterateMatrixRows(source):
+        if rowLength == 0:
+            columnLength = len(row)
+
+        table.extend(row)
+        rowLength += 1
+
+    return Matrix.createMatrixFrom1DList(table, rowLength, columnLength)
+
+
+def parseNumberListStream(source: Union[TextIO, Iterable[str]]) -> NumberList:
+    """
+    Reads a number list literal incrementally from the given
+    source. Unlike parseNumberList, the whole literal never has
+    to be held in memory as a string. The result is the same as
+    that of parseNumberList
+
+    :param source: A text file object, which is read
+        STREAM_CHUNK_SIZE characters at a time, or an iterable of
+        strings that together form the number list literal
+    :return: The number list represented by the text of the
+        source
+    :raises ValueError: Raised if the text is not a valid list of
+        numbers
+    """
+
+    state = _START
+    listOfNums = []
+
+    for (offset, match) in __streamTokens(source):
+        kind = match.lastgroup
+
+        if kind == "space":
+            continue
+        elif kind == "element":
+            if state != _OPENED and state != _AFTER_COMMA:
+                raise __streamError("NumberList", offset, match)
+
+            if not __appendElement(listOfNums, match):
+                raise __streamError("NumberList", offset, match)
+
+            state = _AFTER_ELEMENT
+        elif kind == "symbol":
+            symbol = match.group(0)
+
+            if symbol == "{" and state == _START:
+                state = _OPENED
+            elif symbol == "}" and (state == _OPENED or state == _AFTER_ELEMENT or state == _AFTER_COMMA):
+                state = _FINISHED
+            elif symbol == "," and state == _AFTER_ELEMENT:
+                state = _AFTER_COMMA
+            else:
+                raise __streamError("NumberList", offset, match)
+        else:
+            raise __streamError("NumberList", offset, match)
 
-        if value is not None:
-            return value
+    if state != _FINISHED:
+        raise __streamError("NumberList", 0, None)
 
-    return None
+    return NumberList(listOfNums)
@@ -1,13 +1,25 @@
 from __future__ import annotations
-from typing import Union, List, Iterator, NoReturn
+from typing import Union, List, Iterator, NoReturn, Optional, Callable
 from calc.MathEntity import MathEntity
-from math import sqrt, acos
+from math import sqrt, acos, hypot, dist, isfinite
 from copy import copy
+from array import array
+from numbers import Real
+from operator import add, sub, mul, truediv
+import numpy
+
+
+VECTORIZE_THRESHOLD = 64
 
 
 class Vector(MathEntity):
     """
-    Instances of this class represent mathematical vectors
+    Instances of this class represent mathematical vectors.
+    Vectors of floats are stored in a compact array('d'),
+    whose buffer numpy reads without copying for the
+    reductions over large vectors, and vectors of ints are
+    stored in an array('q') when they fit in 64 bits.
+    Vectors mixing ints and floats are stored in a list
     """
 
     def __init__(self, point: List[Union[int, float]]):
@@ -18,7 +30,132 @@ class Vector(MathEntity):
             vector's position in space
         """
 
-        self.__point = point
+        self.__point = Vector.__storageFor(point)
+
+    @staticmethod
+    def __storageFor(point: List[Union[int, float]]) -> Union[array, List[Union[int, float]]]:
+        """
+        Chooses the most compact storage that can hold the
+        given components without changing their values
+
+        :param point: The components of a vector
+        :return: An array('q') if every component is an int
+            that fits in 64 bits, an array('d') if every
+            component is a float, and a copy of the given list
+            otherwise. Mixed ints and floats are kept in a list,
+            so that the ints are not turned into floats
+        """
+
+        if all(isinstance(value, float) for value in point):
+            return array("d", point)
+
+        if all(type(value) is int and -2 ** 63 <= value < 2 ** 63 for value in point):
+            return array("q", point)
+
+        return list(point)
+
+    @staticmethod
+    def __fromStorage(point: Union[array, List[Union[int, float]]]) -> Vector:
+        """
+        Creates a vector that uses the given storage directly
+
+        :param point: The storage of the new vector
+        :return: A vector backed by the given storage
+        """
+
+        vector = Vector([])
+        vector.__point = point
+
+        return vector
+
+    def __floatView(self) -> Optional[numpy.ndarray]:
+        """
+        Returns a numpy view of this vector's components if
+        they are stored as floats and there are enough of
+        them for vectorized operations to pay off
+
+        :return: A numpy view of this vector's components,
+            or None
+        """
+
+        point = self.__point
+
+        if type(point) is array and point.typecode == "d" and len(point) >= VECTORIZE_THRESHOLD:
+            return numpy.frombuffer(point, dtype=numpy.float64)
+
+        return None
+
+    def __writeComponents(self, point: List[Union[int, float]]) -> NoReturn:
+        """
+        Stores the given components in this vector's current
+        array, which is only replaced if it cannot hold them
+
+        :param point: The new components of this vector, as
+            many as it already has
+        :return: None
+        """
+
+        storage = self.__point
+
+        if type(storage) is array:
+            try:
+                storage[:] = array(storage.typecode, point)
+
+                return
+            except (TypeError, OverflowError):
+                pass
+
+        self.__point = Vector.__storageFor(point)
+
+    def __combine(self, vector: Vector, operation: Callable, ufunc: numpy.ufunc) -> NoReturn:
+        """
+        Replaces each component of this vector with the result
+        of the given operation on it and the corresponding
+        component of another vector
+
+        :param vector: A vector of the same dimensions
+        :param operation: The operation applied to each component
+        :param ufunc: The numpy equivalent of the operation
+        :return: None
+        """
+
+        view = self.__floatView()
+        otherView = vector.__floatView()
+
+        if view is not None and otherView is not None:
+            ufunc(view, otherView, out=view)
+        else:
+            self.__writeComponents(list(map(operation, self.__point, vector.__point)))
+
+    def __scale(self, scalar: Union[int, float], operation: Callable, ufunc: numpy.ufunc) -> NoReturn:
+        """
+        Replaces each component of this vector with the result
+        of the given operation on it and a scalar
+
+        :param scalar: A real number
+        :param operation: The operation applied to each component
+        :param ufunc: The numpy equivalent of the operation
+        :return: None
+        """
+
+        view = self.__floatView()
+
+        # numpy divides by zero without raising ZeroDivisionError
+        if view is not None and scalar != 0:
+            ufunc(view, float(scalar), out=view)
+        else:
+            self.__writeComponents([operation(value, scalar) for value in self.__point])
+
+    def __isReal(self) -> bool:
+        """
+        Checks if this vector's components are stored in
+        an array, which means that they are all real
+
+        :return: True if this vector is backed by an array,
+            False otherwise
+        """
+
+        return type(self.__point) is array
 
     def __len__(self) -> int:
         """
@@ -68,7 +205,20 @@ class Vector(MathEntity):
         :return: None
         """
 
-        self.__point[index] = value
+        point = self.__point
+
+        # Fall back to a list if the new value is not of the type
+        # the array holds, so that no component changes type
+        if type(point) is array:
+            if point.typecode == "d":
+                isSameType = isinstance(value, float)
+            else:
+                isSameType = type(value) is int and -2 ** 63 <= value < 2 ** 63
+
+            if not isSameType:
+                self.__point = point = point.tolist()
+
+        point[index] = value
 
     def dot(self, vector: Vector) -> Union[int, float]:
         """
@@ -85,12 +235,13 @@ class Vector(MathEntity):
         if not self.equalDimensions(vector):
             raise ArithmeticError("Vectors must be of equal dimensions")
 
-        dotProduct = 0
+        leftView = self.__floatView()
+        rightView = vector.__floatView()
 
-        for (leftValue, rightValue) in zip(self, vector):
-            dotProduct += leftValue * rightValue
+        if leftView is not None and rightView is not None:
+            return float(numpy.dot(leftView, rightView))
 
-        return dotProduct
+        return sum(map(mul, self.__point, vector.__point))
 
     def cross(self, vector: Vector) -> Vector:
         """
@@ -119,6 +270,13 @@ class Vector(MathEntity):
         :return: The magnitude of this vector
         """
 
+        view = self.__floatView()
+
+        if view is not None:
+            return sqrt(float(numpy.dot(view, view)))
+        elif self.__isReal():
+            return hypot(*self.__point)
+
         mag = 0.0
 
         for value in self:
@@ -135,6 +293,14 @@ class Vector(MathEntity):
         :return: The normalized value of this vector
         """
 
+        view = self.__floatView()
+
+        if view is not None:
+            mag = sqrt(float(numpy.dot(view, view)))
+
+            if mag != 0:
+                return Vector.__fromStorage(array("d", (view / mag).tobytes()))
+
         return self / self.magnitude
 
     def angleBetween(self, vector: Vector) -> float:
@@ -149,7 +315,64 @@ class Vector(MathEntity):
             vectors do not have te same dimensions
         """
 
-        return acos(self.dot(vector) / (self.magnitude * vector.magnitude))
+        if not self.equalDimensions(vector):
+            raise ArithmeticError("Vectors must be of equal dimensions")
+
+        leftView = self.__floatView()
+        rightView = vector.__floatView()
+
+        # Each vector is divided by its largest component, which does
+        # not change the angle but keeps the products from overflowing
+        # or underflowing
+        if leftView is not None and rightView is not None:
+            leftView = Vector.__scaleDown(leftView, float(numpy.abs(leftView).max()))
+            rightView = Vector.__scaleDown(rightView, float(numpy.abs(rightView).max()))
+            dotProduct = float(numpy.dot(leftView, rightView))
+            leftSquare = float(numpy.dot(leftView, leftView))
+            rightSquare = float(numpy.dot(rightView, rightView))
+        else:
+            dotProduct = 0
+            leftSquare = 0
+            rightSquare = 0
+            leftPoint = Vector.__scaleDown(self.__point, max((abs(value) for value in self.__point), default=0))
+            rightPoint = Vector.__scaleDown(vector.__point, max((abs(value) for value in vector.__point), default=0))
+
+            for (leftValue, rightValue) in zip(leftPoint, rightPoint):
+                dotProduct += leftValue * rightValue
+                leftSquare += leftValue * leftValue
+                rightSquare += rightValue * rightValue
+
+        cosine = dotProduct / (sqrt(leftSquare) * sqrt(rightSquare))
+
+        # Rounding can leave the cosine just outside [-1, 1]. A NaN
+        # is passed through, as it was before
+        if cosine > 1.0:
+            cosine = 1.0
+        elif cosine < -1.0:
+            cosine = -1.0
+
+        return acos(cosine)
+
+    @staticmethod
+    def __scaleDown(values: Union[array, List[Union[int, float]], numpy.ndarray],
+                    scale: Union[int, float]) -> Union[array, List[Union[int, float]], numpy.ndarray]:
+        """
+        Divides the given components by the given scale, unless it
+        is zero or not finite, in which case they are returned as
+        they are
+
+        :param values: The components of a vector
+        :param scale: The largest magnitude of the components
+        :return: The scaled components
+        """
+
+        if scale == 0 or not isfinite(scale):
+            return values
+
+        if isinstance(values, numpy.ndarray):
+            return values / scale
+
+        return [value / scale for value in values]
 
     def distanceFrom(self, vector: Vector) -> float:
         """
@@ -166,6 +389,16 @@ class Vector(MathEntity):
         if not self.equalDimensions(vector):
             raise ArithmeticError("Vectors must be of equal dimensions")
 
+        leftView = self.__floatView()
+        rightView = vector.__floatView()
+
+        if leftView is not None and rightView is not None:
+            difference = leftView - rightView
+
+            return sqrt(float(numpy.dot(difference, difference)))
+        elif self.__isReal() and vector.__isReal():
+            return dist(self.__point, vector.__point)
+
         distance = 0.0
 
         for (leftValue, rightValue) in zip(self, vector):
@@ -183,6 +416,9 @@ class Vector(MathEntity):
             as this vector
         """
 
+        if self.__isReal():
+            return self.__point.tolist()
+
         return copy(self.__point)
 
     def __contains__(self, searchValue: Union[int, float]) -> bool:
@@ -208,14 +444,99 @@ class Vector(MathEntity):
 
         return iter(self.__point)
 
+    def __iadd__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Adds another vector of the same dimensions to this vector
+        in place. Other entities are added as by the addition
+        operator
+
+        :param mathEntity: The entity being added to this vector
+        :return: This vector, or the sum if it could not be
+            computed in place
+        :raises ArithmeticError: Raised if the given vector does
+            not have the same dimensions as this vector
+        """
+
+        if isinstance(mathEntity, Vector):
+            if not self.equalDimensions(mathEntity):
+                raise ArithmeticError("Vectors must be of equal dimensions to be added together")
+
+            self.__combine(mathEntity, add, numpy.add)
+
+            return self
+
+        return self + mathEntity
+
+    def __isub__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Subtracts another vector of the same dimensions from this
+        vector in place. Other entities are subtracted as by the
+        subtraction operator
+
+        :param mathEntity: The entity being subtracted from this
+            vector
+        :return: This vector, or the difference if it could not
+            be computed in place
+        :raises ArithmeticError: Raised if the given vector does
+            not have the same dimensions as this vector
+        """
+
+        if isinstance(mathEntity, Vector):
+            if not self.equalDimensions(mathEntity):
+                raise ArithmeticError("Vectors must be of equal dimensions to be subtracted from each other")
+
+            self.__combine(mathEntity, sub, numpy.subtract)
+
+            return self
+
+        return self - mathEntity
+
+    def __imul__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Multiplies every component of this vector by a real number
+        in place. Other entities are multiplied as by the
+        multiplication operator
+
+        :param mathEntity: The entity this vector is multiplied by
+        :return: This vector, or the product if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, Real):
+            self.__scale(mathEntity, mul, numpy.multiply)
+
+            return self
+
+        return self * mathEntity
+
+    def __itruediv__(self, mathEntity: Union[MathEntity, int, float, complex]) -> Union[MathEntity, float]:
+        """
+        Divides every component of this vector by a real number in
+        place. Other entities are divided by as by the division
+        operator
+
+        :param mathEntity: The entity this vector is divided by
+        :return: This vector, or the quotient if it could not be
+            computed in place
+        """
+
+        if isinstance(mathEntity, Real):
+            self.__scale(mathEntity, truediv, numpy.true_divide)
+
+            return self
+
+        return self / mathEntity
+
     def __copy__(self) -> Vector:
         """
-        Creates a shallow copy of this vector
+        Creates a shallow copy of this vector. The storage of the
+        components is copied, so that changing either vector in
+        place does not change the other
 
         :return: A shallow copy of this vector
         """
 
-        return Vector(self.__point)
+        return Vector.__fromStorage(copy(self.__point))
 
     def __deepcopy__(self, memodict: dict={}) -> Vector:
         """
@@ -225,7 +546,7 @@ class Vector(MathEntity):
         :return: A deep copy of this vector
         """
 
-        return Vector(copy(self.__point))
+        return Vector.__fromStorage(copy(self.__point))
 
     def __hash__(self) -> int:
         """
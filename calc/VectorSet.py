@@ -0,0 +1,267 @@
+from __future__ import annotations
+from typing import Union, List, Iterator
+import numpy
+from calc.Vector import Vector
+from calc.Matrix import Matrix
+
+
+class VectorSet:
+    """
+    Instances of this class represent a collection of real vectors
+    that all have the same dimensions. The vectors are stored as the
+    rows of a single contiguous float64 array so that distances and
+    similarities between whole collections can be computed without
+    looping over pairs of vectors in Python
+    """
+
+    def __init__(self, vectors: List[Vector]):
+        """
+        Constructs a set of vectors from the given vectors
+
+        :param vectors: The vectors to be contained in this set
+        :raises ArithmeticError: Raised if the given vectors do not
+            all have the same dimensions
+        """
+
+        dimensions = len(vectors[0]) if len(vectors) > 0 else 0
+
+        for vector in vectors:
+            if len(vector) != dimensions:
+                raise ArithmeticError("Vectors must be of equal dimensions")
+
+        self.__block = numpy.array([vector.toList() for vector in vectors], dtype=numpy.float64).reshape(len(vectors), dimensions)
+
+    @staticmethod
+    def createVectorSetFromArray(array: numpy.ndarray) -> VectorSet:
+        """
+        Creates a set of vectors whose components are the
+        rows of the given 2D array. The array is used directly,
+        without being copied, if it is already a C-contiguous
+        float64 array
+
+        :param array: A 2D array with one vector per row
+        :return: A set of the vectors in the given array
+        :raises ValueError: Raised if the given array is not
+            two-dimensional
+        """
+
+        if array.ndim != 2:
+            raise ValueError("Only 2D arrays can be converted to VectorSets")
+
+        vectorSet = VectorSet([])
+        vectorSet.__block = numpy.ascontiguousarray(array, dtype=numpy.float64)
+
+        return vectorSet
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in this set
+
+        :return: The number of vectors in this set
+        """
+
+        return self.__block.shape[0]
+
+    @property
+    def dimensions(self) -> int:
+        """
+        Returns the dimensions shared by every vector
+        in this set
+
+        :return: The dimensions of the vectors in this
+            set
+        """
+
+        return self.__block.shape[1]
+
+    def __getitem__(self, index: int) -> Vector:
+        """
+        Returns the vector at the given index
+
+        :param index: The index of the vector to be
+            returned
+        :return: The vector at the given index
+        """
+
+        return Vector(self.__block[index].tolist())
+
+    def __iter__(self) -> Iterator[Vector]:
+        """
+        Returns an iterator over the vectors in this set
+
+        :return: An iterator over the vectors in this set
+        """
+
+        for row in self.__block.tolist():
+            yield Vector(row)
+
+    def toArray(self) -> numpy.ndarray:
+        """
+        Returns the 2D array that backs this set, with one
+        vector per row
+
+        :return: The array that backs this set
+        """
+
+        return self.__block
+
+    def __otherBlock(self, vectors: Union[VectorSet, Vector, None]) -> numpy.ndarray:
+        """
+        Returns the array of the vectors that this set is being
+        compared against
+
+        :param vectors: Another set of vectors, a single vector,
+            or None to compare this set against itself
+        :return: A 2D array with one vector per row
+        :raises ArithmeticError: Raised if the given vectors do
+            not have the same dimensions as this set
+        """
+
+        if vectors is None:
+            return self.__block
+        elif isinstance(vectors, Vector):
+            block = numpy.array([vectors.toList()], dtype=numpy.float64)
+        else:
+            block = vectors.__block
+
+        if block.shape[1] != self.dimensions:
+            raise ArithmeticError("Vectors must be of equal dimensions")
+
+        return block
+
+    def __distancesTo(self, block: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes the distance from every vector in this set
+        to every row of the given array
+
+        :param block: A 2D array with one vector per row
+        :return: A 2D array whose element at (i, j) is the
+            distance between vector i of this set and row j
+            of the given array
+        """
+
+        distances = numpy.empty((len(self), block.shape[0]))
+
+        # Subtract one row at a time rather than broadcasting to an
+        # N x M x d array, which keeps the memory used linear
+        for (index, row) in enumerate(self.__block):
+            difference = block - row
+            distances[index] = numpy.sqrt(numpy.einsum("ij,ij->i", difference, difference))
+
+        return distances
+
+    def pairwiseDistances(self, vectors: Union[VectorSet, Vector, None]=None) -> Matrix:
+        """
+        Computes the distance between every vector in this set
+        and every given vector. Each distance agrees with
+        Vector.distanceFrom to within rounding
+
+        :param vectors: Another set of vectors, a single vector,
+            or None to compare this set against itself
+        :return: A matrix whose element at (i, j) is the distance
+            between vector i of this set and given vector j
+        :raises ArithmeticError: Raised if the given vectors do
+            not have the same dimensions as this set
+        """
+
+        return Matrix.createMatrixFromArray(self.__distancesTo(self.__otherBlock(vectors)))
+
+    def cosineSimilarities(self, vectors: Union[VectorSet, Vector, None]=None) -> Matrix:
+        """
+        Computes the cosine of the angle between every vector in
+        this set and every given vector. Taking the arccosine of
+        an element gives the same angle as Vector.angleBetween to
+        within rounding
+
+        :param vectors: Another set of vectors, a single vector,
+            or None to compare this set against itself
+        :return: A matrix whose element at (i, j) is the cosine
+            similarity of vector i of this set and given vector j
+        :raises ArithmeticError: Raised if the given vectors do
+            not have the same dimensions as this set or if any
+            vector has a magnitude of zero
+        """
+
+        block = self.__otherBlock(vectors)
+        leftNorms = numpy.sqrt(numpy.einsum("ij,ij->i", self.__block, self.__block))
+        rightNorms = numpy.sqrt(numpy.einsum("ij,ij->i", block, block))
+
+        if not (leftNorms.all() and rightNorms.all()):
+            raise ArithmeticError("Vectors with a magnitude of zero have no direction")
+
+        similarities = (self.__block @ block.transpose()) / numpy.outer(leftNorms, rightNorms)
+
+        return Matrix.createMatrixFromArray(numpy.clip(similarities, -1.0, 1.0))
+
+    def nearestNeighbors(self, vectors: Union[VectorSet, Vector], count: int) -> Union[List[int], List[List[int]]]:
+        """
+        Finds the vectors in this set that are closest to each
+        given vector
+
+        :param vectors: A single vector or a set of vectors to
+            find the nearest neighbors of
+        :param count: The number of neighbors to find for each
+            given vector
+        :return: The indices of the nearest vectors in this set,
+            ordered from nearest to farthest. If a set of vectors
+            was given, a list of such indices is returned for each
+            of them
+        :raises ArithmeticError: Raised if the given vectors do
+            not have the same dimensions as this set
+        """
+
+        count = min(count, len(self))
+        distances = self.__distancesTo(self.__otherBlock(vectors)).transpose()
+
+        if count < len(self):
+            candidates = numpy.argpartition(distances, count - 1, axis=1)[:, :count]
+        else:
+            candidates = numpy.tile(numpy.arange(len(self)), (distances.shape[0], 1))
+
+        candidateDistances = numpy.take_along_axis(distances, candidates, axis=1)
+        order = numpy.argsort(candidateDistances, axis=1, kind="stable")
+        neighbors = numpy.take_along_axis(candidates, order, axis=1).tolist()
+
+        if isinstance(vectors, Vector):
+            return neighbors[0]
+
+        return neighbors
+
+    def normalize(self) -> VectorSet:
+        """
+        Returns a set containing the normalized value
+        of every vector in this set
+
+        :return: A set of the normalized vectors
+        :raises ArithmeticError: Raised if any vector has
+            a magnitude of zero
+        """
+
+        norms = numpy.sqrt(numpy.einsum("ij,ij->i", self.__block, self.__block))
+
+        if not norms.all():
+            raise ArithmeticError("Vectors with a magnitude of zero cannot be normalized")
+
+        return VectorSet.createVectorSetFromArray(self.__block / norms[:, numpy.newaxis])
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of this set
+        of vectors
+
+        :return: A string representation of this set
+            of vectors
+        """
+
+        return "{" + ", ".join(str(vector) for vector in self) + "}"
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of this set of vectors
+        for the Python shell
+
+        :return: A string representation of this set of vectors
+            for the Python shell
+        """
+
+        return str(self)
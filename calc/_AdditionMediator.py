@@ -1,11 +1,16 @@
 from typing import Union
-from math import nan
 from itertools import zip_longest
+from operator import add
 from calc.MathEntity import MathEntity
+from calc.Dispatch import addition
+from calc.Expression import lazyHandlers
 from calc.Quaternion import Quaternion
 from calc.NumberList import NumberList
 from calc.Vector import Vector
 from calc.Matrix import Matrix
+from calc.MappedMatrix import MappedMatrix
+from calc.SparseMatrix import SparseMatrix
+from calc.StructuredMatrix import StructuredMatrix
 
 
 def __vectorPlusVector(leftVector: Vector, rightVector: Vector) -> Vector:
@@ -44,6 +49,9 @@ def __matrixPlusMatrix(leftMatrix: Matrix, rightMatrix: Matrix) -> Matrix:
     if not leftMatrix.equalDimensions(rightMatrix):
         raise ArithmeticError("Matrices must be of equal dimensions to be added together")
 
+    if leftMatrix.isArrayBacked and rightMatrix.isArrayBacked:
+        return Matrix.createMatrixFromArray(leftMatrix.toArray() + rightMatrix.toArray())
+
     table = []
 
     for (leftValue, rightValue) in zip(leftMatrix, rightMatrix):
@@ -93,7 +101,19 @@ addDict = {(int, Quaternion): lambda leftInt, rightQuaternion: Quaternion(leftIn
                                                                              for (leftValue, rightValue)
                                                                              in zip_longest(leftList, rightList, fillvalue=0)]),
            (Vector, Vector): __vectorPlusVector,
-           (Matrix, Matrix): __matrixPlusMatrix}
+           (Matrix, Matrix): __matrixPlusMatrix,
+           (MappedMatrix, MappedMatrix): lambda leftMatrix, rightMatrix: leftMatrix.add(rightMatrix),
+           (MappedMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.add(rightMatrix),
+           (Matrix, MappedMatrix): lambda leftMatrix, rightMatrix: rightMatrix.add(leftMatrix),
+           (SparseMatrix, SparseMatrix): lambda leftMatrix, rightMatrix: leftMatrix.add(rightMatrix),
+           (SparseMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.add(rightMatrix),
+           (Matrix, SparseMatrix): lambda leftMatrix, rightMatrix: rightMatrix.add(leftMatrix),
+           (StructuredMatrix, StructuredMatrix): lambda leftMatrix, rightMatrix: leftMatrix.add(rightMatrix),
+           (StructuredMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.add(rightMatrix),
+           (Matrix, StructuredMatrix): lambda leftMatrix, rightMatrix: rightMatrix.add(leftMatrix),
+           **lazyHandlers(add)}
+
+addition.registerAll(addDict)
 
 
 def doAddition(mathEntity1: Union[int, float, MathEntity],
@@ -112,10 +132,4 @@ def doAddition(mathEntity1: Union[int, float, MathEntity],
         is returned
     """
 
-    key = (type(mathEntity1), type(mathEntity2))
-    operation = addDict.get(key)
-
-    if operation is not None:
-        return operation(mathEntity1, mathEntity2)
-    else:
-        return nan
+    return addition(mathEntity1, mathEntity2)
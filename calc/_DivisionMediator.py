@@ -1,7 +1,9 @@
 from typing import Union
-from math import nan
 from itertools import zip_longest
+from operator import truediv
 from calc.MathEntity import MathEntity
+from calc.Dispatch import division
+from calc.Expression import lazyHandlers
 from calc.Quaternion import Quaternion
 from calc.NumberList import NumberList
 from calc.Vector import Vector
@@ -102,6 +104,26 @@ def __quaternionDividedByQuaternion(leftQuaternion: Quaternion, rightQuaternion:
                       imag2OfResult / absoluteValueOfLeft)
 
 
+def __matrixDividedByScalar(leftMatrix: Matrix, rightScalar: Union[int, float, complex, Quaternion]) -> Matrix:
+    """
+    Divides the given matrix by the given scalar value. Scalar values
+    include ints, floats, Complex numbers and Quaternions
+
+    :param leftMatrix: The matrix on the left side of the division
+        sign
+    :param rightScalar: The scalar value on the right side of the
+        division sign
+    :return: The quotient of the given matrix and the given scalar value
+    """
+
+    if leftMatrix.isArrayBacked and type(rightScalar) is not Quaternion:
+        return Matrix.createMatrixFromArray(leftMatrix.toArray() / rightScalar)
+
+    return Matrix.createMatrixFrom1DList([value / rightScalar for value in leftMatrix],
+                                         leftMatrix.rowLength,
+                                         leftMatrix.columnLength)
+
+
 divDict = {(int, Quaternion): __realDividedByQuaternion,
            (int, NumberList): lambda leftInt, rightList: NumberList([leftInt / value for value in rightList]),
            (float, Quaternion): __realDividedByQuaternion,
@@ -127,22 +149,14 @@ divDict = {(int, Quaternion): __realDividedByQuaternion,
                                                                              in zip_longest(leftList, rightList, fillvalue=0)]),
            (Vector, int): lambda leftVector, rightInt: Vector([value / rightInt for value in leftVector]),
            (Vector, float): lambda leftVector, rightFloat: Vector([value / rightFloat for value in leftVector]),
-           (Matrix, int): lambda leftMatrix, rightInt: Matrix.createMatrixFrom1DList([value / rightInt for value in leftMatrix],
-                                                                                     leftMatrix.rowLength,
-                                                                                     leftMatrix.columnLength),
-           (Matrix, float): lambda leftMatrix, rightFloat: Matrix.createMatrixFrom1DList(
-                                                            [value / rightFloat for value in leftMatrix],
-                                                            leftMatrix.rowLength,
-                                                            leftMatrix.columnLength),
-           (Matrix, complex): lambda leftMatrix, rightComplex: Matrix.createMatrixFrom1DList(
-                                                                [value / rightComplex for value in leftMatrix],
-                                                                leftMatrix.rowLength,
-                                                                leftMatrix.columnLength),
-           (Matrix, Quaternion): lambda leftMatrix, rightQuaternion: Matrix.createMatrixFrom1DList(
-                                                                        [value / rightQuaternion for value in leftMatrix],
-                                                                        leftMatrix.rowLength,
-                                                                        leftMatrix.columnLength),
-           (Matrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix * rightMatrix.inverse()}
+           (Matrix, int): __matrixDividedByScalar,
+           (Matrix, float): __matrixDividedByScalar,
+           (Matrix, complex): __matrixDividedByScalar,
+           (Matrix, Quaternion): __matrixDividedByScalar,
+           (Matrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix * rightMatrix.inverse(),
+           **lazyHandlers(truediv)}
+
+division.registerAll(divDict)
 
 
 def doDivision(mathEntity1: Union[int, float, MathEntity],
@@ -160,10 +174,4 @@ def doDivision(mathEntity1: Union[int, float, MathEntity],
         second, nan is returned
     """
 
-    key = (type(mathEntity1), type(mathEntity2))
-    operation = divDict.get(key)
-
-    if operation is not None:
-        return operation(mathEntity1, mathEntity2)
-    else:
-        return nan
\ No newline at end of file
+    return division(mathEntity1, mathEntity2)
@@ -1,9 +1,16 @@
 from typing import Union
+import numpy
+from operator import eq
 from calc.MathEntity import MathEntity
+from calc.Dispatch import equality
+from calc.Expression import lazyHandlers
 from calc.Quaternion import Quaternion
 from calc.NumberList import NumberList
 from calc.Vector import Vector
 from calc.Matrix import Matrix
+from calc.QuaternionArray import QuaternionArray
+from calc.SparseMatrix import SparseMatrix
+from calc.StructuredMatrix import StructuredMatrix
 
 
 def __numberListEqualsNumberList(leftList: NumberList, rightList: NumberList) -> bool:
@@ -64,6 +71,34 @@ def __matrixEqualsMatrix(leftMatrix: Matrix, rightMatrix: Matrix) -> bool:
     :return: True if both matrices are equal, False otherwise
     """
 
+    if not leftMatrix.equalDimensions(rightMatrix):
+        return False
+
+    if leftMatrix.isArrayBacked and rightMatrix.isArrayBacked:
+        return bool(numpy.array_equal(leftMatrix.toArray(), rightMatrix.toArray()))
+
+    for (leftValue, rightValue) in zip(leftMatrix, rightMatrix):
+        if leftValue != rightValue:
+            return False
+
+    return True
+
+
+def __elementsEqual(leftMatrix: Union[Matrix, SparseMatrix, StructuredMatrix],
+                    rightMatrix: Union[Matrix, SparseMatrix, StructuredMatrix]) -> bool:
+    """
+    Checks if two matrices that are stored differently, such as a
+    sparse or structured matrix and a dense one, are mathematically equal. Two
+    matrices are equal if they have the same values in the same
+    positions
+
+    :param leftMatrix: The matrix on the left side of the equality
+        operator
+    :param rightMatrix: The matrix on the right side of the equality
+        operator
+    :return: True if both matrices are equal, False otherwise
+    """
+
     if not leftMatrix.equalDimensions(rightMatrix):
         return False
 
@@ -104,7 +139,23 @@ eqDict = {(int, Quaternion): lambda leftInt, rightQuaternion: leftInt == rightQu
                                                                             leftQuaternion.imag2 == rightQuaternion.imag2,
           (NumberList, NumberList): __numberListEqualsNumberList,
           (Vector, Vector): __vectorEqualsVector,
-          (Matrix, Matrix): __matrixEqualsMatrix}
+          (Matrix, Matrix): __matrixEqualsMatrix,
+          (QuaternionArray, QuaternionArray): lambda leftArray, rightArray: len(leftArray) == len(rightArray) and
+                                                                            bool(numpy.array_equal(leftArray.real, rightArray.real) and
+                                                                                 numpy.array_equal(leftArray.imag0, rightArray.imag0) and
+                                                                                 numpy.array_equal(leftArray.imag1, rightArray.imag1) and
+                                                                                 numpy.array_equal(leftArray.imag2, rightArray.imag2)),
+          (SparseMatrix, SparseMatrix): lambda leftMatrix, rightMatrix: leftMatrix.equalDimensions(rightMatrix) and
+                                                                        list(leftMatrix.items()) == list(rightMatrix.items()),
+          (SparseMatrix, Matrix): __elementsEqual,
+          (Matrix, SparseMatrix): __elementsEqual,
+          (StructuredMatrix, StructuredMatrix): lambda leftMatrix, rightMatrix: leftMatrix.equalDimensions(rightMatrix) and
+                                                                                list(leftMatrix) == list(rightMatrix),
+          (StructuredMatrix, Matrix): __elementsEqual,
+          (Matrix, StructuredMatrix): __elementsEqual,
+          **lazyHandlers(eq)}
+
+equality.registerAll(eqDict)
 
 
 def doEquality(mathEntity1: Union[int, float, MathEntity],
@@ -121,10 +172,4 @@ def doEquality(mathEntity1: Union[int, float, MathEntity],
         False otherwise
     """
 
-    key = (type(mathEntity1), type(mathEntity2))
-    operation = eqDict.get(key)
-
-    if operation is not None:
-        return operation(mathEntity1, mathEntity2)
-    else:
-        return False
+    return equality(mathEntity1, mathEntity2)
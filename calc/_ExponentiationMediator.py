@@ -1,8 +1,10 @@
 from typing import Union
 from math import nan
-from copy import deepcopy
 from itertools import zip_longest
+from operator import pow
 from calc.MathEntity import MathEntity
+from calc.Dispatch import exponentiation
+from calc.Expression import lazyHandlers
 from calc.Quaternion import Quaternion
 from calc.NumberList import NumberList
 from calc.Matrix import Matrix
@@ -18,17 +20,11 @@ def __matrixToPowerOfInt(leftMatrix: Matrix, rightInt: int) -> Matrix:
         exponentiation sign
     :return: The result of taking the given matrix to the
         power of the given integer
+    :raises ArithmeticError: Raised if the given matrix is
+        not square
     """
 
-    if rightInt > 0:
-        newMatrix = deepcopy(leftMatrix)
-
-        for iteration in range(rightInt):
-            newMatrix *= leftMatrix
-
-        return newMatrix
-    else:
-        return __generalExponent(leftMatrix, rightInt)
+    return leftMatrix.power(rightInt)
 
 
 def __matrixToPowerOfMatrix(leftMatrix: Matrix, rightMatrix: Matrix) -> Matrix:
@@ -103,7 +99,10 @@ expDict = {(int, Quaternion): __generalExponent,
            (Matrix, float): __generalExponent,
            (Matrix, complex): __generalExponent,
            (Matrix, Quaternion): __generalExponent,
-           (Matrix, Matrix): __matrixToPowerOfMatrix}
+           (Matrix, Matrix): __matrixToPowerOfMatrix,
+           **lazyHandlers(pow)}
+
+exponentiation.registerAll(expDict)
 
 
 def doExponentiation(mathEntity1: Union[int, float, MathEntity],
@@ -123,10 +122,4 @@ def doExponentiation(mathEntity1: Union[int, float, MathEntity],
         returned
     """
 
-    key = (type(mathEntity1), type(mathEntity2))
-    operation = expDict.get(key)
-
-    if operation is not None:
-        return operation(mathEntity1, mathEntity2)
-    else:
-        return nan
+    return exponentiation(mathEntity1, mathEntity2)
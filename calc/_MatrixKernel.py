@@ -0,0 +1,62 @@
+from typing import Union, List, Sequence
+from operator import mul
+from calc.Quaternion import Quaternion
+
+
+BLOCK_SIZE = 64
+
+
+def multiplyTables(leftTable: Sequence[Union[int, float, complex, Quaternion]],
+                   rightTable: Sequence[Union[int, float, complex, Quaternion]],
+                   rowLength: int, sharedLength: int, columnLength: int,
+                   blockSize: int=BLOCK_SIZE) -> List[Union[int, float, complex, Quaternion]]:
+    """
+    Multiplies two matrices stored as flat row-major tables. The
+    right table is transposed once so that every dot product reads
+    two contiguous lists, and operands larger than the block size
+    are processed in square tiles so that the slices being combined
+    stay small. The order of each product is preserved, so tables
+    containing quaternions are multiplied correctly. Each sum starts
+    from 0.0, as it always has, so the product of int tables is a
+    table of floats
+
+    :param leftTable: The row-major table of the left matrix, which
+        has rowLength rows and sharedLength columns
+    :param rightTable: The row-major table of the right matrix, which
+        has sharedLength rows and columnLength columns
+    :param rowLength: The number of rows of the left matrix
+    :param sharedLength: The number of columns of the left matrix and
+        rows of the right matrix
+    :param columnLength: The number of columns of the right matrix
+    :param blockSize: The number of rows, columns and shared indices
+        processed per tile
+    :return: The row-major table of the product, which has rowLength
+        rows and columnLength columns
+    """
+
+    leftRows = [leftTable[rowIndex * sharedLength: (rowIndex + 1) * sharedLength] for rowIndex in range(rowLength)]
+    rightColumns = [rightTable[columnIndex::columnLength] for columnIndex in range(columnLength)]
+
+    if sharedLength <= blockSize:
+        return [sum(map(mul, row, column), 0.0) for row in leftRows for column in rightColumns]
+
+    table = [0.0] * (rowLength * columnLength)
+
+    for sharedStart in range(0, sharedLength, blockSize):
+        sharedEnd = sharedStart + blockSize
+        leftSlices = [row[sharedStart: sharedEnd] for row in leftRows]
+        rightSlices = [column[sharedStart: sharedEnd] for column in rightColumns]
+
+        for rowStart in range(0, rowLength, blockSize):
+            for columnStart in range(0, columnLength, blockSize):
+                columnBlock = rightSlices[columnStart: columnStart + blockSize]
+
+                for rowIndex in range(rowStart, min(rowStart + blockSize, rowLength)):
+                    leftSlice = leftSlices[rowIndex]
+                    index = rowIndex * columnLength + columnStart
+
+                    for rightSlice in columnBlock:
+                        table[index] += sum(map(mul, leftSlice, rightSlice))
+                        index += 1
+
+    return table
@@ -1,12 +1,20 @@
 from typing import Union
-from math import nan
-from copy import deepcopy
 from itertools import zip_longest
+import numpy
+from operator import mul
 from calc.MathEntity import MathEntity
+from calc.Dispatch import multiplication
+from calc.Expression import lazyHandlers
 from calc.Quaternion import Quaternion
 from calc.NumberList import NumberList
 from calc.Vector import Vector
 from calc.Matrix import Matrix
+from calc.QuaternionArray import QuaternionArray
+from calc.MappedMatrix import MappedMatrix
+from calc.SparseMatrix import SparseMatrix
+from calc.StructuredMatrix import StructuredMatrix
+from calc.ParallelMultiplier import getActiveMultiplier
+from calc._MatrixKernel import multiplyTables
 
 
 def __vectorTimesMatrix(leftVector: Vector, rightMatrix: Matrix) -> Matrix:
@@ -20,24 +28,39 @@ def __vectorTimesMatrix(leftVector: Vector, rightMatrix: Matrix) -> Matrix:
     :return: The product of the given vector and the given
         matrix
     :raises ArithmeticError: Raised on the dimensions of the
-        given vector is not equal to the number of columns the
-        given matrix
+        given vector is not equal to the number of rows the
+        given matrix has
     """
 
-    if len(leftVector) != rightMatrix.columnLength:
-        raise ArithmeticError("Dimensions of the Vector must be the same as the column length of the Matrix")
+    if len(leftVector) != rightMatrix.rowLength:
+        raise ArithmeticError("Dimensions of the Vector must be the same as the row length of the Matrix")
 
-    table = []
+    if rightMatrix.isArrayBacked:
+        return Matrix.createMatrixFromArray(numpy.array([leftVector.toList()]) @ rightMatrix.toArray())
 
-    for colIndex in range(rightMatrix.columnLength):
-        value = 0.0
+    table = multiplyTables(leftVector.toList(), list(rightMatrix), 1, len(leftVector), rightMatrix.columnLength)
 
-        for rowIndex in range(rightMatrix.rowLength):
-            value += rightMatrix[(rowIndex, colIndex)] * leftVector[rowIndex]
+    return Matrix.createMatrixFrom1DList(table, 1, rightMatrix.columnLength)
 
-        table.append(value)
 
-    return Matrix.createMatrixFrom1DList(table, 1, rightMatrix.columnLength)
+def __scalarTimesMatrix(leftScalar: Union[int, float, complex, Quaternion], rightMatrix: Matrix) -> Matrix:
+    """
+    Multiplies the given scalar value by the given matrix. Scalar values
+    include ints, floats, Complex numbers and Quaternions
+
+    :param leftScalar: The scalar value on the left side of the
+        multiplication sign
+    :param rightMatrix: The matrix on the right side of the
+        multiplication sign
+    :return: The product of the given scalar value and the given matrix
+    """
+
+    if rightMatrix.isArrayBacked and type(leftScalar) is not Quaternion:
+        return Matrix.createMatrixFromArray(leftScalar * rightMatrix.toArray())
+
+    return Matrix.createMatrixFrom1DList([leftScalar * value for value in rightMatrix],
+                                         rightMatrix.rowLength,
+                                         rightMatrix.columnLength)
 
 
 def __matrixTimesScalar(leftMatrix: Matrix, rightScalar: Union[int, float, complex, Quaternion]) -> Matrix:
@@ -52,13 +75,12 @@ def __matrixTimesScalar(leftMatrix: Matrix, rightScalar: Union[int, float, compl
     :return: The product of the given matrix and the given scalar value
     """
 
-    newMatrix = deepcopy(leftMatrix)
-
-    for rowIndex in range(leftMatrix.rowLength):
-        for columnIndex in range(leftMatrix.columnLength):
-            newMatrix[(rowIndex, columnIndex)] *= rightScalar
+    if leftMatrix.isArrayBacked and type(rightScalar) is not Quaternion:
+        return Matrix.createMatrixFromArray(leftMatrix.toArray() * rightScalar)
 
-    return newMatrix
+    return Matrix.createMatrixFrom1DList([value * rightScalar for value in leftMatrix],
+                                         leftMatrix.rowLength,
+                                         leftMatrix.columnLength)
 
 
 def __matrixTimesVector(leftMatrix: Matrix, rightVector: Vector) -> Matrix:
@@ -73,21 +95,16 @@ def __matrixTimesVector(leftMatrix: Matrix, rightVector: Vector) -> Matrix:
         given vector
     :raises ArithmeticError: Raised if the dimensions
         of the given vector are not equal to the number
-        of rows the given matrix has
+        of columns the given matrix has
     """
 
-    if leftMatrix.rowLength != len(rightVector):
-        raise ArithmeticError("The Matrix must have the same row length as the Vector's dimensions")
-
-    table = []
+    if leftMatrix.columnLength != len(rightVector):
+        raise ArithmeticError("The Matrix must have the same column length as the Vector's dimensions")
 
-    for rowIndex in range(leftMatrix.rowLength):
-        value = 0.0
+    if leftMatrix.isArrayBacked:
+        return Matrix.createMatrixFromArray(leftMatrix.toArray() @ numpy.array([rightVector.toList()]).transpose())
 
-        for colIndex in range(leftMatrix.columnLength):
-            value += leftMatrix[(rowIndex, colIndex)] * rightVector[colIndex]
-
-        table.append(value)
+    table = multiplyTables(list(leftMatrix), rightVector.toList(), leftMatrix.rowLength, len(rightVector), 1)
 
     return Matrix.createMatrixFrom1DList(table, leftMatrix.rowLength, 1)
 
@@ -109,50 +126,61 @@ def __matrixTimesMatrix(leftMatrix: Matrix, rightMatrix: Matrix) -> Matrix:
     if not leftMatrix.multipliable(rightMatrix):
         raise ArithmeticError("Left Matrix must have the same amount of columns and the right Matrix has rows")
 
-    table = []
+    if leftMatrix.isArrayBacked and rightMatrix.isArrayBacked:
+        return Matrix.createMatrixFromArray(leftMatrix.toArray() @ rightMatrix.toArray())
 
-    for rowIndex in range(leftMatrix.rowLength):
-        for colIndex in range(rightMatrix.columnLength):
-            value = 0.0
+    multiplier = getActiveMultiplier()
 
-            for index in range(leftMatrix.rowLength):
-                value += leftMatrix[(rowIndex, index)] * rightMatrix[(index, colIndex)]
+    if multiplier is not None:
+        return multiplier.multiply(leftMatrix, rightMatrix)
 
-            table.append(value)
+    table = multiplyTables(list(leftMatrix), list(rightMatrix),
+                           leftMatrix.rowLength, leftMatrix.columnLength, rightMatrix.columnLength)
 
     return Matrix.createMatrixFrom1DList(table, leftMatrix.rowLength, rightMatrix.columnLength)
 
 
+def __quaternionTimesQuaternion(leftQuaternion: Quaternion, rightQuaternion: Quaternion) -> Quaternion:
+    """
+    Computes the Hamilton product of the two given quaternions
+
+    :param leftQuaternion: The quaternion on the left side of
+        the multiplication sign
+    :param rightQuaternion: The quaternion on the right side of
+        the multiplication sign
+    :return: The product of the two given quaternions
+    """
+
+    (leftReal, leftImag0, leftImag1, leftImag2) = leftQuaternion
+    (rightReal, rightImag0, rightImag1, rightImag2) = rightQuaternion
+
+    return Quaternion(leftReal * rightReal - leftImag0 * rightImag0 - leftImag1 * rightImag1 - leftImag2 * rightImag2,
+                      leftReal * rightImag0 + leftImag0 * rightReal + leftImag1 * rightImag2 - leftImag2 * rightImag1,
+                      leftReal * rightImag1 - leftImag0 * rightImag2 + leftImag1 * rightReal + leftImag2 * rightImag0,
+                      leftReal * rightImag2 + leftImag0 * rightImag1 - leftImag1 * rightImag0 + leftImag2 * rightReal)
+
+
 multDict = {(int, Quaternion): lambda leftInt, rightQuaternion: Quaternion(leftInt * rightQuaternion.real,
                                                                                 leftInt * rightQuaternion.imag0,
                                                                                 leftInt * rightQuaternion.imag1,
                                                                                 leftInt * rightQuaternion.imag2),
             (int, NumberList): lambda leftInt, rightList: NumberList([leftInt * value for value in rightList]),
             (int, Vector): lambda leftInt, rightVector: Vector([leftInt * value for value in rightVector]),
-            (int, Matrix): lambda leftInt, rightMatrix: Matrix.createMatrixFrom1DList(
-                    [leftInt * value for value in rightMatrix],
-                    rightMatrix.rowLength,
-                    rightMatrix.columnLength),
+            (int, Matrix): __scalarTimesMatrix,
             (float, Quaternion): lambda leftFloat, rightQuaternion: Quaternion(leftFloat * rightQuaternion.real,
                                                                                     leftFloat * rightQuaternion.imag0,
                                                                                     leftFloat * rightQuaternion.imag1,
                                                                                     leftFloat * rightQuaternion.imag2),
             (float, NumberList): lambda leftFloat, rightList: NumberList([leftFloat * value for value in rightList]),
             (float, Vector): lambda leftFloat, rightVector: Vector([leftFloat * value for value in rightVector]),
-            (float, Matrix): lambda leftFloat, rightMatrix: Matrix.createMatrixFrom1DList(
-                    [leftFloat * value for value in rightMatrix],
-                    rightMatrix.rowLength,
-                    rightMatrix.columnLength),
+            (float, Matrix): __scalarTimesMatrix,
             (complex, Quaternion): lambda leftComplex, rightQuaternion: Quaternion(
                       leftComplex.real * rightQuaternion.real - leftComplex.imag * rightQuaternion.imag0,
                       leftComplex.real * rightQuaternion.imag0 + rightQuaternion.real * leftComplex.imag,
                       leftComplex.real * rightQuaternion.imag1 - leftComplex.imag * rightQuaternion.imag2,
                       leftComplex.real * rightQuaternion.imag2 + leftComplex.imag * rightQuaternion.imag1),
             (complex, NumberList): lambda leftComplex, rightList: NumberList([leftComplex * value for value in rightList]),
-            (complex, Matrix): lambda leftComplex, rightMatrix: Matrix.createMatrixFrom1DList(
-                    [leftComplex * value for value in rightMatrix],
-                    rightMatrix.rowLength,
-                    rightMatrix.columnLength),
+            (complex, Matrix): __scalarTimesMatrix,
             (Quaternion, int): lambda leftQuaternion, rightInt: Quaternion(leftQuaternion.real * rightInt,
                                                                            leftQuaternion.imag0 * rightInt,
                                                                            leftQuaternion.imag1 * rightInt,
@@ -166,20 +194,9 @@ multDict = {(int, Quaternion): lambda leftInt, rightQuaternion: Quaternion(leftI
                       leftQuaternion.real * rightComplex.imag + leftQuaternion.imag0 * rightComplex.real,
                       leftQuaternion.imag1 * rightComplex.real + leftQuaternion.imag2 * rightComplex.imag,
                       -leftQuaternion.imag1 * rightComplex.imag + leftQuaternion.imag2 * rightComplex.real),
-            (Quaternion, Quaternion): lambda leftQuaternion, rightQuaternion: Quaternion(
-                      leftQuaternion.real * rightQuaternion.real - leftQuaternion.imag0 * rightQuaternion.imag0 -
-                      leftQuaternion.imag1 * rightQuaternion.imag1 - leftQuaternion.imag2 * rightQuaternion.imag2,
-                      leftQuaternion.real * rightQuaternion.imag0 + leftQuaternion.imag0 * rightQuaternion.real -
-                      leftQuaternion.imag1 * rightQuaternion.imag2 + leftQuaternion.imag2 * rightQuaternion.imag1,
-                      leftQuaternion.real * rightQuaternion.imag1 + leftQuaternion.imag0 * rightQuaternion.imag2 +
-                      leftQuaternion.imag1 * rightQuaternion.real - leftQuaternion.imag2 * rightQuaternion.imag0,
-                      leftQuaternion.real * rightQuaternion.imag2 - leftQuaternion.imag0 * rightQuaternion.imag1 +
-                      leftQuaternion.imag1 * rightQuaternion.imag0 + leftQuaternion.imag2 * rightQuaternion.real),
+            (Quaternion, Quaternion): __quaternionTimesQuaternion,
             (Quaternion, NumberList): lambda leftQuaternion, rightList: NumberList([leftQuaternion * value for value in rightList]),
-            (Quaternion, Matrix): lambda leftQuaternion, rightMatrix: Matrix.createMatrixFrom1DList(
-                    [leftQuaternion * value for value in rightMatrix],
-                    rightMatrix.rowLength,
-                    rightMatrix.columnLength),
+            (Quaternion, Matrix): __scalarTimesMatrix,
             (NumberList, int): lambda leftList, rightInt: NumberList([value * rightInt for value in leftList]),
             (NumberList, float): lambda leftList, rightFloat: NumberList([value * rightFloat for value in leftList]),
             (NumberList, complex): lambda leftList, rightComplex: NumberList([value * rightComplex for value in leftList]),
@@ -190,24 +207,59 @@ multDict = {(int, Quaternion): lambda leftInt, rightQuaternion: Quaternion(leftI
             (Vector, int): lambda leftVector, rightInt: Vector([rightInt * value for value in leftVector]),
             (Vector, float): lambda leftVector, rightFloat: Vector([rightFloat * value for value in leftVector]),
             (Vector, Matrix): __vectorTimesMatrix,
-            (Matrix, int): lambda leftMatrix, rightInt: Matrix.createMatrixFrom1DList(
-                    [value * rightInt for value in leftMatrix],
-                    leftMatrix.rowLength,
-                    leftMatrix.columnLength),
-            (Matrix, float): lambda leftMatrix, rightFloat: Matrix.createMatrixFrom1DList(
-                    [value * rightFloat for value in leftMatrix],
-                    leftMatrix.rowLength,
-                    leftMatrix.columnLength),
-            (Matrix, complex): lambda leftMatrix, rightComplex: Matrix.createMatrixFrom1DList(
-                    [value * rightComplex for value in leftMatrix],
-                    leftMatrix.rowLength,
-                    leftMatrix.columnLength),
-            (Matrix, Quaternion): lambda leftMatrix, rightQuaternion: Matrix.createMatrixFrom1DList(
-                    [value * rightQuaternion for value in leftMatrix],
-                    leftMatrix.rowLength,
-                    leftMatrix.columnLength),
+            (Matrix, int): __matrixTimesScalar,
+            (Matrix, float): __matrixTimesScalar,
+            (Matrix, complex): __matrixTimesScalar,
+            (Matrix, Quaternion): __matrixTimesScalar,
             (Matrix, Vector): __matrixTimesVector,
-            (Matrix, Matrix): __matrixTimesMatrix}
+            (Matrix, Matrix): __matrixTimesMatrix,
+            (QuaternionArray, QuaternionArray): lambda leftArray, rightArray: leftArray.multiply(rightArray),
+            (QuaternionArray, Quaternion): lambda leftArray, rightQuaternion: leftArray.multiply(rightQuaternion),
+            (QuaternionArray, int): lambda leftArray, rightInt: leftArray.multiply(rightInt),
+            (QuaternionArray, float): lambda leftArray, rightFloat: leftArray.multiply(rightFloat),
+            (QuaternionArray, complex): lambda leftArray, rightComplex: leftArray.multiply(rightComplex),
+            (Quaternion, QuaternionArray): lambda leftQuaternion, rightArray: rightArray.multiplyOnLeft(leftQuaternion),
+            (int, QuaternionArray): lambda leftInt, rightArray: rightArray.multiplyOnLeft(leftInt),
+            (float, QuaternionArray): lambda leftFloat, rightArray: rightArray.multiplyOnLeft(leftFloat),
+            (complex, QuaternionArray): lambda leftComplex, rightArray: rightArray.multiplyOnLeft(leftComplex),
+            (MappedMatrix, MappedMatrix): lambda leftMatrix, rightMatrix: leftMatrix.multiply(rightMatrix),
+            (MappedMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.multiply(rightMatrix),
+            (Matrix, MappedMatrix): lambda leftMatrix, rightMatrix: rightMatrix.multiplyOnLeft(leftMatrix),
+            (MappedMatrix, int): lambda leftMatrix, rightInt: leftMatrix.multiply(rightInt),
+            (MappedMatrix, float): lambda leftMatrix, rightFloat: leftMatrix.multiply(rightFloat),
+            (MappedMatrix, complex): lambda leftMatrix, rightComplex: leftMatrix.multiply(rightComplex),
+            (int, MappedMatrix): lambda leftInt, rightMatrix: rightMatrix.multiply(leftInt),
+            (float, MappedMatrix): lambda leftFloat, rightMatrix: rightMatrix.multiply(leftFloat),
+            (complex, MappedMatrix): lambda leftComplex, rightMatrix: rightMatrix.multiply(leftComplex),
+            (SparseMatrix, SparseMatrix): lambda leftMatrix, rightMatrix: leftMatrix.multiply(rightMatrix),
+            (SparseMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.multiply(rightMatrix),
+            (SparseMatrix, Vector): lambda leftMatrix, rightVector: leftMatrix.multiply(rightVector),
+            (SparseMatrix, int): lambda leftMatrix, rightInt: leftMatrix.multiply(rightInt),
+            (SparseMatrix, float): lambda leftMatrix, rightFloat: leftMatrix.multiply(rightFloat),
+            (SparseMatrix, complex): lambda leftMatrix, rightComplex: leftMatrix.multiply(rightComplex),
+            (SparseMatrix, Quaternion): lambda leftMatrix, rightQuaternion: leftMatrix.multiply(rightQuaternion),
+            (Matrix, SparseMatrix): lambda leftMatrix, rightMatrix: rightMatrix.multiplyOnLeft(leftMatrix),
+            (Vector, SparseMatrix): lambda leftVector, rightMatrix: rightMatrix.multiplyOnLeft(leftVector),
+            (int, SparseMatrix): lambda leftInt, rightMatrix: rightMatrix.multiplyOnLeft(leftInt),
+            (float, SparseMatrix): lambda leftFloat, rightMatrix: rightMatrix.multiplyOnLeft(leftFloat),
+            (complex, SparseMatrix): lambda leftComplex, rightMatrix: rightMatrix.multiplyOnLeft(leftComplex),
+            (Quaternion, SparseMatrix): lambda leftQuaternion, rightMatrix: rightMatrix.multiplyOnLeft(leftQuaternion),
+            (StructuredMatrix, StructuredMatrix): lambda leftMatrix, rightMatrix: leftMatrix.multiply(rightMatrix),
+            (StructuredMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.multiply(rightMatrix),
+            (StructuredMatrix, Vector): lambda leftMatrix, rightVector: leftMatrix.multiply(rightVector),
+            (StructuredMatrix, int): lambda leftMatrix, rightInt: leftMatrix.multiply(rightInt),
+            (StructuredMatrix, float): lambda leftMatrix, rightFloat: leftMatrix.multiply(rightFloat),
+            (StructuredMatrix, complex): lambda leftMatrix, rightComplex: leftMatrix.multiply(rightComplex),
+            (StructuredMatrix, Quaternion): lambda leftMatrix, rightQuaternion: leftMatrix.multiply(rightQuaternion),
+            (Matrix, StructuredMatrix): lambda leftMatrix, rightMatrix: rightMatrix.multiplyOnLeft(leftMatrix),
+            (Vector, StructuredMatrix): lambda leftVector, rightMatrix: rightMatrix.multiplyOnLeft(leftVector),
+            (int, StructuredMatrix): lambda leftInt, rightMatrix: rightMatrix.multiplyOnLeft(leftInt),
+            (float, StructuredMatrix): lambda leftFloat, rightMatrix: rightMatrix.multiplyOnLeft(leftFloat),
+            (complex, StructuredMatrix): lambda leftComplex, rightMatrix: rightMatrix.multiplyOnLeft(leftComplex),
+            (Quaternion, StructuredMatrix): lambda leftQuaternion, rightMatrix: rightMatrix.multiplyOnLeft(leftQuaternion),
+            **lazyHandlers(mul)}
+
+multiplication.registerAll(multDict)
 
 
 def doMultiplication(mathEntity1: Union[int, float, MathEntity],
@@ -226,10 +278,4 @@ def doMultiplication(mathEntity1: Union[int, float, MathEntity],
         be multiplied together, nan is returned
     """
 
-    key = (type(mathEntity1), type(mathEntity2))
-    operation = multDict.get(key)
-
-    if operation is not None:
-        return operation(mathEntity1, mathEntity2)
-    else:
-        return nan
+    return multiplication(mathEntity1, mathEntity2)
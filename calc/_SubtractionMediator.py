@@ -1,11 +1,15 @@
 from typing import Union
-from math import nan
 from itertools import zip_longest
+from operator import sub
 from calc.MathEntity import MathEntity
+from calc.Dispatch import subtraction
+from calc.Expression import lazyHandlers
 from calc.Quaternion import Quaternion
 from calc.NumberList import NumberList
 from calc.Vector import Vector
 from calc.Matrix import Matrix
+from calc.SparseMatrix import SparseMatrix
+from calc.StructuredMatrix import StructuredMatrix
 
 
 def __vectorMinusVector(leftVector: Vector, rightVector: Vector) -> Vector:
@@ -44,6 +48,9 @@ def __matrixMinusMatrix(leftMatrix: Matrix, rightMatrix: Matrix) -> Matrix:
     if not leftMatrix.equalDimensions(rightMatrix):
         raise ArithmeticError("Matrices must be of equal dimensions to be subtracted from each other")
 
+    if leftMatrix.isArrayBacked and rightMatrix.isArrayBacked:
+        return Matrix.createMatrixFromArray(leftMatrix.toArray() - rightMatrix.toArray())
+
     table = []
 
     for (leftValue, rightValue) in zip(leftMatrix, rightMatrix):
@@ -92,7 +99,16 @@ subtDict = {(int, Quaternion): lambda leftInt, rightQuaternion: Quaternion(leftI
                                                                               for (leftValue, rightValue)
                                                                               in zip_longest(leftList, rightList, fillvalue=0)]),
             (Vector, Vector): __vectorMinusVector,
-            (Matrix, Matrix): __matrixMinusMatrix}
+            (Matrix, Matrix): __matrixMinusMatrix,
+            (SparseMatrix, SparseMatrix): lambda leftMatrix, rightMatrix: leftMatrix.subtract(rightMatrix),
+            (SparseMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.subtract(rightMatrix),
+            (Matrix, SparseMatrix): lambda leftMatrix, rightMatrix: rightMatrix.subtractFrom(leftMatrix),
+            (StructuredMatrix, StructuredMatrix): lambda leftMatrix, rightMatrix: leftMatrix.subtract(rightMatrix),
+            (StructuredMatrix, Matrix): lambda leftMatrix, rightMatrix: leftMatrix.subtract(rightMatrix),
+            (Matrix, StructuredMatrix): lambda leftMatrix, rightMatrix: rightMatrix.subtractFrom(leftMatrix),
+            **lazyHandlers(sub)}
+
+subtraction.registerAll(subtDict)
 
 
 def doSubtraction(mathEntity1: Union[int, float, MathEntity],
@@ -111,10 +127,4 @@ def doSubtraction(mathEntity1: Union[int, float, MathEntity],
         each other, nan is returned
     """
 
-    key = (type(mathEntity1), type(mathEntity2))
-    operation = subtDict.get(key)
-
-    if operation is not None:
-        return operation(mathEntity1, mathEntity2)
-    else:
-        return nan
+    return subtraction(mathEntity1, mathEntity2)
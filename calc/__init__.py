@@ -2,8 +2,24 @@ from calc.MathEntity import MathEntity
 from calc.Quaternion import Quaternion
 from calc.Vector import Vector
 from calc.Matrix import Matrix
+from calc.LUDecomposition import LUDecomposition
+from calc.QRDecomposition import QRDecomposition
+from calc.VectorSet import VectorSet
+from calc.QuaternionArray import QuaternionArray
+from calc.MappedMatrix import MappedMatrix
+from calc.SparseMatrix import SparseMatrix
+from calc.StructuredMatrix import StructuredMatrix
+from calc.DiagonalMatrix import DiagonalMatrix
+from calc.TriangularMatrix import TriangularMatrix
+from calc.BandedMatrix import BandedMatrix
+from calc.ParallelMultiplier import ParallelMultiplier
+from calc.Summary import Summary
+from calc.FrequencyTable import FrequencyTable
 from calc.NumberList import NumberList
 from calc.ProbabilityDistribution import ProbabilityDistribution
+from calc.RunningStatistics import RunningStatistics
+from calc.QuantileSketch import QuantileSketch
+from calc.Expression import LazyExpression
 from calc.QuaternionFunction import sqrtQuaternion, signumQuaternion, logQuaternion, log10Quaternion, \
                                               expQuaternion
 from calc.MatrixFunction import sqrtMatrix, expMatrix, signumMatrix, sinMatrix, cosMatrix, tanMatrix, \
@@ -12,4 +28,12 @@ from calc.MathFunction import expMath, logMath, log10Math, sqrtMath, signumMath,
                                         sinhMath, coshMath, tanhMath, asinMath, acosMath, atanMath, asinhMath, \
                                         acoshMath, atanhMath, chooseMath, chooseRepeatMath, permutationMath
 from calc.ValueParsing import parseInt, parseFloat, parseComplex, parseBool, parseVector, parseQuaternion, \
-                              parseMatrix, parseNumberList, parseVariableValue
+                              parseMatrix, parseNumberList, parseVariableValue, parseMatrixStream, \
+                              parseNumberListStream, iterateMatrixRows
+from calc.Serialization import serialize, deserialize, writeEntity, readEntity
+from calc.Dispatch import DispatchTable
+
+# Each mediator registers the handlers of its operator in the
+# dispatch tables when it is imported
+from calc import _AdditionMediator, _SubtractionMediator, _MultiplicationMediator, _DivisionMediator, \
+                 _ExponentiationMediator, _EqualityMediator